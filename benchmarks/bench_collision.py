@@ -0,0 +1,98 @@
+"""Сравнение pygame.sprite.groupcollide с CollisionWorld (spatial hash).
+
+Сетка замеряется отдельно (brute_force_pairs=0) и в настройке игры (CollisionWorld()),
+где при малом числе пар работает перебор pygame. Вторая таблица - то, что работает в игре
+с VECTOR_PROJECTILES: ProjectileField.collide по всем снарядам и через PointGrid.
+
+Запуск из корня проекта:
+    python -m benchmarks.bench_collision
+"""
+import random
+import time
+import pygame
+import config
+from physics import CollisionWorld
+from sprites import ProjectileField
+
+SIZES = (50, 100, 1000, 10000)
+# (враги, снаряды): обычный бой, плотный бой, предел capacity
+FIELD_SCENES = ((10, 50), (30, 100), (30, 300), (60, 1000), (200, 2000))
+
+class Box(pygame.sprite.Sprite):
+    def __init__(self, w, h, vy):
+        super().__init__()
+        self.rect = pygame.Rect(random.randint(0, config.SCREEN_W - w), random.randint(0, config.SCREEN_H - h), w, h)
+        self.vy = vy
+
+    def update(self):
+        self.rect.y += self.vy
+        if self.rect.top > config.SCREEN_H:
+            self.rect.bottom = 0
+        elif self.rect.bottom < 0:
+            self.rect.top = config.SCREEN_H
+
+def make_scene(total):
+    """Половина сущностей - враги 45x32, половина - пули 6x12"""
+    enemies = pygame.sprite.Group(Box(45, 32, 3) for _ in range(total // 2))
+    bullets = pygame.sprite.Group(Box(6, 12, -config.BULLET_SPEED) for _ in range(total - total // 2))
+    return enemies, bullets
+
+def run(collide, enemies, bullets, frames):
+    start = time.perf_counter()
+    for _ in range(frames):
+        enemies.update()
+        bullets.update()
+        collide(enemies, bullets, False, False)
+    return (time.perf_counter() - start) / frames * 1000
+
+def main():
+    random.seed(1)
+    print(f"{'entities':>9} {'groupcollide ms':>16} {'grid ms':>10} {'speedup':>8} {'game ms':>10} {'speedup':>8}")
+    for total in SIZES:
+        frames = max(3, 20000 // total)
+        enemies, bullets = make_scene(total)
+
+        # Результаты должны совпадать с pygame
+        grid = CollisionWorld(brute_force_pairs=0)
+        world = CollisionWorld()
+        expected = pygame.sprite.groupcollide(enemies, bullets, False, False)
+        expected = {k: set(v) for k, v in expected.items()}
+        for w in (grid, world):
+            got = w.groupcollide(enemies, bullets, False, False)
+            assert expected == {k: set(v) for k, v in got.items()}
+
+        base = run(pygame.sprite.groupcollide, enemies, bullets, frames)
+        fast = run(grid.groupcollide, enemies, bullets, frames)
+        game = run(world.groupcollide, enemies, bullets, frames)
+        print(f"{total:>9} {base:>16.3f} {fast:>10.3f} {base / fast:>7.1f}x {game:>10.3f} {base / game:>7.1f}x")
+
+def make_field(enemies, count):
+    field = ProjectileField()
+    field.spawn_many([random.uniform(0, config.SCREEN_W) for _ in range(count)],
+                     [random.uniform(0, config.SCREEN_H) for _ in range(count)])
+    return [Box(45, 32, 3) for _ in range(enemies)], field
+
+def run_field(field, enemies, grid_pairs, frames):
+    field.grid_pairs = grid_pairs
+    start = time.perf_counter()
+    for _ in range(frames):
+        field.collide(enemies, dokill=False)
+    return (time.perf_counter() - start) / frames * 1000
+
+def main_field():
+    print(f"\n{'enemies x projectiles':>22} {'pairs':>8} {'full scan ms':>13} {'grid ms':>10} {'speedup':>8}")
+    for count_enemies, count in FIELD_SCENES:
+        enemies, field = make_field(count_enemies, count)
+        full = field.collide(enemies, dokill=False)
+        field.grid_pairs = 0
+        assert list(field.collide(enemies, dokill=False).items()) == list(full.items())
+
+        frames = max(20, 20000 // count_enemies)
+        base = run_field(field, enemies, float("inf"), frames)
+        fast = run_field(field, enemies, 0, frames)
+        mark = "  <- grid" if count_enemies * count > config.PROJECTILE_GRID_PAIRS else ""
+        print(f"{count_enemies:>10} x {count:<9} {count_enemies * count:>8} {base:>13.3f} {fast:>10.3f} {base / fast:>7.1f}x{mark}")
+
+if __name__ == "__main__":
+    main()
+    main_field()
@@ -0,0 +1,255 @@
+"""Поиск предела нагрузки: сколько врагов, пуль, частиц и бонусов машина держит в бюджете кадра.
+
+Каждый сценарий задаёт состав нагрузки на единицу масштаба; масштаб растёт геометрически,
+пока p95 длительности кадра не выйдет за бюджет 1000 / config.FPS, затем граница
+уточняется делением пополам. Кадр - настоящий кадр игры (события, тик симуляции,
+отрисовка в dummy-окно) с настоящими Enemy, PowerUp, снарядами и взрывами; фазы кадра
+берутся из профайлера (profiling), и для точки насыщения называется фаза, выросшая сильнее всех.
+
+Запуск из корня проекта:
+    python -m benchmarks.capacity                            # все сценарии
+    python -m benchmarks.capacity -k enemies -k battle       # только совпадающие имена
+    python -m benchmarks.capacity --out capacity.json
+    python -m benchmarks.capacity --compare capacity.json --threshold 15
+
+С --compare процесс завершается с кодом 1, если ёмкость какого-то сценария упала больше
+чем на threshold процентов. Отчёт хранит метаданные машины: сравнение между разным
+железом показывает, во сколько раз отличается запас, а не регрессию.
+"""
+import argparse
+import json
+import math
+import random
+import sys
+import config
+from profiling import profiler
+from .suite import game, metadata
+
+DEFAULT_THRESHOLD = 10.0
+
+# Состав нагрузки на единицу масштаба: сколько сущностей каждого вида держать на экране
+SCENARIOS = {
+    "enemies": {"enemies": 1},
+    "bullets": {"bullets": 1},
+    "particles": {"particles": 1},
+    "powerups": {"powerups": 1},
+    # Обычный бой: на врага несколько пуль в воздухе и догорающие взрывы
+    "battle": {"enemies": 1, "bullets": 4, "particles": 30, "powerups": 0.1},
+    # Конец волны: мало целей, много взрывов
+    "explosive": {"enemies": 1, "bullets": 2, "particles": 120},
+}
+
+# Жёсткие пределы хранилищ; дальше них масштаб не растёт
+CAPS = {
+    "bullets": config.PROJECTILE_CAPACITY if config.VECTOR_PROJECTILES else None,
+    "particles": config.PARTICLE_CAPACITY,
+}
+
+def population(g):
+    """Сколько сущностей каждого вида сейчас живо"""
+    return {
+        "enemies": len(g.enemies),
+        "bullets": g.projectiles.count if config.VECTOR_PROJECTILES else len(g.bullets),
+        "particles": g.state["explosions"].count,
+        "powerups": len(g.powerups),
+    }
+
+def _top_up(g, counts, rng):
+    """Досыпает сущности до целевых чисел; вызывается вне замера кадра"""
+    from effects import add_explosion
+    have = population(g)
+    w, h = config.SCREEN_W, config.SCREEN_H
+    # Игрок стоит в углу и неуязвим, чтобы нагрузка не заканчивалась game over
+    g.player.inv_until = 10 ** 12
+    for _ in range(counts.get("enemies", 0) - have["enemies"]):
+        enemy = g.pools.enemy.acquire(1.5, groups=(g.enemies, g.all_sprites))
+        enemy.rect.y = rng.randint(-enemy.rect.h, h - 200)
+    missing = counts.get("bullets", 0) - have["bullets"]
+    if missing > 0:
+        xs = [rng.uniform(10, w - 10) for _ in range(missing)]
+        ys = [rng.uniform(20, h) for _ in range(missing)]
+        if config.VECTOR_PROJECTILES:
+            g.projectiles.spawn_many(xs, ys)
+        else:
+            for x, y in zip(xs, ys):
+                g.pools.bullet.acquire(x, y, groups=(g.bullets, g.all_sprites))
+    for _ in range(counts.get("powerups", 0) - have["powerups"]):
+        g.pools.powerup.acquire(rng.uniform(30, w - 30), rng.uniform(0, h - 100), rng.choice(config.POWERUP_TYPES),
+                                groups=(g.powerups, g.all_sprites))
+    explosions = g.state["explosions"]
+    target = min(counts.get("particles", 0), explosions.capacity)
+    while explosions.count < target:
+        add_explosion(explosions, rng.uniform(20, w - 20), rng.uniform(20, h - 20), config.ENEMY_COLOR, intensity=1.5)
+
+def leaf_phases(phases):
+    """Убирает участки, внутри которых есть вложенные (update при update/player и т.п.)"""
+    names = list(phases)
+    return {name: ms for name, ms in phases.items() if not any(other.startswith(name + "/") for other in names)}
+
+def measure_step(g, counts, frames=90, warmup=20, seed=1):
+    """Держит заданную нагрузку frames кадров и возвращает длительности кадра и фаз"""
+    g.start_game(seed=seed)
+    g.player.rect.bottomleft = (0, config.SCREEN_H)
+    g.dirty.invalidate()
+    # Волны игры на время замера выключены: нагрузку задаёт только сценарий
+    g.waves.stop()
+    rng = random.Random(seed)
+    seen = {kind: 0 for kind in population(g)}
+    for frame in range(warmup + frames):
+        if frame == warmup:
+            profiler.clear()
+        _top_up(g, counts, rng)
+        profiler.begin_frame()
+        with profiler.span("handle_events"):
+            g.handle_events()
+        g.advance(g.step_ms)
+        g.draw()
+        profiler.end_frame()
+        if frame >= warmup:
+            for kind, n in population(g).items():
+                seen[kind] += n
+    p = profiler.percentiles((50, 95, 99))
+    return {
+        "counts": counts,
+        "population": {kind: round(n / frames, 1) for kind, n in seen.items()},
+        "frame_p50_ms": round(p[50], 3),
+        "frame_p95_ms": round(p[95], 3),
+        "frame_p99_ms": round(p[99], 3),
+        "phases_ms": {name: round(ms, 3) for name, ms in sorted(leaf_phases(profiler.phase_ms(frames)).items())},
+    }
+
+def counts_at(mix, scale):
+    return {kind: int(round(ratio * scale)) for kind, ratio in mix.items()}
+
+def max_scale(mix, limit):
+    caps = [CAPS[kind] / ratio for kind, ratio in mix.items() if CAPS.get(kind)]
+    return int(min(caps + [limit]))
+
+def bottleneck(first, last):
+    """Фаза, которая выросла сильнее всех от самой лёгкой ступени до точки насыщения"""
+    growth = {name: ms - first["phases_ms"].get(name, 0.0) for name, ms in last["phases_ms"].items()}
+    if not growth:
+        return None, {}
+    name = max(growth, key=growth.get)
+    return name, {k: round(v, 3) for k, v in sorted(growth.items(), key=lambda kv: kv[1], reverse=True)}
+
+def find_capacity(mix, budget_ms, start=8, growth=2.0, refine=4, limit=1 << 16, frames=90, warmup=20, progress=None):
+    """Геометрический разгон масштаба до выхода p95 за бюджет, затем деление пополам"""
+    g = game()
+    top = max_scale(mix, limit)
+    steps = []
+
+    def run(scale):
+        step = measure_step(g, counts_at(mix, scale), frames, warmup)
+        step["scale"] = scale
+        step["over_budget"] = step["frame_p95_ms"] > budget_ms
+        steps.append(step)
+        if progress is not None:
+            progress(step)
+        return step
+
+    ok = bad = None
+    scale = min(start, top)
+    while True:
+        step = run(scale)
+        if step["over_budget"]:
+            bad = step
+            break
+        ok = step
+        if scale >= top:
+            break
+        scale = min(top, max(scale + 1, int(math.ceil(scale * growth))))
+
+    if bad is not None:
+        lo = ok["scale"] if ok else 0
+        for _ in range(refine):
+            mid = (lo + bad["scale"]) // 2
+            if mid <= lo or bad["scale"] - lo <= max(1, lo // 20):
+                break
+            step = run(mid)
+            if step["over_budget"]:
+                bad = step
+            else:
+                ok, lo = step, mid
+
+    last = bad or ok
+    phase, phase_growth = bottleneck(steps[0], last)
+    return {
+        "mix": mix,
+        "saturated": bad is not None,
+        "capacity_scale": ok["scale"] if ok else 0,
+        "capacity": ok["counts"] if ok else counts_at(mix, 0),
+        "saturation_scale": bad["scale"] if bad else None,
+        "bottleneck": phase,
+        "phase_growth_ms": phase_growth,
+        "steps": sorted(steps, key=lambda s: s["scale"]),
+    }
+
+def run_capacity(patterns=(), frames=90, warmup=20, progress=None):
+    budget_ms = 1000.0 / config.FPS
+    was_enabled = profiler.enabled
+    profiler.enabled = True
+    try:
+        scenarios = {}
+        for name, mix in SCENARIOS.items():
+            if patterns and not any(p.lower() in name.lower() for p in patterns):
+                continue
+            scenarios[name] = find_capacity(mix, budget_ms, frames=frames, warmup=warmup,
+                                            progress=progress and (lambda step, name=name: progress(name, step)))
+    finally:
+        profiler.enabled = was_enabled
+    meta = metadata()
+    meta.update({"fps": config.FPS, "sim_hz": config.SIM_HZ, "budget_ms": round(budget_ms, 3),
+                 "frames_per_step": frames, "vector_projectiles": config.VECTOR_PROJECTILES})
+    return {"meta": meta, "scenarios": scenarios}
+
+def compare(report, baseline, threshold=DEFAULT_THRESHOLD):
+    """Сравнивает capacity_scale с базой; возвращает [(имя, база, сейчас, изменение %, регрессия?)]"""
+    rows = []
+    for name, current in report["scenarios"].items():
+        base = baseline["scenarios"].get(name)
+        if base is None or not base["capacity_scale"]:
+            continue
+        change = (current["capacity_scale"] / base["capacity_scale"] - 1.0) * 100
+        rows.append((name, base["capacity_scale"], current["capacity_scale"], change, change < -threshold))
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-k", dest="patterns", action="append", default=[], help="подстрока имени сценария")
+    parser.add_argument("--frames", type=int, default=90, help="кадров замера на ступень")
+    parser.add_argument("--warmup", type=int, default=20, help="кадров прогрева на ступень")
+    parser.add_argument("--out", metavar="FILE", help="записать отчёт в JSON")
+    parser.add_argument("--compare", metavar="FILE", help="сравнить с прошлым отчётом")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="допустимое падение ёмкости, %%")
+    args = parser.parse_args()
+
+    def progress(name, step):
+        counts = ", ".join(f"{kind} {n}" for kind, n in step["counts"].items())
+        print(f"{name:<10} x{step['scale']:<6} p95 {step['frame_p95_ms']:7.2f} мс"
+              f"{'  > бюджета' if step['over_budget'] else ''}  ({counts})")
+
+    report = run_capacity(args.patterns, args.frames, args.warmup, progress)
+    print(f"\nбюджет кадра {report['meta']['budget_ms']} мс (FPS {config.FPS})")
+    for name, result in report["scenarios"].items():
+        counts = ", ".join(f"{kind} {n}" for kind, n in result["capacity"].items())
+        tail = f"упирается в {result['bottleneck']}" if result["saturated"] else "бюджет не исчерпан до предела хранилищ"
+        print(f"{name:<10} держит {counts}; {tail}")
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+        print(f"отчёт записан в {args.out}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        rows = compare(report, baseline, args.threshold)
+        print(f"\n{'сценарий':<10} {'база':>8} {'сейчас':>8} {'изм.':>8}")
+        for name, base, current, change, regressed in rows:
+            print(f"{name:<10} {base:>8} {current:>8} {change:>+7.1f}%{'  РЕГРЕССИЯ' if regressed else ''}")
+        if any(row[4] for row in rows):
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
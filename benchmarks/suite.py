@@ -0,0 +1,281 @@
+"""Микробенчмарки горячих функций игры с JSON-базой и порогом регрессии.
+
+Работает без окна (SDL dummy). Запуск из корня проекта:
+    python -m benchmarks.suite                                  # прогнать и вывести
+    python -m benchmarks.suite --save benchmarks/baseline.json  # записать базу
+    python -m benchmarks.suite --compare benchmarks/baseline.json --threshold 10
+    python -m benchmarks.suite -k player -k hud                 # только совпадающие имена
+
+С --compare процесс завершается с кодом 1, если какая-то функция стала медленнее базы
+больше чем на threshold процентов. База привязана к машине: сравнивать имеет смысл
+только прогоны на одном и том же железе.
+"""
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+import numpy as np
+import pygame
+import config
+
+DEFAULT_THRESHOLD = 10.0
+
+# name -> setup(); setup готовит сцену и возвращает функцию без аргументов, которую и меряем
+BENCHMARKS = {}
+
+def bench(name):
+    def register(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+_game = None
+
+def game():
+    """Одна headless-игра на весь прогон: pygame, окно-заглушка и запечённые ассеты"""
+    global _game
+    if _game is None:
+        from game import Game
+        _game = Game(headless=True)
+        _game.start_game(seed=1)
+    return _game
+
+# === ЭФФЕКТЫ ===
+
+@bench("add_explosion")
+def _add_explosion():
+    from effects import ParticleSystem, add_explosion
+    game()
+    explosions = ParticleSystem()
+
+    def run():
+        if explosions.count > explosions.capacity - 64:
+            explosions.clear()
+        add_explosion(explosions, 240, 360, config.ENEMY_COLOR, intensity=1.5)
+    return run
+
+def _explosions_at(count):
+    from effects import ParticleSystem, EffectsRenderer, update_draw_explosions
+    screen = game().screen
+    renderer = EffectsRenderer()
+    explosions = ParticleSystem(capacity=count, rng=np.random.default_rng(1))
+
+    def run():
+        # Досыпаем частицы, чтобы их число не падало по ходу замера
+        if explosions.count < count:
+            explosions.emit(240, 360, count - explosions.count, config.ENEMY_COLOR, speed=(0.0, 0.2), life=(1000, 2000))
+        update_draw_explosions(screen, explosions, renderer)
+    return run
+
+for _count in (1000, 8000, 32000):
+    bench(f"update_draw_explosions[{_count}]")(lambda count=_count: _explosions_at(count))
+
+def _stars_at(count):
+    from effects import create_stars, draw_stars, EffectsRenderer
+    screen = game().screen
+    renderer = EffectsRenderer()
+    stars = create_stars(count, rng=random.Random(1))
+    return lambda: draw_stars(screen, stars, renderer)
+
+for _count in (config.STAR_COUNT, 5000):
+    bench(f"draw_stars[{_count}]")(lambda count=_count: _stars_at(count))
+
+# === СПРАЙТЫ ===
+
+@bench("Enemy.__init__")
+def _enemy_init():
+    from sprites import Enemy
+    game()
+    return lambda: Enemy(1.5)
+
+@bench("Enemy.update[x64]")
+def _enemy_update():
+    from sprites import Enemy
+    game()
+    enemies = [Enemy(1.5) for _ in range(64)]
+    for i, enemy in enumerate(enemies):
+        enemy.rect.y = i * 10
+
+    def run():
+        for enemy in enemies:
+            enemy.update()
+            if enemy.rect.top > config.SCREEN_H:
+                enemy.rect.y = 0
+    return run
+
+PLAYER_STATES = {
+    "hp3": {},
+    "hp1": {"hp": 1},
+    "shield": {"shield_until": 10 ** 9},
+    "boost": {"speed_boost_until": 10 ** 9, "boost_speed": 7},
+    "shield+boost": {"shield_until": 10 ** 9, "speed_boost_until": 10 ** 9, "boost_speed": 7},
+    "damage_flash": {"damage_flash": 10 ** 9},
+    "invulnerable": {"inv_until": 10 ** 9},
+}
+
+def _player_in(state):
+    from sprites import Player
+    from sim import KeyState
+    game()
+    player = Player(config.SCREEN_W // 2, config.SCREEN_H - 60)
+    for attr, value in PLAYER_STATES[state].items():
+        setattr(player, attr, value)
+    keys = (KeyState((pygame.K_RIGHT,)), KeyState((pygame.K_LEFT,)))
+    now = [0]
+
+    def run():
+        now[0] += 16
+        player.update(keys[(now[0] >> 10) & 1], now[0])
+    return run
+
+for _state in PLAYER_STATES:
+    bench(f"Player.update[{_state}]")(lambda state=_state: _player_in(state))
+
+# === СТОЛКНОВЕНИЯ ===
+
+def _groupcollide_at(total, use_hash):
+    from physics import CollisionWorld
+    from .bench_collision import make_scene
+    random.seed(1)
+    enemies, bullets = make_scene(total)
+    collide = CollisionWorld(brute_force_pairs=0).groupcollide if use_hash else pygame.sprite.groupcollide
+
+    def run():
+        enemies.update()
+        bullets.update()
+        collide(enemies, bullets, False, False)
+    return run
+
+# Перебор pygame на 10000 сущностях идёт секунду на вызов, поэтому меряется только на 1000
+bench("pygame.groupcollide[1000]")(lambda: _groupcollide_at(1000, False))
+for _total in (1000, 10000):
+    bench(f"CollisionWorld.groupcollide[{_total}]")(lambda total=_total: _groupcollide_at(total, True))
+
+# === ИНТЕРФЕЙС ===
+
+@bench("Game._draw_hud")
+def _draw_hud():
+    g = game()
+    g.menu.settings.show_fps = True
+    return lambda: g._draw_hud(g.now())
+
+@bench("Game._draw_powerup_indicators")
+def _draw_powerup_indicators():
+    g = game()
+    for ptype in ("shield", "rapidfire", "speed", "dual_shot"):
+        g.player.apply_powerup(ptype, g.now())
+    return lambda: g._draw_powerup_indicators(g.now())
+
+@bench("Menu.draw")
+def _menu_draw():
+    menu = game().menu
+
+    def run():
+        menu.update()
+        menu.draw()
+    return run
+
+# === ЗАМЕР ===
+
+def measure(fn, repeats=7, min_time=0.1):
+    """Как timeit: подбирает число вызовов на повтор не короче min_time, возвращает мкс на вызов"""
+    fn()
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        loops = loops * 10 if elapsed <= 0 else max(loops + 1, int(loops * min_time * 1.2 / elapsed))
+    times = [elapsed / loops]
+    for _ in range(repeats - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        times.append((time.perf_counter() - start) / loops)
+    return {
+        "best_us": min(times) * 1e6,
+        "median_us": statistics.median(times) * 1e6,
+        "loops": loops,
+        "repeats": repeats,
+    }
+
+def run_suite(patterns=(), repeats=7, min_time=0.1, progress=None):
+    results = {}
+    for name, setup in BENCHMARKS.items():
+        if patterns and not any(p.lower() in name.lower() for p in patterns):
+            continue
+        results[name] = measure(setup(), repeats, min_time)
+        if progress is not None:
+            progress(name, results[name])
+    return results
+
+def metadata():
+    return {
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+        "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+    }
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """Сравнивает best_us с базой; возвращает [(имя, база, сейчас, изменение %, регрессия?)]"""
+    rows = []
+    for name, current in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        change = (current["best_us"] / base["best_us"] - 1.0) * 100
+        rows.append((name, base["best_us"], current["best_us"], change, change > threshold))
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-k", dest="patterns", action="append", default=[], help="подстрока имени бенчмарка")
+    parser.add_argument("--repeats", type=int, default=7)
+    parser.add_argument("--min-time", type=float, default=0.1, help="секунд на один повтор")
+    parser.add_argument("--save", metavar="FILE", help="записать результаты как базу")
+    parser.add_argument("--compare", metavar="FILE", help="сравнить с базой")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="допустимое замедление, %%")
+    parser.add_argument("--list", action="store_true", help="только перечислить бенчмарки")
+    args = parser.parse_args()
+
+    if args.list:
+        print("\n".join(BENCHMARKS))
+        return
+
+    def progress(name, r):
+        print(f"{name:<42} {r['best_us']:>12.2f} us  (median {r['median_us']:.2f}, {r['loops']} x {r['repeats']})")
+
+    results = run_suite(args.patterns, args.repeats, args.min_time, progress)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({"meta": metadata(), "results": results}, f, indent=2, sort_keys=True)
+        print(f"база записана в {args.save}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+        rows = compare(results, baseline, args.threshold)
+        print(f"\n{'бенчмарк':<42} {'база, us':>12} {'сейчас, us':>12} {'изм.':>8}")
+        for name, base, current, change, regressed in rows:
+            print(f"{name:<42} {base:>12.2f} {current:>12.2f} {change:>+7.1f}%{'  РЕГРЕССИЯ' if regressed else ''}")
+        missing = [name for name in results if name not in baseline]
+        if missing:
+            print(f"нет в базе: {', '.join(missing)}")
+        regressions = [row for row in rows if row[4]]
+        if regressions:
+            print(f"\n{len(regressions)} регрессий больше {args.threshold:g}%")
+            sys.exit(1)
+        print(f"\nрегрессий больше {args.threshold:g}% нет")
+
+if __name__ == "__main__":
+    main()
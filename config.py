@@ -2,9 +2,28 @@ import math
 
 # === ЭКРАН ===
 SCREEN_W, SCREEN_H = 480, 720
+# Ограничение частоты отрисовки; симуляция идёт с фиксированным шагом SIM_HZ
 FPS = 60
 BG_COLOR = (10, 12, 20)
 
+# === ТЕКСТ ===
+FONT_FACE = "arial"
+# Предел памяти LRU-кэша отрисованных надписей
+TEXT_CACHE_BYTES = 4 * 1024 * 1024
+# Сколько статических слоёв меню (по 480x720) держать в кэше
+MENU_PANEL_CACHE = 4
+# Файл с найденными путями системных шрифтов, чтобы не искать их при каждом запуске (None - не хранить)
+FONT_CACHE_PATH = ".font_cache.json"
+
+# === ЗАПУСК ===
+# Сколько мс каждого кадра меню отдавать фоновому запеканию ассетов и заголовков
+WARMUP_BUDGET_MS = 4
+# Печатать время до первого кадра меню и до первого кадра игры
+STARTUP_METRICS = True
+# Пакет запечённых моделей спрайтов (python -m sprites.pack); устаревший пересобирается,
+# когда меню закончит фоновый прогрев. None - всегда рисовать модели заново
+ASSET_PACK_PATH = "assets.pack"
+
 # === ЦВЕТА ===
 PLAYER_COLOR = (80, 200, 255)
 ENEMY_COLOR = (240, 70, 70)
@@ -16,7 +35,35 @@ UI_COLOR = (220, 220, 230)
 SPAWN_MS = 700
 SPAWN_MS_MIN = 350
 SPAWN_MS_DECREASE = 50
-SPAWN_EVENT_ID = 1
+
+# === ВОЛНЫ ===
+# Каждые WAVES_PER_LEVEL врагов уровень растёт, а интервал появления сокращается (не ниже минимума)
+WAVES_PER_LEVEL = 8
+WAVE_MIN_SPAWN_MS = 300
+# Строи: смещения (dx, dy) врагов от центра; строй приходит в начале каждого FORMATION_LEVELS-го уровня (0 - никогда)
+FORMATIONS = {
+    "line": [(0, 0), (-60, 0), (60, 0), (-120, 0), (120, 0)],
+    "vee": [(0, 0), (-50, -35), (50, -35), (-100, -70), (100, -70)],
+}
+FORMATION_LEVELS = 3
+# За сколько тиков до появления враги из таблицы волн создаются заранее; строк таблицы за один расчёт
+WAVE_LOOKAHEAD = 120
+WAVE_TABLE_CHUNK = 256
+
+# === ЦИКЛ ===
+# Частота шага симуляции (Гц): все скорости в config заданы в пикселях за шаг
+SIM_HZ = 60
+# Сколько шагов симуляции можно догнать за один кадр; остальное время отбрасывается
+MAX_CATCHUP_STEPS = 5
+# Рисовать движущиеся объекты между двумя шагами симуляции (плавность при FPS > SIM_HZ)
+INTERPOLATE = True
+# Сдвиг за шаг больше этого (пиксели) - телепорт из пула, такой спрайт не интерполируется
+INTERPOLATE_MAX_JUMP = 64
+
+# === ЗАПИСЬ ===
+# Seed случайности сессии (None - новый при каждом старте) и файл записи ввода (None - не писать)
+SEED = None
+RECORD_PATH = None
 
 # === ФИЗИКА ===
 TAU = 2 * math.pi
@@ -26,6 +73,88 @@ BULLET_SPEED = 12
 ENEMY_SPEED_MIN, ENEMY_SPEED_MAX = 2.0, 4.5
 PLAYER_HP = 3
 
+# === СНАРЯДЫ ===
+# True - пули игрока живут в ProjectileField (NumPy), False - отдельными спрайтами Bullet
+VECTOR_PROJECTILES = True
+PROJECTILE_CAPACITY = 8192
+# Снаряды против врагов: больше стольких пар (снаряды x враги) кандидаты берутся из сетки
+# PointGrid с ячейкой PROJECTILE_GRID_CELL, меньше - каждый враг проверяется по всем снарядам
+# (python -m benchmarks.bench_collision: сетка выигрывает примерно с 3-9 тыс. пар)
+PROJECTILE_GRID_PAIRS = 4096
+PROJECTILE_GRID_CELL = 32
+
+# === СТОЛКНОВЕНИЯ ===
+# Размер ячейки сетки broadphase в пикселях
+COLLISION_CELL = 64
+# До скольких пар спрайтов использовать обычный перебор pygame вместо сетки SpatialHash
+# (python -m benchmarks.bench_collision: сетка выигрывает примерно с 40 тыс. пар). В игре
+# с VECTOR_PROJECTILES группа пуль пуста, а игрок против врагов и бонусов - десятки пар,
+# так что для спрайтов всегда работает перебор; сетка нужна пулям-спрайтам (VECTOR_PROJECTILES = False)
+COLLISION_BRUTE_FORCE_PAIRS = 32768
+# Точные столкновения по маскам изображений поверх проверки rect
+PRECISE_COLLISIONS = False
+
+# === ОТРИСОВКА ===
+# Обновлять только изменившиеся области экрана вместо flip() каждый кадр
+DIRTY_RECTS = True
+# Доля площади экрана / число прямоугольников, после которых кадр рисуется целиком
+DIRTY_FULL_RATIO = 0.45
+DIRTY_MAX_RECTS = 400
+# Пауза и экран game over: застывший кадр, цикл спит в event.wait не дольше стольких мс
+FROZEN_WAIT_MS = 500
+# Бэкенд вывода: "blit" - программные blit в окно, "texture" - SDL2 Renderer и текстуры (pygame._sdl2.video)
+RENDER_BACKEND = "blit"
+# Для "texture": целое увеличение окна (логическое разрешение остаётся SCREEN_W x SCREEN_H),
+# попытка взять аппаратный Renderer (без GPU - программный SDL) и vsync
+RENDER_SCALE = 1
+RENDER_ACCELERATED = True
+RENDER_VSYNC = False
+
+# === КАЧЕСТВО ===
+# Уровни детализации от лучшего к худшему: множитель частиц взрыва, доли звёзд в игре
+# и в меню, слои свечения индикаторов бонусов. В настройках выбирается уровень или "Auto"
+QUALITY_TIERS = {
+    "High": {"particles": 1.0, "stars": 1.0, "menu_stars": 1.0, "indicator_glow": True},
+    "Medium": {"particles": 0.6, "stars": 0.6, "menu_stars": 0.5, "indicator_glow": True},
+    "Low": {"particles": 0.3, "stars": 0.3, "menu_stars": 0.25, "indicator_glow": False},
+}
+# "Auto": окно кадров для p90 времени работы кадра
+QUALITY_WINDOW = 30
+# Понижать уровень, если p90 больше этой доли бюджета 1000 / FPS; повышать после
+# QUALITY_UP_FRAMES кадров подряд с p90 ниже QUALITY_UP_RATIO бюджета
+QUALITY_DOWN_RATIO = 0.9
+QUALITY_UP_RATIO = 0.5
+QUALITY_UP_FRAMES = 180
+# Кадров без решений после смены уровня
+QUALITY_COOLDOWN = 60
+
+# === ПРОФИЛИРОВАНИЕ ===
+# Профайлер кадра: F3 - оверлей с графиком, F4 - выгрузка trace; выключенный почти ничего не стоит
+PROFILER = False
+# Ёмкость кольцевых буферов: замеров участков и кадров
+PROFILER_SPANS = 65536
+PROFILER_FRAMES = 600
+# Куда пишется trace в формате Chrome (chrome://tracing, ui.perfetto.dev)
+PROFILER_TRACE_PATH = "frame_trace.json"
+
 # === БОНЫ ===
 POWERUP_SPAWN_CHANCE = 0.08
 POWERUP_TYPES = ["rapidfire", "shield", "speed", "dual_shot", "health"]
+
+# === ПУЛЫ ОБЪЕКТОВ ===
+# Максимум свободных экземпляров, хранимых в каждом пуле
+POOL_SIZES = {"bullet": 256, "enemy": 64, "powerup": 16}
+
+# === ЧАСТИЦЫ ===
+# Предел живых частиц. Отрисовка упирается в screen.blits (около 1 мкс на частицу), так что
+# в кадр 60 FPS помещается порядка 5-10 тыс. частиц в зависимости от машины
+# (python -m benchmarks.capacity -k particles); дальше число частиц урезает регулятор качества
+PARTICLE_CAPACITY = 8192
+PARTICLE_DAMPING = 0.98
+FX_ALPHA_LEVELS = 8
+FX_COLOR_STEP = 16
+
+# === ЗВЁЗДЫ ===
+STAR_COUNT = 140
+# (доля звёзд, размер, скорость) для каждого слоя параллакса
+STAR_LAYERS = [(3, 1, 0.8), (2, 2, 1.6), (1, 3, 2.4)]
@@ -1,4 +1,8 @@
+from .particles import ParticleSystem
+from .render import EffectsRenderer
 from .explosions import add_explosion, update_draw_explosions
 from .stars import create_stars, draw_stars
+from .quality import QualityGovernor, quality
 
-__all__ = ["add_explosion", "update_draw_explosions", "create_stars", "draw_stars"]
+__all__ = ["ParticleSystem", "EffectsRenderer", "add_explosion", "update_draw_explosions", "create_stars", "draw_stars",
+           "QualityGovernor", "quality"]
@@ -0,0 +1,104 @@
+import pygame
+import numpy as np
+import config
+
+class ParticleSystem:
+    """Система частиц на массивах NumPy (struct-of-arrays) с фиксированной ёмкостью"""
+
+    def __init__(self, capacity=config.PARTICLE_CAPACITY, damping=config.PARTICLE_DAMPING, max_life=28, size=4, rng=None):
+        self.capacity = capacity
+        self.damping = damping
+        self.max_life = max_life
+        self.size = size
+        self.count = 0
+        self.rng = rng if rng is not None else np.random.default_rng()
+
+        # Живые частицы всегда лежат в [0, count)
+        self.pos = np.zeros((capacity, 2), dtype=np.float32)
+        self.vel = np.zeros((capacity, 2), dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.int16)
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        self.count = 0
+
+    def emit(self, x, y, count, color_base, speed=(1.5, 4.0), life=(18, 28), jitter=20):
+        """Добавляет пачку частиц из точки; лишние при переполнении отбрасываются"""
+        count = min(int(count), self.capacity - self.count)
+        if count <= 0:
+            return 0
+        s = slice(self.count, self.count + count)
+        rng = self.rng
+
+        ang = rng.uniform(0, config.TAU, count)
+        spd = rng.uniform(speed[0], speed[1], count)
+        self.pos[s, 0] = x
+        self.pos[s, 1] = y
+        self.vel[s, 0] = np.cos(ang) * spd
+        self.vel[s, 1] = np.sin(ang) * spd
+        self.life[s] = rng.integers(life[0], life[1] + 1, count)
+        col = np.asarray(color_base[:3], dtype=np.int16) + rng.integers(-jitter, jitter + 1, (count, 3))
+        self.color[s] = np.clip(col, 0, 255)
+
+        self.count += count
+        return count
+
+    def update(self):
+        """Интегрирует движение, затухание и время жизни, затем удаляет мёртвые частицы"""
+        n = self.count
+        if n == 0:
+            return
+        self.pos[:n] += self.vel[:n]
+        self.vel[:n] *= self.damping
+        self.life[:n] -= 1
+        self._compact()
+
+    def _compact(self):
+        # Swap-remove: мёртвые слоты в голове заполняются живыми частицами из хвоста
+        n = self.count
+        alive = self.life[:n] > 0
+        n_alive = int(np.count_nonzero(alive))
+        if n_alive == n:
+            return
+        holes = np.flatnonzero(~alive[:n_alive])
+        movers = n_alive + np.flatnonzero(alive[n_alive:])
+        if holes.size:
+            self.pos[holes] = self.pos[movers]
+            self.vel[holes] = self.vel[movers]
+            self.life[holes] = self.life[movers]
+            self.color[holes] = self.color[movers]
+        self.count = n_alive
+
+    def render_pos(self, alpha=1.0):
+        """Позиции для отрисовки между прошлым (alpha=0) и текущим (alpha=1) шагом"""
+        pos = self.pos[:self.count]
+        if alpha >= 1.0:
+            return pos
+        # Скорость прошлого шага - текущая до затухания
+        return pos + self.vel[:self.count] * ((alpha - 1.0) / self.damping)
+
+    def bounds(self, alpha=1.0):
+        """Ограничивающий прямоугольник живых частиц или None"""
+        n = self.count
+        if n == 0:
+            return None
+        pos = self.render_pos(alpha)
+        lo = pos.min(axis=0)
+        hi = pos.max(axis=0)
+        return pygame.Rect(int(lo[0]), int(lo[1]), int(hi[0] - lo[0]) + self.size + 1, int(hi[1] - lo[1]) + self.size + 1)
+
+    def alphas(self):
+        n = self.count
+        return np.maximum(30, (255 * self.life[:n].astype(np.int32)) // self.max_life)
+
+    def draw(self, renderer, alpha=1.0):
+        """Передаёт живые частицы в пакетный рендер; сам слой отправляет renderer.flush()"""
+        n = self.count
+        if n == 0:
+            return
+        sprites = renderer.sprites_for(self.color[:n], self.alphas(), self.size)
+        positions = self.render_pos(alpha).astype(np.int32).tolist()
+        renderer.submit_many(sprites, positions)
@@ -0,0 +1,66 @@
+from collections import deque
+import config
+
+class QualityGovernor:
+    """Уровень детализации эффектов из config.QUALITY_TIERS; в режиме "Auto" подстраивается под бюджет кадра"""
+
+    def __init__(self, tiers=config.QUALITY_TIERS, budget_ms=1000.0 / config.FPS, window=config.QUALITY_WINDOW):
+        self.tiers = list(tiers.items())
+        self.budget_ms = budget_ms
+        self.adaptive = True
+        self.index = 0
+        self.changes = 0
+        self._times = deque(maxlen=window)
+        self._calm = 0
+        self._cooldown = 0
+        self._apply(0)
+
+    @property
+    def name(self):
+        return self.tiers[self.index][0]
+
+    def select(self, mode):
+        """Режим "Auto" регулирует уровень по времени кадра, имя уровня фиксирует его"""
+        if mode == "Auto":
+            self.adaptive = True
+            return
+        self.adaptive = False
+        self._apply([name for name, _ in self.tiers].index(mode))
+
+    def observe(self, frame_ms):
+        """Учитывает время работы кадра и при необходимости меняет уровень"""
+        if not self.adaptive:
+            return
+        if self._cooldown:
+            self._cooldown -= 1
+            return
+        times = self._times
+        times.append(frame_ms)
+        if len(times) < times.maxlen:
+            return
+        load = sorted(times)[len(times) * 9 // 10]
+        if load > self.budget_ms * config.QUALITY_DOWN_RATIO:
+            if self.index < len(self.tiers) - 1:
+                self._apply(self.index + 1)
+            return
+        if load < self.budget_ms * config.QUALITY_UP_RATIO:
+            self._calm += 1
+            if self._calm >= config.QUALITY_UP_FRAMES and self.index > 0:
+                self._apply(self.index - 1)
+        else:
+            self._calm = 0
+
+    def _apply(self, index):
+        if index != self.index:
+            self.changes += 1
+        self.index = index
+        tier = self.tiers[index][1]
+        self.particles = tier["particles"]
+        self.stars = tier["stars"]
+        self.menu_stars = tier["menu_stars"]
+        self.indicator_glow = tier["indicator_glow"]
+        self._times.clear()
+        self._calm = 0
+        self._cooldown = config.QUALITY_COOLDOWN
+
+quality = QualityGovernor()
@@ -0,0 +1,105 @@
+import time
+from contextlib import contextmanager
+import pygame
+import numpy as np
+import config
+
+class EffectsRenderer:
+    """Пакетный рендер эффектов: заранее запечённые спрайты и один screen.blits() на слой"""
+
+    def __init__(self, alpha_levels=config.FX_ALPHA_LEVELS, color_step=config.FX_COLOR_STEP):
+        self.alpha_levels = alpha_levels
+        self.color_step = color_step
+        self._color_buckets = 256 // color_step
+        self._sprites = {}
+        self._batch = []
+
+        # Статистика текущего кадра
+        self.blit_count = 0
+        self.batch_count = 0
+        self.effects_ms = 0.0
+
+    def begin_frame(self):
+        self.blit_count = 0
+        self.batch_count = 0
+        self.effects_ms = 0.0
+
+    @contextmanager
+    def timed(self):
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.effects_ms += (time.perf_counter() - start) * 1000
+
+    def _key(self, r, g, b, level, size):
+        k = self._color_buckets
+        return (((r * k + g) * k + b) * self.alpha_levels + level) * 256 + size
+
+    def _bake(self, r, g, b, level, size):
+        step = self.color_step
+        color = tuple(min(255, c * step + step // 2) for c in (r, g, b))
+        alpha = min(255, (level + 1) * 256 // self.alpha_levels)
+        surf = pygame.Surface((size, size), pygame.SRCALPHA)
+        surf.fill((*color, alpha))
+        return surf
+
+    def sprite(self, color, alpha=255, size=1):
+        """Возвращает закэшированный спрайт для ближайшего цвета и уровня прозрачности"""
+        step = self.color_step
+        r, g, b = color[0] // step, color[1] // step, color[2] // step
+        level = alpha * self.alpha_levels // 256
+        key = self._key(r, g, b, level, size)
+        surf = self._sprites.get(key)
+        if surf is None:
+            surf = self._sprites[key] = self._bake(r, g, b, level, size)
+        return surf
+
+    def sprites_for(self, colors, alphas, size):
+        """Векторизованный подбор спрайтов для массивов цветов (N, 3) и альф (N,)"""
+        q = colors.astype(np.int32) // self.color_step
+        levels = alphas.astype(np.int32) * self.alpha_levels // 256
+        k = self._color_buckets
+        keys = ((((q[:, 0] * k + q[:, 1]) * k + q[:, 2]) * self.alpha_levels + levels) * 256 + size)
+
+        sprites = self._sprites
+        uniq, inverse = np.unique(keys, return_inverse=True)
+        table = []
+        for key in uniq.tolist():
+            if key not in sprites:
+                rest, sz = divmod(key, 256)
+                rest, level = divmod(rest, self.alpha_levels)
+                rest, b = divmod(rest, k)
+                r, g = divmod(rest, k)
+                sprites[key] = self._bake(r, g, b, level, sz)
+            table.append(sprites[key])
+        # Выбор из массива объектов по индексам в C вместо словаря на каждую частицу
+        lookup = np.empty(len(table), dtype=object)
+        lookup[:] = table
+        return lookup[inverse].tolist()
+
+    def submit(self, image, pos, area=None):
+        self._batch.append((image, pos) if area is None else (image, pos, area))
+
+    def submit_many(self, images, positions):
+        self._batch.extend(zip(images, positions))
+
+    def flush(self, screen):
+        """Отправляет накопленный слой одним вызовом screen.blits()"""
+        if not self._batch:
+            return
+        screen.blits(self._batch, doreturn=False)
+        self.blit_count += len(self._batch)
+        self.batch_count += 1
+        self._batch.clear()
+
+    def cache_size(self):
+        return len(self._sprites)
+
+_default_renderer = None
+
+def default_renderer():
+    global _default_renderer
+    if _default_renderer is None:
+        _default_renderer = EffectsRenderer()
+    return _default_renderer
@@ -1,24 +1,131 @@
 import pygame
+import math
 import random
 import config
+from .render import default_renderer
 
-def create_stars(count):
-    stars = []
-    for _ in range(count):
-        size = random.choice([1, 1, 1, 2, 2, 3])
-        speed = random.uniform(0.5, 2.0) * (1 + size * 0.2)
-        x = random.randint(0, config.SCREEN_W - 1)
-        y = random.randint(0, config.SCREEN_H - 1)
+class StarLayer:
+    """Слой параллакса: звёзды нарисованы один раз в поверхность высотой 2*H и прокручиваются"""
+
+    def __init__(self, count, size, speed, color, twinkle=0.0, rng=random):
+        self.count = count
+        self.size = size
+        self.speed = speed
+        self.color = color
+        self.twinkle = twinkle
+        self.offset = 0.0
+        self.shift = self.prev_shift = 0
+        w, h = config.SCREEN_W, config.SCREEN_H
+        self.stars = [(rng.randint(0, w - 1), rng.randint(0, h - 1)) for _ in range(count)]
+        # Рисуются и восстанавливаются только первые visible звёзд (см. set_density)
+        self.visible = count
+        self.image = self._render()
+        self.area = pygame.Rect(0, config.SCREEN_H, config.SCREEN_W, config.SCREEN_H)
+
+    def _render(self):
+        w, h = config.SCREEN_W, config.SCREEN_H
+        surf = pygame.Surface((w, h * 2))
+        surf.fill((0, 0, 0))
+        surf.set_colorkey((0, 0, 0))
+        fill = surf.fill
+        for x, y in self.stars[:self.visible]:
+            # Копии сверху и снизу, чтобы звёзды на шве не обрезались
+            for yy in (y - h, y, y + h):
+                fill(self.color, (x, yy, self.size, self.size))
+        return surf
+
+    def set_density(self, density):
+        """Оставляет долю density звёзд; True, если изображение слоя перерисовано"""
+        visible = round(len(self.stars) * density)
+        if visible == self.visible:
+            return False
+        self.visible = visible
+        # Новая поверхность, а не перерисовка старой: текстурный бэкенд кэширует текстуры по поверхности
+        alpha = self.image.get_alpha()
+        self.image = self._render()
+        self.image.set_alpha(alpha)
+        return True
+
+    def update(self, t=0):
+        self.offset = (self.offset + self.speed) % config.SCREEN_H
+        self.shift = int(self.offset)
+        self.area.y = config.SCREEN_H - self.shift
+        if self.twinkle:
+            self.image.set_alpha(int(255 * (1.0 - self.twinkle * (0.5 + 0.5 * math.sin(t * 0.01 + self.speed * 7)))))
+
+    def dirty_rects(self):
+        """Области экрана, где звёзды слоя изменились с прошлого вызова (за сколько угодно update())"""
+        old, new = self.prev_shift, self.shift
+        self.prev_shift = new
+        if old == new and not self.twinkle:
+            return []
+        h, size = config.SCREEN_H, self.size
+        rects = []
+        for x, y in self.stars[:self.visible]:
+            oy = (y + old) % h
+            ny = (y + new) % h
+            if 0 <= ny - oy <= size:
+                spans = ((oy, ny - oy + size),)
+            else:
+                spans = ((oy, size), (ny, size))
+            for top, height in spans:
+                rects.append(pygame.Rect(x, top, size, height))
+                # Кусок звезды за нижним краем виден сверху экрана
+                if top + height > h:
+                    rects.append(pygame.Rect(x, top - h, size, height))
+        return rects
+
+class Starfield:
+    """Звёздное небо из нескольких слоёв параллакса; стоимость кадра не зависит от числа звёзд"""
+
+    def __init__(self, layers):
+        self.layers = layers
+        self.t = 0
+
+    def __len__(self):
+        return sum(layer.visible for layer in self.layers)
+
+    def update(self):
+        self.t += 1
+        for layer in self.layers:
+            layer.update(self.t)
+
+    def set_density(self, density):
+        """Доля видимых звёзд во всех слоях; True, если что-то изменилось и фон надо перерисовать"""
+        changed = False
+        for layer in self.layers:
+            changed = layer.set_density(density) or changed
+        return changed
+
+    def draw(self, renderer):
+        for layer in self.layers:
+            renderer.submit(layer.image, (0, 0), layer.area)
+
+    def dirty_rects(self):
+        rects = []
+        for layer in self.layers:
+            rects.extend(layer.dirty_rects())
+        return rects
+
+    def restore(self, screen, rects, bg_color=config.BG_COLOR):
+        """Восстанавливает фон (заливку и звёзды) только внутри rects"""
+        for r in rects:
+            screen.fill(bg_color, r)
+        for layer in self.layers:
+            top = layer.area.y
+            screen.blits([(layer.image, r, (r.x, top + r.y, r.w, r.h)) for r in rects], doreturn=False)
+
+def create_stars(count, layers=config.STAR_LAYERS, rng=random):
+    """Создаёт звёздное небо: count звёзд распределяются по слоям пропорционально весам"""
+    total = sum(weight for weight, *_ in layers)
+    star_layers = []
+    for weight, size, speed in layers:
         shade = 120 + int(120 * (speed / 3.0))
-        color = (shade, shade, 255)
-        stars.append({"x": x, "y": y, "size": size, "speed": speed, "color": color})
-    return stars
-
-def draw_stars(screen, stars):
-    for s in stars:
-        s["y"] += s["speed"]
-        if s["y"] > config.SCREEN_H:
-            s["y"] = -s["size"]
-            s["x"] = random.randint(0, config.SCREEN_W - 1)
-            s["speed"] = random.uniform(0.5, 2.0) * (1 + s["size"] * 0.2)
-        screen.fill(s["color"], (int(s["x"]), int(s["y"]), s["size"], s["size"]))
+        star_layers.append(StarLayer(round(count * weight / total), size, speed, (shade, shade, 255), rng=rng))
+    return Starfield(star_layers)
+
+def draw_stars(screen, stars, renderer=None):
+    renderer = renderer or default_renderer()
+    stars.update()
+    stars.draw(renderer)
+    renderer.flush(screen)
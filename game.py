@@ -1,18 +1,19 @@
+import itertools
+import os
+import time
+
+# Reference point for the startup metrics: as early as the game module allows
+_STARTED = time.perf_counter()
+
 import pygame
-import random
 import config
-from sprites import Player, Enemy, Bullet, PowerUp
-from effects import add_explosion, update_draw_explosions, create_stars, draw_stars
-from ui import Menu
-
-try:
-    import pygame
-    PYGAME_OK = True
-    _PYGAME_IMPORT_ERR = None
-except Exception as e:
-    pygame = None
-    PYGAME_OK = False
-    _PYGAME_IMPORT_ERR = e
+from sprites import assets, Player, SpritePools, ProjectileField
+from effects import ParticleSystem, EffectsRenderer, add_explosion, create_stars, quality
+from physics import CollisionWorld
+from render import DirtyRegions, create_backend
+from ui import Menu, text_cache
+from sim import RealClock, VirtualClock, KeyboardInput, InputRecorder, WaveScheduler, streams, state_hash, wave_table
+from profiling import profiler, draw_profiler_overlay, OVERLAY_RECT
 
 def reset_game_state(settings):
     diff_config = settings.get_difficulty_config()
@@ -21,39 +22,73 @@ def reset_game_state(settings):
         "level": 1,
         "wave": 0,
         "game_over": False,
-        "explosions": [],
-        "stars": create_stars(140),
-        "spawn_ms": diff_config["spawn_ms"],
+        "paused": False,
+        "explosions": ParticleSystem(rng=streams.numpy("particles")),
+        "stars": create_stars(config.STAR_COUNT, rng=streams.get("stars")),
         "powerup_chance": diff_config["powerup_chance"],
-        "spawn_decrease": diff_config["spawn_decrease"],
         "score_multiplier": diff_config["multiplier"],
     }
 
 class Game:
-    def __init__(self):
-        if not PYGAME_OK:
-            raise RuntimeError(f"Pygame import failed: {_PYGAME_IMPORT_ERR}")
-        
-        pygame.init()
-        pygame.display.set_caption("Top-Down Arcade")
-        self.screen = pygame.display.set_mode((config.SCREEN_W, config.SCREEN_H))
-        self.clock = pygame.time.Clock()
-        self.font = pygame.font.SysFont("arial", 28, bold=True)
-        self.big_font = pygame.font.SysFont("arial", 60, bold=True)
-        self.small_font = pygame.font.SysFont("arial", 22, bold=True)
-        self.tiny_font = pygame.font.SysFont("arial", 16)
-        
-        self.menu = Menu(self.screen, self.font, self.big_font)
+    def __init__(self, headless=False, controls=None, record_path=config.RECORD_PATH, backend=None):
+        # Headless: no window, virtual time and scripted input (see sim.headless)
+        self.headless = headless
+        if headless:
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
+            # Keep SIGINT/SIGTERM default so worker processes can be stopped normally
+            os.environ["SDL_NO_SIGNAL_HANDLERS"] = "1"
+        
+        # Only the modules the game uses: no mixer, joystick or other subsystems to open
+        pygame.display.init()
+        pygame.font.init()
+        # Blit backend draws into the window surface; the texture backend gives a layer
+        # surface for software-drawn UI and copies the world from textures
+        self.backend = create_backend(backend, (config.SCREEN_W, config.SCREEN_H), "Top-Down Arcade")
+        self.screen = self.backend.screen
+        # Models come from the baked pack when it is current; otherwise they are drawn
+        # lazily (convert_alpha needs the window) or while the menu idles
+        assets.clear()
+        assets.load_pack(config.ASSET_PACK_PATH)
+        self.clock = VirtualClock() if headless else RealClock()
+        self.controls = controls or KeyboardInput()
+        self.record_path = record_path
+        self.recorder = None
+        self.seed = None
+        self.fx = self.backend.fx if self.backend.textured else EffectsRenderer()
+        self.pools = SpritePools()
+        self.dirty = DirtyRegions()
+        
+        self.menu = Menu(self.screen)
+        quality.select(self.menu.settings.quality)
+        if self.backend.textured:
+            self.menu.dirty.output = self.backend.present_rects
+        self._warmup = itertools.chain(assets.bake_iter(), self.menu.bake_iter())
+        self.startup = {"menu_frame_ms": None, "game_frame_ms": None}
+        self._game_requested = None
         self.in_menu = True
         self.in_game = False
         self.fps_clock = pygame.time.Clock()
         self.start_transition = 0
         self.transition_duration = 60
         
+        # Frozen frame (pause / game over): world + overlay composited once
+        self.frozen = None
+        
+        # Fixed-timestep simulation: game time advances only in whole ticks
+        self.step_ms = 1000.0 / config.SIM_HZ
+        self.sim_ms = 0.0
+        self.sim_ticks = 0
+        self.accumulator = 0.0
+        self.alpha = 1.0
+        self._prev_rects = {}
+        
         self.running = True
 
     def show_menu(self):
+        self.menu.dirty.invalidate()
         while self.running and self.in_menu:
+            frame_start = time.perf_counter()
             result = self.menu.handle_events()
             self.menu.update()
             
@@ -64,72 +99,232 @@ class Game:
                 self.in_menu = False
                 self.in_game = True
                 self.start_transition = self.transition_duration
+                self._game_requested = time.perf_counter()
                 self.start_game()
             
             self.menu.draw()
+            quality.observe((time.perf_counter() - frame_start) * 1000)
+            if self.startup["menu_frame_ms"] is None:
+                self._mark_startup("menu_frame_ms", _STARTED, "first menu frame")
+            self.warm_up()
             self.clock.tick(60)
 
-    def start_game(self):
+    def warm_up(self, budget_ms=config.WARMUP_BUDGET_MS):
+        """Run deferred startup work (asset and title baking) for at most budget_ms.
+
+        Returns False once everything is baked. Anything the game needs before that
+        is simply baked on first use.
+        """
+        if self._warmup is None:
+            return False
+        deadline = time.perf_counter() + budget_ms / 1000.0
+        for _ in self._warmup:
+            if time.perf_counter() >= deadline:
+                return True
+        self._warmup = None
+        # Everything is baked now: refresh a missing or outdated asset pack for the next start
+        if assets.pack_stale and config.ASSET_PACK_PATH:
+            try:
+                assets.save_pack(config.ASSET_PACK_PATH)
+            except OSError as e:
+                print(f"Asset pack not saved: {e}")
+        return False
+
+    def _mark_startup(self, metric, since, label):
+        ms = (time.perf_counter() - since) * 1000.0
+        self.startup[metric] = ms
+        if config.STARTUP_METRICS and not self.headless:
+            print(f"Startup: {label} after {ms:.0f} ms")
+
+    def start_game(self, seed=config.SEED):
+        self.save_recording()
+        
+        # Every session is reproducible from its seed and the per-tick input
+        self.seed = streams.reseed(seed)
+        self.sim_ticks = 0
+        self.sim_ms = 0.0
+        if self.record_path:
+            self.recorder = InputRecorder(self.seed, self.menu.settings.difficulty)
+        
         self.state = reset_game_state(self.menu.settings)
         self.difficulty_config = self.menu.settings.get_difficulty_config()
         
+        # Возвращаем спрайты прошлой сессии в пулы
+        if hasattr(self, "all_sprites"):
+            for sprite in self.all_sprites.sprites():
+                sprite.kill()
+            self.waves.clear()
+        
         self.all_sprites = pygame.sprite.Group()
         self.bullets = pygame.sprite.Group()
         self.enemies = pygame.sprite.Group()
         self.powerups = pygame.sprite.Group()
+        self.projectiles = ProjectileField()
+        self.collisions = CollisionWorld(precise=config.PRECISE_COLLISIONS)
+        self.dirty.invalidate()
+        self.frozen = None
+        self.accumulator = 0.0
+        self.alpha = 1.0
+        self._prev_rects = {}
         
         self.player = Player(config.SCREEN_W // 2, config.SCREEN_H - 60)
         self.all_sprites.add(self.player)
         
-        self.spawn_event = pygame.USEREVENT + config.SPAWN_EVENT_ID
-        pygame.time.set_timer(self.spawn_event, int(self.state["spawn_ms"]))
+        # Spawns come from the precomputed wave table of the difficulty, in simulation ticks
+        self.waves = WaveScheduler(wave_table(self.menu.settings.difficulty, self.step_ms), self.pools.enemy)
+
+    def save_recording(self):
+        """Write the input recording of the current session (with its final state hash)"""
+        if self.recorder is None:
+            return
+        recording = self.recorder.recording
+        self.recorder = None
+        if len(recording):
+            recording.final_hash = state_hash(self)
+            recording.save(self.record_path)
+
+    def now(self):
+        """Game time in ms; advances only with simulation ticks, so pauses do not count"""
+        return int(self.sim_ms)
 
     def handle_events(self):
         for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
-            elif event.type == self.spawn_event and not self.state["game_over"]:
-                self.spawn_enemy()
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    self.in_menu = True
-                    self.in_game = False
-                    pygame.time.set_timer(self.spawn_event, 0)
-                    return
-                if self.state["game_over"] and event.key == pygame.K_r:
-                    self.start_game()
-
-    def spawn_enemy(self):
-        difficulty = 1.0 + (self.state["level"] - 1) * 0.25
-        enemy = Enemy(difficulty)
-        self.enemies.add(enemy)
-        self.all_sprites.add(enemy)
-        self.state["wave"] += 1
-        
-        if self.state["wave"] % 8 == 0:
-            self.state["level"] += 1
-            self.state["spawn_ms"] = max(
-                300,
-                self.state["spawn_ms"] - self.state["spawn_decrease"]
-            )
-            pygame.time.set_timer(self.spawn_event, int(self.state["spawn_ms"]))
+            if self.handle_event(event):
+                return
+
+    def handle_event(self, event):
+        """Handle one event; returns True when the game was left for the menu"""
+        if event.type == pygame.QUIT:
+            self.running = False
+        elif event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE) and self.frozen is not None:
+            self.backend.show(self.frozen)
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                self.in_menu = True
+                self.in_game = False
+                self.frozen = None
+                if self.state["paused"]:
+                    self.set_paused(False)
+                self.save_recording()
+                return True
+            if event.key == pygame.K_F3:
+                profiler.enabled = not profiler.enabled
+                profiler.clear()
+                self.dirty.invalidate()
+            elif event.key == pygame.K_F4 and profiler.frame_count:
+                print(f"Frame trace written to {profiler.export_chrome_trace()}")
+            elif self.state["game_over"] and event.key == pygame.K_r:
+                self.start_game()
+            elif not self.state["game_over"] and event.key in (pygame.K_p, pygame.K_PAUSE):
+                self.set_paused(not self.state["paused"])
+        return False
+
+    def set_paused(self, paused):
+        if paused == self.state["paused"]:
+            return
+        self.state["paused"] = paused
+        if paused:
+            self.freeze(self._draw_pause)
+        else:
+            self.unfreeze()
+
+    def freeze(self, draw_overlay):
+        """Capture the current world frame once and composite the overlay onto it.
+
+        While frozen the loop only waits for input (see wait_frozen), so nothing is
+        simulated, redrawn or re-rendered until the frame is released.
+        """
+        self.dirty.invalidate()
+        if self.backend.textured:
+            self._draw_textured(self.now())
+        else:
+            self._track_dirty(self.now())
+            self._draw_world(self.now())
+        frame = self.backend.capture()
+        draw_overlay(frame)
+        self.frozen = frame
+        self.backend.show(frame)
+
+    def unfreeze(self):
+        self.frozen = None
+        self.dirty.invalidate()
+        # Do not let the frozen time leak into the next frame delta
+        self.clock.tick()
+        self.accumulator = 0.0
+
+    def wait_frozen(self):
+        """Block on the event queue instead of ticking at full frame rate"""
+        event = pygame.event.wait(config.FROZEN_WAIT_MS)
+        if event.type != pygame.NOEVENT and not self.handle_event(event):
+            self.handle_events()
+
+    def spawn_batch(self, batch):
+        """Activate enemies the wave scheduler prepared in advance"""
+        for enemy in batch.enemies:
+            enemy.add(self.enemies, self.all_sprites)
+        if batch.wave:
+            self.state["wave"] = batch.wave
+            self.state["level"] = 1 + batch.wave // config.WAVES_PER_LEVEL
+
+    def advance(self, dt):
+        """Run as many fixed ticks as the elapsed real time allows; returns the tick count.
+
+        At most MAX_CATCHUP_STEPS ticks run per frame, the rest of a long stall is dropped
+        so a slow frame cannot snowball. The leftover fraction of a tick becomes
+        self.alpha, which the renderer uses to interpolate between the last two ticks.
+        """
+        self.accumulator = min(self.accumulator + dt, self.step_ms * config.MAX_CATCHUP_STEPS)
+        steps = 0
+        while self.accumulator >= self.step_ms:
+            self.accumulator -= self.step_ms
+            self.step()
+            steps += 1
+            if self.state["game_over"]:
+                self.accumulator = 0.0
+                break
+        self.alpha = self.accumulator / self.step_ms if config.INTERPOLATE else 1.0
+        return steps
+
+    def step(self):
+        """Advance the simulation by exactly one tick"""
+        self._prev_rects = {sprite: sprite.rect.topleft for sprite in self.all_sprites}
+        self.sim_ms += self.step_ms
+        self.sim_ticks += 1
+        if not self.state["game_over"]:
+            for batch in self.waves.due(self.sim_ticks):
+                self.spawn_batch(batch)
+        with profiler.span("update"):
+            self.update(self.now())
+        with profiler.span("update/effects"), self.fx.timed():
+            self.state["stars"].update()
+            self.state["explosions"].update()
 
     def update(self, now):
-        if self.state["game_over"]:
+        if self.state["game_over"] or self.state["paused"]:
             return
         
-        keys = pygame.key.get_pressed()
-        self.player.update(keys, now)
-        
-        if keys[pygame.K_SPACE]:
-            self.player.try_shoot(now, self.bullets, self.all_sprites)
-        
-        self.bullets.update()
-        self.enemies.update()
-        self.powerups.update()
+        with profiler.span("update/player"):
+            keys = self.controls.poll(self.sim_ticks, self)
+            if self.recorder is not None:
+                keys = self.recorder.record(keys)
+            self.player.update(keys, now)
+            
+            if keys[pygame.K_SPACE]:
+                if config.VECTOR_PROJECTILES:
+                    self.player.fire(now, self.projectiles)
+                else:
+                    self.player.try_shoot(now, self.bullets, self.all_sprites, self.pools.bullet)
+        
+        with profiler.span("update/groups"):
+            self.bullets.update()
+            self.projectiles.update()
+            self.enemies.update()
+            self.powerups.update()
         
         # Столкновения пуль и врагов
-        hits = pygame.sprite.groupcollide(self.enemies, self.bullets, False, True)
+        with profiler.span("collide/bullets"):
+            hits = self.collisions.groupcollide(self.enemies, self.bullets, False, True)
+            hits.update(self.projectiles.collide(self.enemies.sprites(), precise=config.PRECISE_COLLISIONS))
         if hits:
             for enemy, blts in hits.items():
                 if enemy.damage():
@@ -137,16 +332,17 @@ class Game:
                     score_gain = int(10 * self.state["level"] * self.state["score_multiplier"])
                     self.state["score"] += score_gain
                     
-                    if random.random() < self.state["powerup_chance"]:
-                        ptype = random.choice(config.POWERUP_TYPES)
-                        powerup = PowerUp(enemy.rect.centerx, enemy.rect.centery, ptype)
-                        self.powerups.add(powerup)
-                        self.all_sprites.add(powerup)
+                    drops = streams.get("powerups")
+                    if drops.random() < self.state["powerup_chance"]:
+                        ptype = drops.choice(config.POWERUP_TYPES)
+                        self.pools.powerup.acquire(enemy.rect.centerx, enemy.rect.centery, ptype,
+                                                   groups=(self.powerups, self.all_sprites))
                     
                     enemy.kill()
         
         # Столкновения врагов с игроком
-        crush = pygame.sprite.spritecollide(self.player, self.enemies, True)
+        with profiler.span("collide/player"):
+            crush = self.collisions.spritecollide(self.player, self.enemies, True)
         if crush:
             add_explosion(self.state["explosions"], self.player.rect.centerx, self.player.rect.centery, config.PLAYER_COLOR, intensity=2.0)
             self.player.damage(now)
@@ -154,7 +350,8 @@ class Game:
                 self.state["game_over"] = True
         
         # Столкновения с бонусами
-        pups = pygame.sprite.spritecollide(self.player, self.powerups, True)
+        with profiler.span("collide/powerups"):
+            pups = self.collisions.spritecollide(self.player, self.powerups, True)
         for pup in pups:
             if pup.ptype == "health":
                 self.player.heal(1)
@@ -176,9 +373,6 @@ class Game:
         value_font_size = 24
         row_height = 45
         
-        # Create smaller font for labels
-        label_font = pygame.font.SysFont("arial", label_font_size, bold=True)
-        
         # Draw background panel
         panel_width = 160
         panel_height = len(hud_data) * row_height + 15
@@ -188,8 +382,8 @@ class Game:
         # Draw HUD items with labels above values
         current_y = y_offset
         for label, value, color in hud_data:
-            label_txt = label_font.render(label, True, (150, 150, 150))
-            value_txt = self.font.render(value, True, color)
+            label_txt = text_cache.render(label, (150, 150, 150), label_font_size, bold=True)
+            value_txt = text_cache.render(value, color, 28, bold=True)
             
             self.screen.blit(label_txt, (x_offset + 10, current_y))
             self.screen.blit(value_txt, (x_offset + 10, current_y + 18))
@@ -200,8 +394,8 @@ class Game:
         right_x = config.SCREEN_W - right_panel_width - 10
         right_y = 15
         
-        difficulty_label = label_font.render("DIFFICULTY", True, (150, 150, 150))
-        difficulty_value = self.font.render(self.menu.settings.difficulty, True, (200, 150, 100))
+        difficulty_label = text_cache.render("DIFFICULTY", (150, 150, 150), label_font_size, bold=True)
+        difficulty_value = text_cache.render(self.menu.settings.difficulty, (200, 150, 100), 28, bold=True)
         
         right_panel_height = 60
         pygame.draw.rect(self.screen, (0, 0, 0, 140), (right_x - 8, right_y - 8, right_panel_width, right_panel_height), border_radius=10)
@@ -213,15 +407,18 @@ class Game:
         # FPS counter (bottom-right)
         if self.menu.settings.show_fps:
             fps = self.clock.get_fps()
-            fps_txt = self.tiny_font.render(f"FPS: {int(fps)}", True, (100, 255, 100))
+            fps_txt = text_cache.render(f"FPS: {int(fps)}", (100, 255, 100), 16)
             fps_bg_width = 100
             fps_bg_height = 28
             pygame.draw.rect(self.screen, (0, 0, 0, 140), (config.SCREEN_W - fps_bg_width - 10, config.SCREEN_H - 35, fps_bg_width, fps_bg_height), border_radius=8)
             pygame.draw.rect(self.screen, (100, 200, 100), (config.SCREEN_W - fps_bg_width - 10, config.SCREEN_H - 35, fps_bg_width, fps_bg_height), 2, border_radius=8)
             self.screen.blit(fps_txt, (config.SCREEN_W - fps_bg_width - 5, config.SCREEN_H - 30))
+            
+            # Статистика эффектов: число blit'ов и время на эффекты за кадр
+            fx_txt = text_cache.render(f"FX: {self.fx.blit_count} / {self.fx.effects_ms:.1f}ms {quality.name}", (150, 150, 150), 16)
+            self.screen.blit(fx_txt, (config.SCREEN_W - fx_txt.get_width() - 10, config.SCREEN_H - 58))
 
-    def _draw_powerup_indicators(self, now):
-        """Draw powerup indicators as enhanced icons at the right edge"""
+    def _active_powerups(self, now):
         powerups_active = []
         
         if now < self.player.shield_until:
@@ -236,45 +433,54 @@ class Game:
         if now < self.player.dual_shot_until:
             remaining = int((self.player.dual_shot_until - now) / 1000)
             powerups_active.append(("DUAL", remaining, (200, 100, 255), "⬣"))
-        
-        if not powerups_active:
-            return
-        
+        return powerups_active
+
+    def _powerup_indicators_origin(self, count):
         # Right edge positioning - moved closer to edge
         icon_size = 55
         spacing = 75
         padding = 5
         start_x = config.SCREEN_W - icon_size - padding
-        start_y = config.SCREEN_H // 2 - (len(powerups_active) * spacing) // 2
+        start_y = config.SCREEN_H // 2 - (count * spacing) // 2
+        return start_x, start_y, icon_size, spacing
+
+    def _draw_powerup_indicators(self, now):
+        """Draw powerup indicators as enhanced icons at the right edge"""
+        powerups_active = self._active_powerups(now)
+        if not powerups_active:
+            return
+        
+        start_x, start_y, icon_size, spacing = self._powerup_indicators_origin(len(powerups_active))
         
         for idx, (name, remaining, color, symbol) in enumerate(powerups_active):
             x = start_x
             y = start_y + idx * spacing
             
-            # Draw outer glow effect
-            glow_color = tuple(min(255, c + 50) for c in color)
-            pygame.draw.circle(self.screen, glow_color, (x, y), icon_size // 2 + 3, 1)
+            # Draw outer glow effect (skipped on low quality tiers)
+            if quality.indicator_glow:
+                glow_color = tuple(min(255, c + 50) for c in color)
+                pygame.draw.circle(self.screen, glow_color, (x, y), icon_size // 2 + 3, 1)
             
             # Draw main icon circle with gradient effect (multiple circles for depth)
             pygame.draw.circle(self.screen, color, (x, y), icon_size // 2)
-            dark_color = tuple(max(0, c - 40) for c in color)
-            pygame.draw.circle(self.screen, dark_color, (x - 5, y - 5), icon_size // 2 - 3)
+            if quality.indicator_glow:
+                dark_color = tuple(max(0, c - 40) for c in color)
+                pygame.draw.circle(self.screen, dark_color, (x - 5, y - 5), icon_size // 2 - 3)
             
             # Draw white border
             pygame.draw.circle(self.screen, (255, 255, 255), (x, y), icon_size // 2, 3)
             
             # Draw inner highlight
-            pygame.draw.circle(self.screen, (255, 255, 255), (x - 8, y - 8), 6)
+            if quality.indicator_glow:
+                pygame.draw.circle(self.screen, (255, 255, 255), (x - 8, y - 8), 6)
             
             # Draw powerup name
-            name_font = pygame.font.SysFont("arial", 10, bold=True)
-            name_txt = name_font.render(name, True, (255, 255, 255))
+            name_txt = text_cache.render(name, (255, 255, 255), 10, bold=True)
             name_rect = name_txt.get_rect(center=(x, y))
             self.screen.blit(name_txt, (name_rect.x, name_rect.y - 2))
             
             # Draw remaining time in a small badge below
-            time_font = pygame.font.SysFont("arial", 12, bold=True)
-            time_txt = time_font.render(f"{remaining}s", True, (255, 255, 255))
+            time_txt = text_cache.render(f"{remaining}s", (255, 255, 255), 12, bold=True)
             
             # Draw time badge background
             badge_x = x - 18
@@ -283,27 +489,136 @@ class Game:
             pygame.draw.rect(self.screen, (0, 0, 0), (badge_x - 2, badge_y - 2, 40, 18), 1, border_radius=4)
             self.screen.blit(time_txt, (badge_x + 2, badge_y - 1))
 
+    def _track_dirty(self, now):
+        """Collect changed regions; returns True when the frame should be redrawn in full"""
+        dirty = self.dirty
+        dirty.begin()
+        
+        # Moving sprites, effect bounding boxes and scrolled stars
+        self._sprite_rects = self._interpolated_rects()
+        for sprite, rect in self._sprite_rects.items():
+            dirty.track(sprite, rect, sprite.image)
+        dirty.track("projectiles", self.projectiles.bounds(self.alpha))
+        dirty.track("explosions", self.state["explosions"].bounds(self.alpha))
+        for rect in self.state["stars"].dirty_rects():
+            dirty.add(rect)
+        
+        # HUD blocks are marked only when their values change
+        dirty.track("hud/stats", (7, 7, 160, 150), (self.state["score"], self.state["level"], self.state["wave"]))
+        dirty.track("hud/difficulty", (config.SCREEN_W - 238, 7, 220, 60), self.menu.settings.difficulty)
+        dirty.track("hud/health", (config.SCREEN_W // 2 - 132, config.SCREEN_H - 35, 216, 24), self.player.hp)
+        # Antialiased label over the background: restored every frame so its edges don't blend over themselves
+        label, pos = self._health_label()
+        dirty.add(label.get_rect(topleft=pos))
+        powerups_active = self._active_powerups(now)
+        if powerups_active:
+            x, start_y, _, spacing = self._powerup_indicators_origin(len(powerups_active))
+            rect = (x - 35, start_y - 32, 95, (len(powerups_active) - 1) * spacing + 80)
+            dirty.track("hud/powerups", rect, tuple((name, remaining) for name, remaining, _, _ in powerups_active))
+        if self.menu.settings.show_fps:
+            dirty.add((config.SCREEN_W - 240, config.SCREEN_H - 60, 240, 60))
+        if profiler.enabled:
+            dirty.add(OVERLAY_RECT)
+        return dirty.end()
+
+    def _interpolated_rects(self):
+        """Sprite rects to draw: between the previous and the current tick by self.alpha"""
+        alpha = self.alpha
+        prev = self._prev_rects
+        rects = {}
+        for sprite in self.all_sprites:
+            rect = sprite.rect
+            old = prev.get(sprite)
+            if old is not None and alpha < 1.0:
+                dx, dy = rect.x - old[0], rect.y - old[1]
+                if abs(dx) + abs(dy) <= config.INTERPOLATE_MAX_JUMP:
+                    rect = rect.move(round(dx * (alpha - 1.0)), round(dy * (alpha - 1.0)))
+            rects[sprite] = rect
+        return rects
+
     def draw(self):
-        self.screen.fill(config.BG_COLOR)
-        draw_stars(self.screen, self.state["stars"])
-        self.all_sprites.draw(self.screen)
-        update_draw_explosions(self.screen, self.state["explosions"])
+        now = self.now()
+        # Starfield density follows the quality tier; a change needs a full redraw
+        if self.state["stars"].set_density(quality.stars):
+            self.dirty.invalidate()
+        if self.backend.textured:
+            self._draw_textured(now)
+            with profiler.span("draw/present"):
+                self.backend.present()
+            return
+        with profiler.span("draw/track"):
+            self._track_dirty(now)
+        self._draw_world(now)
+        with profiler.span("draw/present"):
+            self.dirty.present()
+
+    def _draw_world(self, now):
+        stars = self.state["stars"]
+        explosions = self.state["explosions"]
+        
+        # Full redraw, or restore the background only inside dirty rects
+        with profiler.span("draw/stars"):
+            if self.dirty.full:
+                self.screen.fill(config.BG_COLOR)
+                with self.fx.timed():
+                    stars.draw(self.fx)
+                    self.fx.flush(self.screen)
+            else:
+                with self.fx.timed():
+                    stars.restore(self.screen, self.dirty.rects)
         
-        now = pygame.time.get_ticks()
+        with profiler.span("draw/sprites"):
+            self.screen.blits([(sprite.image, rect) for sprite, rect in self._sprite_rects.items()], doreturn=False)
+            self.projectiles.draw(self.screen, self.alpha)
+        with profiler.span("draw/explosions"), self.fx.timed():
+            explosions.draw(self.fx, self.alpha)
+            self.fx.flush(self.screen)
         
         # Draw enhanced HUD
-        self._draw_hud(now)
+        with profiler.span("draw/hud"):
+            self._draw_hud(now)
         
         # Powerup indicators (visual icons)
-        self._draw_powerup_indicators(now)
+        with profiler.span("draw/indicators"):
+            self._draw_powerup_indicators(now)
         
         # Полоска здоровья игрока
-        self._draw_player_health_bar()
-        
-        if self.state["game_over"]:
-            self._draw_game_over()
+        with profiler.span("draw/hud"):
+            self._draw_player_health_bar()
         
-        pygame.display.flip()
+        # Frame-time graph of the profiler, drawn last so it stays on top
+        if profiler.enabled:
+            draw_profiler_overlay(self.screen, profiler)
+
+    def _draw_textured(self, now):
+        """Texture backend: the whole frame is rebuilt each time, the world from textures
+        and the HUD from a software layer on top. Presenting is left to the caller."""
+        backend = self.backend
+        backend.clear(config.BG_COLOR)
+        with profiler.span("draw/stars"), self.fx.timed():
+            self.state["stars"].draw(self.fx)
+            self.fx.flush()
+        
+        with profiler.span("draw/sprites"):
+            self._sprite_rects = self._interpolated_rects()
+            backend.copy_many((sprite.image, rect) for sprite, rect in self._sprite_rects.items())
+            self.projectiles.blit_count = self.projectiles.count
+            backend.copy_many(self.projectiles.items(self.alpha))
+        with profiler.span("draw/explosions"), self.fx.timed():
+            self.state["explosions"].draw(self.fx, self.alpha)
+            self.fx.flush()
+        
+        with profiler.span("draw/hud"):
+            self.screen.fill((0, 0, 0, 0))
+            self._draw_hud(now)
+        with profiler.span("draw/indicators"):
+            self._draw_powerup_indicators(now)
+        with profiler.span("draw/hud"):
+            self._draw_player_health_bar()
+        if profiler.enabled:
+            draw_profiler_overlay(self.screen, profiler)
+        with profiler.span("draw/layer"):
+            backend.draw_layer()
 
     def _draw_player_health_bar(self):
         bar_x = config.SCREEN_W // 2 - 80
@@ -319,43 +634,72 @@ class Game:
         pygame.draw.rect(self.screen, color, (bar_x, bar_y, int(fill_width), bar_height), border_radius=3)
         pygame.draw.rect(self.screen, (200, 220, 255), (bar_x, bar_y, bar_width, bar_height), 2, border_radius=3)
         
-        hp_text = self.tiny_font.render(f"HP: {max(0, self.player.hp)}", True, (200, 220, 255))
-        self.screen.blit(hp_text, (bar_x - 50, bar_y - 3))
+        self.screen.blit(*self._health_label())
+
+    def _health_label(self):
+        """The "HP: n" text and its position left of the health bar"""
+        hp_text = text_cache.render(f"HP: {max(0, self.player.hp)}", (200, 220, 255), 16)
+        return hp_text, (config.SCREEN_W // 2 - 130, config.SCREEN_H - 33)
 
-    def _draw_game_over(self):
+    def _draw_game_over(self, surface):
         overlay = pygame.Surface((config.SCREEN_W, config.SCREEN_H), pygame.SRCALPHA)
         overlay.fill((0, 0, 0, 180))
-        self.screen.blit(overlay, (0, 0))
+        surface.blit(overlay, (0, 0))
         
-        txt1 = self.big_font.render("GAME OVER", True, (255, 100, 100))
-        txt2 = self.font.render(f"Score: {self.state['score']} | Lv: {self.state['level']} | Wave: {self.state['wave']}", True, config.UI_COLOR)
-        txt3 = self.font.render(f"Difficulty: {self.menu.settings.difficulty}", True, (200, 150, 100))
-        txt4 = self.font.render("R - restart   ESC - menu", True, config.UI_COLOR)
+        txt1 = text_cache.render("GAME OVER", (255, 100, 100), 60, bold=True)
+        surface.blit(txt1, txt1.get_rect(center=(config.SCREEN_W // 2, config.SCREEN_H // 2 - 60)))
         
-        self.screen.blit(txt1, txt1.get_rect(center=(config.SCREEN_W // 2, config.SCREEN_H // 2 - 60)))
+        txt2 = text_cache.render(f"Score: {self.state['score']}  |  Level: {self.state['level']}  |  Wave: {self.state['wave']}", (200, 220, 255), 28, bold=True)
+        surface.blit(txt2, txt2.get_rect(center=(config.SCREEN_W // 2, config.SCREEN_H // 2)))
         
-        txt2 = self.font.render(f"Score: {self.state['score']}  |  Level: {self.state['level']}  |  Wave: {self.state['wave']}", True, (200, 220, 255))
-        self.screen.blit(txt2, txt2.get_rect(center=(config.SCREEN_W // 2, config.SCREEN_H // 2)))
+        txt3 = text_cache.render(f"Difficulty: {self.menu.settings.difficulty}", (220, 160, 100), 28, bold=True)
+        surface.blit(txt3, txt3.get_rect(center=(config.SCREEN_W // 2, config.SCREEN_H // 2 + 50)))
         
-        txt3 = self.font.render(f"Difficulty: {self.menu.settings.difficulty}", True, (220, 160, 100))
-        self.screen.blit(txt3, txt3.get_rect(center=(config.SCREEN_W // 2, config.SCREEN_H // 2 + 50)))
+        txt4 = text_cache.render("Press [R] to restart  or  [ESC] for menu", (150, 200, 150), 28, bold=True)
+        surface.blit(txt4, txt4.get_rect(center=(config.SCREEN_W // 2, config.SCREEN_H // 2 + 110)))
+
+    def _draw_pause(self, surface):
+        overlay = pygame.Surface((config.SCREEN_W, config.SCREEN_H), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 140))
+        surface.blit(overlay, (0, 0))
         
-        txt4 = self.font.render("Press [R] to restart  or  [ESC] for menu", True, (150, 200, 150))
-        self.screen.blit(txt4, txt4.get_rect(center=(config.SCREEN_W // 2, config.SCREEN_H // 2 + 110)))
+        txt1 = text_cache.render("PAUSED", (100, 200, 255), 60, bold=True)
+        surface.blit(txt1, txt1.get_rect(center=(config.SCREEN_W // 2, config.SCREEN_H // 2 - 30)))
+        
+        txt2 = text_cache.render("[P] resume  |  [ESC] menu", (150, 200, 150), 28, bold=True)
+        surface.blit(txt2, txt2.get_rect(center=(config.SCREEN_W // 2, config.SCREEN_H // 2 + 30)))
 
     def run(self):
         self.show_menu()
         
         while self.running and self.in_game:
+            if self.frozen is not None:
+                self.wait_frozen()
+                if not self.in_game and self.in_menu:
+                    self.show_menu()
+                continue
+            
             dt = self.clock.tick(config.FPS)
-            now = pygame.time.get_ticks()
+            # Quality governor sees the frame's work only, not the sleep inside clock.tick
+            frame_start = time.perf_counter()
+            self.fx.begin_frame()
+            profiler.begin_frame()
             
-            self.handle_events()
+            with profiler.span("handle_events"):
+                self.handle_events()
             
-            if self.in_game:
-                self.update(now)
-                self.draw()
+            if self.in_game and self.frozen is None:
+                self.advance(dt)
+                if self.state["game_over"]:
+                    self.freeze(self._draw_game_over)
+                else:
+                    self.draw()
+                    quality.observe((time.perf_counter() - frame_start) * 1000)
+                    if self.startup["game_frame_ms"] is None and self._game_requested is not None:
+                        self._mark_startup("game_frame_ms", self._game_requested, "first gameplay frame (from start)")
             elif self.in_menu:
                 self.show_menu()
+            profiler.end_frame()
         
+        self.save_recording()
         pygame.quit()
@@ -1,27 +1,14 @@
 #!/usr/bin/env python3
 """
-Description of the script and its purpose.
+Top-Down Arcade: entry point.
 
-This module does X and Y.
+Run from the project root: python main.py
 """
-import sys
-# Other standard library imports
-import os
-
-# Third-party library imports (if any)
-# import requests
-
-# Global variables or constants (if any), conventionally in UPPER_SNAKE_CASE
-PI_VALUE = 3.14159
+from game import Game
 
 def main():
-    """Main function to run the script logic."""
-    print("Script started.")
-    # Add your main logic here
-    print(f"PI value is: {PI_VALUE}")
-    print("Script finished.")
+    """Start the game with a window, menu first."""
+    Game().run()
 
 if __name__ == "__main__":
-    # This block is executed only when the script is run directly
-    # Can add argument parsing here if needed (e.g., using argparse)
     main()
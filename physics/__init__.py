@@ -0,0 +1,3 @@
+from .spatial_hash import SpatialHash, PointGrid, CollisionWorld, collide_rect_mask
+
+__all__ = ["SpatialHash", "PointGrid", "CollisionWorld", "collide_rect_mask"]
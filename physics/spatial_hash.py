@@ -0,0 +1,188 @@
+import numpy as np
+import pygame
+import config
+
+def collide_rect_mask(a, b):
+    """Точная проверка по маскам только для пар, уже пересёкшихся по rect"""
+    return a.rect.colliderect(b.rect) and pygame.sprite.collide_mask(a, b) is not None
+
+class SpatialHash:
+    """Равномерная сетка поверх экрана; спрайты перехешируются только при смене ячеек"""
+
+    def __init__(self, cell_size=config.COLLISION_CELL, width=config.SCREEN_W, height=config.SCREEN_H):
+        self.cell_size = cell_size
+        self.cols = max(1, -(-width // cell_size))
+        self.rows = max(1, -(-height // cell_size))
+        self.cells = {}
+        self.ranges = {}
+        self.rehashed = 0
+
+    def _range(self, rect):
+        # Объекты за краем экрана попадают в крайние ячейки
+        cs = self.cell_size
+        x0 = min(max(rect.left // cs, 0), self.cols - 1)
+        x1 = min(max((rect.right - 1) // cs, 0), self.cols - 1)
+        y0 = min(max(rect.top // cs, 0), self.rows - 1)
+        y1 = min(max((rect.bottom - 1) // cs, 0), self.rows - 1)
+        return x0, y0, x1, y1
+
+    def _cell_keys(self, rng):
+        x0, y0, x1, y1 = rng
+        cols = self.cols
+        return [y * cols + x for y in range(y0, y1 + 1) for x in range(x0, x1 + 1)]
+
+    def insert(self, sprite):
+        rect = sprite.rect
+        rng = self._range(rect)
+        self.ranges[sprite] = (rng, rect)
+        cells = self.cells
+        for key in self._cell_keys(rng):
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = {sprite: rect}
+            else:
+                bucket[sprite] = rect
+
+    def remove(self, sprite):
+        entry = self.ranges.pop(sprite, None)
+        if entry is None:
+            return
+        for key in self._cell_keys(entry[0]):
+            bucket = self.cells[key]
+            del bucket[sprite]
+            if not bucket:
+                del self.cells[key]
+
+    def sync(self, group):
+        """Приводит сетку в соответствие с группой: новые добавляет, сдвинувшиеся перехеширует"""
+        ranges = self.ranges
+        seen = set()
+        for sprite in group.sprites():
+            seen.add(sprite)
+            entry = ranges.get(sprite)
+            if entry is None:
+                self.insert(sprite)
+            elif entry[1] is not sprite.rect or entry[0] != self._range(sprite.rect):
+                # Спрайт сдвинулся в другие ячейки или получил новый rect (например, после reset() из пула)
+                self.remove(sprite)
+                self.insert(sprite)
+                self.rehashed += 1
+        if len(ranges) != len(seen):
+            for sprite in [s for s in ranges if s not in seen]:
+                self.remove(sprite)
+
+    def query(self, rect):
+        """Кандидаты {спрайт: rect}, чьи ячейки пересекаются с rect (без точной проверки)"""
+        cells = self.cells
+        keys = self._cell_keys(self._range(rect))
+        if len(keys) == 1:
+            return cells.get(keys[0], {})
+        found = {}
+        for key in keys:
+            bucket = cells.get(key)
+            if bucket:
+                found.update(bucket)
+        return found
+
+    def collide(self, rect):
+        """Спрайты, чьи rect пересекаются с rect; точная проверка выполняется в C (collidedictall)"""
+        return [sprite for sprite, _ in rect.collidedictall(self.query(rect), True)]
+
+class PointGrid:
+    """Сетка по точкам в массивах NumPy: индексы точек, отсортированные по ячейкам.
+
+    build() раскладывает точки заново (argsort по номеру ячейки), pairs() для пачки
+    прямоугольников возвращает кандидатов без цикла по прямоугольникам в Python.
+    """
+
+    def __init__(self, cell_size=config.COLLISION_CELL, width=config.SCREEN_W, height=config.SCREEN_H):
+        self.cell_size = cell_size
+        self.cols = max(1, -(-width // cell_size))
+        self.rows = max(1, -(-height // cell_size))
+        self.order = np.zeros(0, dtype=np.intp)
+        self.starts = np.zeros(self.cols * self.rows + 1, dtype=np.intp)
+
+    def build(self, x, y):
+        # Точки за краем экрана попадают в крайние ячейки, как в SpatialHash
+        cs = self.cell_size
+        cx = np.clip(x // cs, 0, self.cols - 1).astype(np.intp)
+        cy = np.clip(y // cs, 0, self.rows - 1).astype(np.intp)
+        cells = cy * self.cols + cx
+        self.order = np.argsort(cells, kind="stable")
+        self.starts = np.searchsorted(cells[self.order], np.arange(self.cols * self.rows + 1))
+
+    def pairs(self, left, top, right, bottom):
+        """Пары (номер прямоугольника, индекс точки) для точек из ячеек, задетых прямоугольниками.
+
+        Прямоугольники заданы массивами краёв; точная проверка остаётся вызывающему.
+        Пары идут по возрастанию номера прямоугольника.
+        """
+        cs, cols = self.cell_size, self.cols
+        x0 = np.clip(left // cs, 0, cols - 1).astype(np.intp)
+        x1 = np.clip(right // cs, 0, cols - 1).astype(np.intp)
+        y0 = np.clip(top // cs, 0, self.rows - 1).astype(np.intp)
+        y1 = np.clip(bottom // cs, 0, self.rows - 1).astype(np.intp)
+        # Строка ячеек прямоугольника - один непрерывный срез отсортированных точек
+        spans = y1 - y0 + 1
+        rect = np.repeat(np.arange(len(spans)), spans)
+        row = y0[rect] + np.arange(len(rect)) - np.repeat(np.cumsum(spans) - spans, spans)
+        lo = self.starts[row * cols + x0[rect]]
+        counts = self.starts[row * cols + x1[rect] + 1] - lo
+        within = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        return np.repeat(rect, counts), self.order[np.repeat(lo, counts) + within]
+
+class CollisionWorld:
+    """Замена pygame.sprite.groupcollide/spritecollide на основе SpatialHash по каждой группе"""
+
+    def __init__(self, cell_size=config.COLLISION_CELL, brute_force_pairs=config.COLLISION_BRUTE_FORCE_PAIRS,
+                 precise=False):
+        self.cell_size = cell_size
+        # Narrowphase по кэшированным маскам спрайтов (атрибут sprite.mask)
+        self.precise = precise
+        # На малом числе пар перебор в C (pygame) быстрее, чем поддержка сетки
+        self.brute_force_pairs = brute_force_pairs
+        self.hashes = {}
+
+    def _hash_for(self, group):
+        grid = self.hashes.get(group)
+        if grid is None:
+            grid = self.hashes[group] = SpatialHash(self.cell_size)
+        grid.sync(group)
+        return grid
+
+    def spritecollide(self, sprite, group, dokill):
+        """То же, что pygame.sprite.spritecollide: список спрайтов группы, задевших sprite"""
+        if len(group) <= self.brute_force_pairs:
+            collided = collide_rect_mask if self.precise else None
+            return pygame.sprite.spritecollide(sprite, group, dokill, collided)
+        grid = self._hash_for(group)
+        crashed = grid.collide(sprite.rect)
+        if self.precise:
+            crashed = [s for s in crashed if pygame.sprite.collide_mask(sprite, s)]
+        if dokill:
+            for s in crashed:
+                s.kill()
+                grid.remove(s)
+        return crashed
+
+    def groupcollide(self, group1, group2, dokill1, dokill2):
+        """То же, что pygame.sprite.groupcollide: {спрайт group1: [спрайты group2]}"""
+        if len(group1) * len(group2) <= self.brute_force_pairs:
+            collided = collide_rect_mask if self.precise else None
+            return pygame.sprite.groupcollide(group1, group2, dokill1, dokill2, collided)
+        grid = self._hash_for(group2)
+        crashed = {}
+        for s1 in group1.sprites():
+            hits = grid.collide(s1.rect)
+            if self.precise:
+                hits = [s2 for s2 in hits if pygame.sprite.collide_mask(s1, s2)]
+            if not hits:
+                continue
+            crashed[s1] = hits
+            if dokill2:
+                for s2 in hits:
+                    s2.kill()
+                    grid.remove(s2)
+            if dokill1:
+                s1.kill()
+        return crashed
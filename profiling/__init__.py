@@ -0,0 +1,4 @@
+from .profiler import FrameProfiler, profiler
+from .overlay import OVERLAY_RECT, draw_profiler_overlay
+
+__all__ = ["FrameProfiler", "profiler", "OVERLAY_RECT", "draw_profiler_overlay"]
@@ -0,0 +1,46 @@
+import pygame
+import config
+from ui.text import fonts
+
+OVERLAY_RECT = pygame.Rect(7, 165, 230, 150)
+
+# Полупрозрачные подложки по размеру, чтобы не создавать SRCALPHA-поверхность каждый кадр
+_panels = {}
+
+def _panel(size):
+    panel = _panels.get(size)
+    if panel is None:
+        panel = _panels[size] = pygame.Surface(size, pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+    return panel
+
+def draw_profiler_overlay(surface, profiler, rect=OVERLAY_RECT, frames=120):
+    """График длительности последних кадров, p50/p95/p99 и самые дорогие участки"""
+    surface.blit(_panel(rect.size), rect)
+    pygame.draw.rect(surface, (200, 150, 100), rect, 1)
+
+    budget = 1000.0 / config.FPS
+    graph = pygame.Rect(rect.x + 6, rect.y + 6, rect.w - 12, 50)
+    scale = graph.h / (2 * budget)
+    times = profiler.frame_times_ms()[-frames:]
+    bar_w = max(1, graph.w // frames)
+    for i, ms in enumerate(times.tolist()):
+        h = min(graph.h, int(ms * scale) + 1)
+        color = (100, 220, 100) if ms <= budget else (240, 80, 80)
+        surface.fill(color, (graph.x + i * bar_w, graph.bottom - h, bar_w, h))
+    # Линия бюджета кадра
+    y = graph.bottom - int(budget * scale)
+    pygame.draw.line(surface, (255, 215, 0), (graph.x, y), (graph.right, y))
+
+    # Числа меняются каждый кадр: рисуем шрифтом напрямую, не вытесняя строки HUD из text_cache
+    p = profiler.percentiles()
+    line = fonts.get(14, bold=True).render(f"p50 {p[50]:.1f}  p95 {p[95]:.1f}  p99 {p[99]:.1f} ms", True, (220, 220, 230))
+    surface.blit(line, (rect.x + 6, graph.bottom + 4))
+
+    small = fonts.get(13)
+    phases = sorted(profiler.phase_ms(frames).items(), key=lambda kv: kv[1], reverse=True)
+    y = graph.bottom + 22
+    for name, ms in phases[:4]:
+        txt = small.render(f"{name:<16} {ms:5.2f}", True, (160, 180, 200))
+        surface.blit(txt, (rect.x + 6, y))
+        y += 16
@@ -0,0 +1,151 @@
+import json
+from contextlib import nullcontext
+from time import perf_counter_ns
+import numpy as np
+import config
+
+_OFF = nullcontext()
+
+class _Span:
+    """Замер одного именованного участка; объект на имя создаётся один раз и переиспользуется"""
+    __slots__ = ("profiler", "name_id", "start")
+
+    def __init__(self, profiler, name_id):
+        self.profiler = profiler
+        self.name_id = name_id
+        self.start = 0
+
+    def __enter__(self):
+        self.profiler._depth += 1
+        self.start = perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        end = perf_counter_ns()
+        profiler = self.profiler
+        profiler._depth -= 1
+        profiler._record(self.name_id, self.start, end - self.start, profiler._depth)
+
+class FrameProfiler:
+    """Профайлер кадра: именованные участки и длительности кадров в кольцевых буферах.
+
+    Выключенный профайлер отдаёт из span() общий nullcontext, так что в игре остаётся
+    только вызов метода и проверка флага. Участки одного имени не должны вкладываться
+    сами в себя.
+    """
+
+    def __init__(self, span_capacity=config.PROFILER_SPANS, frame_capacity=config.PROFILER_FRAMES,
+                 enabled=config.PROFILER):
+        self.enabled = enabled
+        self.span_capacity = span_capacity
+        self.frame_capacity = frame_capacity
+        self._names = []
+        self._spans = {}
+        self._depth = 0
+
+        # Кольцо участков: номер имени, начало и длительность (нс), номер кадра, вложенность
+        self.span_name = np.zeros(span_capacity, dtype=np.int32)
+        self.span_start = np.zeros(span_capacity, dtype=np.int64)
+        self.span_dur = np.zeros(span_capacity, dtype=np.int64)
+        self.span_frame = np.zeros(span_capacity, dtype=np.int64)
+        self.span_depth = np.zeros(span_capacity, dtype=np.int8)
+        self.span_count = 0
+
+        # Кольцо кадров: начало и длительность (нс)
+        self.frame_start = np.zeros(frame_capacity, dtype=np.int64)
+        self.frame_dur = np.zeros(frame_capacity, dtype=np.int64)
+        self.frame_count = 0
+        self._frame_begin = None
+
+    def span(self, name):
+        if not self.enabled:
+            return _OFF
+        span = self._spans.get(name)
+        if span is None:
+            self._names.append(name)
+            span = self._spans[name] = _Span(self, len(self._names) - 1)
+        return span
+
+    def _record(self, name_id, start, dur, depth):
+        i = self.span_count % self.span_capacity
+        self.span_name[i] = name_id
+        self.span_start[i] = start
+        self.span_dur[i] = dur
+        self.span_frame[i] = self.frame_count
+        self.span_depth[i] = depth
+        self.span_count += 1
+
+    def begin_frame(self):
+        self._frame_begin = perf_counter_ns() if self.enabled else None
+
+    def end_frame(self):
+        if self._frame_begin is None:
+            return
+        i = self.frame_count % self.frame_capacity
+        self.frame_start[i] = self._frame_begin
+        self.frame_dur[i] = perf_counter_ns() - self._frame_begin
+        self.frame_count += 1
+        self._frame_begin = None
+
+    def clear(self):
+        self.span_count = 0
+        self.frame_count = 0
+        self._frame_begin = None
+
+    @staticmethod
+    def _ordered(ring, count, capacity):
+        # Содержимое кольца от старых записей к новым
+        if count <= capacity:
+            return ring[:count]
+        i = count % capacity
+        return np.concatenate((ring[i:], ring[:i]))
+
+    def frame_times_ms(self):
+        return self._ordered(self.frame_dur, self.frame_count, self.frame_capacity) / 1e6
+
+    def percentiles(self, qs=(50, 95, 99)):
+        """Перцентили длительности кадра (мс) по кадрам в буфере"""
+        times = self.frame_times_ms()
+        if not len(times):
+            return {q: 0.0 for q in qs}
+        return dict(zip(qs, np.percentile(times, qs).tolist()))
+
+    def phase_ms(self, frames=None):
+        """Среднее время участков за кадр (мс) по последним frames кадрам: {имя: мс}"""
+        n = min(self.span_count, self.span_capacity)
+        if n == 0:
+            return {}
+        frames = min(frames or self.frame_capacity, max(1, self.frame_count))
+        first = self.frame_count - frames
+        keep = self.span_frame[:n] >= first
+        totals = np.bincount(self.span_name[:n][keep], weights=self.span_dur[:n][keep], minlength=len(self._names))
+        return {name: totals[i] / frames / 1e6 for i, name in enumerate(self._names) if totals[i]}
+
+    def chrome_trace(self):
+        """Буфер в формате Chrome trace events (chrome://tracing, Perfetto)"""
+        events = []
+        n = min(self.span_count, self.span_capacity)
+        names = self._names
+        order = self._ordered(np.arange(self.span_capacity), self.span_count, self.span_capacity)[:n]
+        for i in order.tolist():
+            events.append({
+                "name": names[self.span_name[i]], "cat": "frame", "ph": "X", "pid": 1, "tid": 1,
+                "ts": int(self.span_start[i]) / 1000, "dur": int(self.span_dur[i]) / 1000,
+                "args": {"frame": int(self.span_frame[i]), "depth": int(self.span_depth[i])},
+            })
+        starts = self._ordered(self.frame_start, self.frame_count, self.frame_capacity)
+        durs = self._ordered(self.frame_dur, self.frame_count, self.frame_capacity)
+        first = self.frame_count - len(starts)
+        for k, (start, dur) in enumerate(zip(starts.tolist(), durs.tolist())):
+            events.append({
+                "name": "frame", "cat": "frame", "ph": "X", "pid": 1, "tid": 0,
+                "ts": start / 1000, "dur": dur / 1000, "args": {"frame": first + k},
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path=config.PROFILER_TRACE_PATH):
+        with open(path, "w") as f:
+            json.dump(self.chrome_trace(), f)
+        return path
+
+profiler = FrameProfiler()
@@ -0,0 +1,4 @@
+from .dirty import DirtyRegions
+from .backends import BlitBackend, create_backend
+
+__all__ = ["DirtyRegions", "BlitBackend", "create_backend"]
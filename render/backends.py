@@ -0,0 +1,34 @@
+import os
+import pygame
+import config
+
+class BlitBackend:
+    """Вывод по умолчанию: программные blit прямо в поверхность окна, display.update/flip"""
+    textured = False
+
+    def __init__(self, size=(config.SCREEN_W, config.SCREEN_H), caption=""):
+        pygame.display.set_caption(caption)
+        self.size = size
+        self.screen = pygame.display.set_mode(size)
+
+    def capture(self):
+        """Копия текущего кадра (для застывшего кадра паузы и game over)"""
+        return self.screen.copy()
+
+    def show(self, frame):
+        """Выводит готовый кадр целиком"""
+        self.screen.blit(frame, (0, 0))
+        pygame.display.flip()
+
+def create_backend(name=None, size=(config.SCREEN_W, config.SCREEN_H), caption=""):
+    """Бэкенд по имени из config.RENDER_BACKEND: "blit" или "texture" (pygame._sdl2.video)"""
+    name = name or config.RENDER_BACKEND
+    if name == "blit":
+        return BlitBackend(size, caption)
+    if name == "texture":
+        # Пакетная отправка копий в SDL и пиксельное (без сглаживания) целое увеличение
+        os.environ.setdefault("SDL_RENDER_BATCHING", "1")
+        os.environ.setdefault("SDL_RENDER_SCALE_QUALITY", "0")
+        from .textured import TextureBackend
+        return TextureBackend(size, caption)
+    raise ValueError(f"unknown render backend {name!r}")
@@ -0,0 +1,104 @@
+import pygame
+import config
+
+class DirtyRegions:
+    """Учёт изменившихся областей кадра для pygame.display.update(rects).
+
+    Каждый кадр фон восстанавливается только в грязных прямоугольниках, и только они
+    отправляются на экран. Если грязная площадь слишком велика (или прямоугольников
+    слишком много), кадр целиком перерисовывается и выводится через flip().
+    """
+
+    def __init__(self, size=(config.SCREEN_W, config.SCREEN_H), enabled=config.DIRTY_RECTS,
+                 full_ratio=config.DIRTY_FULL_RATIO, max_rects=config.DIRTY_MAX_RECTS, output=None):
+        self.bounds = pygame.Rect(0, 0, *size)
+        # output(rects или None для всего кадра) заменяет display.update/flip (бэкенд "texture")
+        self.output = output
+        self.enabled = enabled
+        self.full_ratio = full_ratio
+        self.max_rects = max_rects
+        self.rects = []
+        self._prev = {}
+        self._next = {}
+        self._force_full = True
+        self.full = True
+
+        # Статистика для отладки
+        self.full_frames = 0
+        self.partial_frames = 0
+        self.last_area = 0
+
+    def invalidate(self):
+        """Следующий кадр будет перерисован целиком (смена экрана, оверлей и т.п.)"""
+        self._force_full = True
+
+    def begin(self):
+        self.rects = []
+        self._next = {}
+
+    def add(self, rect):
+        if rect is None:
+            return
+        rect = self.bounds.clip(rect)
+        if rect.w > 0 and rect.h > 0:
+            self.rects.append(rect)
+
+    def track(self, key, rect, state=None):
+        """Запоминает объект между кадрами; при сдвиге или смене state помечает старое и новое место.
+
+        state - всё, что меняет пиксели без сдвига: текущее изображение, значения HUD и т.п.
+        """
+        entry = (pygame.Rect(rect), state) if rect is not None else None
+        prev = self._prev.get(key)
+        if entry != prev:
+            if prev is not None:
+                self.add(prev[0])
+            if entry is not None:
+                self.add(entry[0])
+        if entry is not None:
+            self._next[key] = entry
+
+    def end(self):
+        """Завершает учёт кадра и решает, рисовать ли кадр целиком"""
+        # Объекты, пропавшие с прошлого кадра, оставляют грязный след
+        for key, entry in self._prev.items():
+            if key not in self._next:
+                self.add(entry[0])
+        self._prev = self._next
+
+        # Перекрытия сливаются: иначе полупрозрачный фон и текст смешались бы дважды
+        self.rects = self._disjoint(self.rects) if len(self.rects) <= self.max_rects else self.rects
+        area = sum(r.w * r.h for r in self.rects)
+        self.last_area = area
+        self.full = (not self.enabled or self._force_full or len(self.rects) > self.max_rects
+                     or area > self.full_ratio * self.bounds.w * self.bounds.h)
+        self._force_full = False
+        return self.full
+
+    @staticmethod
+    def _disjoint(rects):
+        out = []
+        for rect in rects:
+            rect = pygame.Rect(rect)
+            hits = rect.collidelistall(out)
+            while hits:
+                for i in reversed(hits):
+                    rect.union_ip(out.pop(i))
+                hits = rect.collidelistall(out)
+            out.append(rect)
+        return out
+
+    def present(self):
+        if self.full:
+            if self.output is not None:
+                self.output(None)
+            else:
+                pygame.display.flip()
+            self.full_frames += 1
+        else:
+            if self.rects:
+                if self.output is not None:
+                    self.output(self.rects)
+                else:
+                    pygame.display.update(self.rects)
+            self.partial_frames += 1
@@ -0,0 +1,164 @@
+import weakref
+import numpy as np
+import pygame
+from pygame._sdl2.sdl2 import error as SDLError
+from pygame._sdl2.video import Window, Renderer, Texture
+import config
+from effects.render import EffectsRenderer
+
+class TextureEffects(EffectsRenderer):
+    """Пакетный рендер эффектов через Renderer.
+
+    Слои (звёзды) копируются из текстур. Частица - не запечённый спрайт, а ключ
+    (цвет, уровень альфы, размер): все частицы рисуются одной белой текстурой размера
+    с модуляцией цвета и альфы, по группам одинаковых ключей.
+    """
+
+    def __init__(self, backend, **kwargs):
+        super().__init__(**kwargs)
+        self.backend = backend
+        self._white = {}
+
+    def sprites_for(self, colors, alphas, size):
+        q = colors.astype(np.int32) // self.color_step
+        levels = alphas.astype(np.int32) * self.alpha_levels // 256
+        k = self._color_buckets
+        keys = ((((q[:, 0] * k + q[:, 1]) * k + q[:, 2]) * self.alpha_levels + levels) * 256 + size)
+        return keys.tolist()
+
+    def _white_texture(self, size):
+        tex = self._white.get(size)
+        if tex is None:
+            surf = pygame.Surface((size, size), pygame.SRCALPHA)
+            surf.fill((255, 255, 255, 255))
+            tex = self._white[size] = Texture.from_surface(self.backend.renderer, surf)
+        return tex
+
+    def _modulation(self, key):
+        # Тот же цвет и альфа, что EffectsRenderer._bake запёк бы в спрайт
+        rest, size = divmod(key, 256)
+        rest, level = divmod(rest, self.alpha_levels)
+        k = self._color_buckets
+        rest, b = divmod(rest, k)
+        r, g = divmod(rest, k)
+        step = self.color_step
+        color = tuple(min(255, c * step + step // 2) for c in (r, g, b))
+        return size, color, min(255, (level + 1) * 256 // self.alpha_levels)
+
+    def flush(self, screen=None):
+        if not self._batch:
+            return
+        backend = self.backend
+        particles = {}
+        for item in self._batch:
+            image = item[0]
+            if isinstance(image, int):
+                particles.setdefault(image, []).append(item[1])
+            else:
+                backend.copy(image, item[1], item[2] if len(item) > 2 else None)
+        for key, positions in particles.items():
+            size, color, alpha = self._modulation(key)
+            tex = self._white_texture(size)
+            tex.color = color
+            tex.alpha = alpha
+            draw = tex.draw
+            for x, y in positions:
+                draw(None, (x, y, size, size))
+        self.blit_count += len(self._batch)
+        self.batch_count += 1
+        self._batch.clear()
+
+class TextureBackend:
+    """Вывод через pygame._sdl2.video: изображения загружаются в текстуры один раз и копируются Renderer'ом.
+
+    Всё, что рисуется программно (HUD, меню, оверлеи), рисуется в прозрачный слой
+    screen и поверх мира выводится одной текстурой. Окно - целое увеличение
+    логического разрешения в config.RENDER_SCALE раз. Без GPU берётся программный
+    Renderer SDL, так что бэкенд работает везде, в том числе с SDL_VIDEODRIVER=dummy.
+    """
+    textured = True
+
+    def __init__(self, size=(config.SCREEN_W, config.SCREEN_H), caption="", scale=None,
+                 accelerated=None, vsync=None):
+        scale = max(1, int(scale or config.RENDER_SCALE))
+        accelerated = config.RENDER_ACCELERATED if accelerated is None else accelerated
+        vsync = config.RENDER_VSYNC if vsync is None else vsync
+        self.size = size
+        self.scale = scale
+        self.window = Window(caption, size=(size[0] * scale, size[1] * scale))
+        self.software = not accelerated
+        try:
+            self.renderer = Renderer(self.window, accelerated=1 if accelerated else 0, vsync=vsync)
+        except (pygame.error, SDLError):
+            self.renderer = Renderer(self.window, accelerated=0)
+            self.software = True
+        self.renderer.logical_size = size
+        self.screen = pygame.Surface(size, pygame.SRCALPHA)
+        self.fx = TextureEffects(self)
+        self._textures = weakref.WeakKeyDictionary()
+        self._layer = Texture(self.renderer, size, depth=32, streaming=True)
+        self._layer.blend_mode = pygame.BLENDMODE_BLEND
+        self.uploads = 0
+        self.copies = 0
+
+    def texture(self, surf):
+        """Текстура изображения; загружается при первом использовании и живёт, пока жива поверхность"""
+        tex = self._textures.get(surf)
+        if tex is None:
+            tex = self._textures[surf] = Texture.from_surface(self.renderer, surf)
+            self.uploads += 1
+        return tex
+
+    def clear(self, color=config.BG_COLOR):
+        self.renderer.draw_color = (*color, 255)
+        self.renderer.clear()
+        self.copies = 0
+
+    def copy(self, surf, pos, area=None):
+        tex = self.texture(surf)
+        # Прозрачность всей поверхности (мерцание звёзд) переходит в модуляцию альфы текстуры
+        alpha = surf.get_alpha()
+        tex.alpha = 255 if alpha is None else alpha
+        if area is None:
+            tex.draw(None, (pos[0], pos[1], tex.width, tex.height))
+        else:
+            area = pygame.Rect(area)
+            tex.draw(area, (pos[0], pos[1], area.w, area.h))
+        self.copies += 1
+
+    def copy_many(self, items):
+        """Пакет копий [(поверхность, позиция или rect)]; SDL сам сводит их в несколько вызовов GPU"""
+        texture = self.texture
+        n = 0
+        for surf, pos in items:
+            tex = texture(surf)
+            tex.draw(None, (pos[0], pos[1], tex.width, tex.height))
+            n += 1
+        self.copies += n
+
+    def draw_layer(self, surf=None):
+        """Кладёт программный слой (по умолчанию screen) поверх того, что уже нарисовано"""
+        self._layer.update(surf or self.screen)
+        self._layer.draw()
+
+    def present(self):
+        self.renderer.present()
+
+    def present_rects(self, rects=None):
+        """Вывод для DirtyRegions: программный кадр в screen целиком уходит на экран"""
+        self.clear()
+        self.draw_layer()
+        self.present()
+
+    def capture(self):
+        """Кадр, который сейчас в буфере Renderer, в логическом разрешении"""
+        out = pygame.Surface(self.window.size, 0, 32)
+        self.renderer.to_surface(out)
+        if self.scale > 1:
+            out = pygame.transform.scale(out, self.size)
+        return out
+
+    def show(self, frame):
+        self.clear()
+        Texture.from_surface(self.renderer, frame).draw()
+        self.present()
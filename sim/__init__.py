@@ -0,0 +1,8 @@
+from .clock import RealClock, VirtualClock
+from .controls import KeyState, KeyboardInput, ScriptedInput
+from .rng import RngStreams, streams
+from .replay import Recording, InputRecorder, ReplayInput, state_hash
+from .waves import WaveTable, WaveScheduler, SpawnBatch, wave_table
+
+__all__ = ["RealClock", "VirtualClock", "KeyState", "KeyboardInput", "ScriptedInput", "RngStreams", "streams",
+           "Recording", "InputRecorder", "ReplayInput", "state_hash", "WaveTable", "WaveScheduler", "SpawnBatch", "wave_table"]
@@ -0,0 +1,254 @@
+"""Пакетная симуляция для балансировки сложностей: тысячи headless-игр в пуле процессов.
+
+Каждая игра ведётся бот-политикой из sim.bots; результаты приходят по мере готовности
+и сразу сворачиваются в потоковую статистику (и, если задан --out, в JSON lines),
+так что память не растёт с числом игр.
+
+Запуск из корня проекта:
+    python -m sim.batch --games 200 --policies dodge,random
+    python -m sim.batch --games 500 --difficulties Hard,Nightmare --workers 8 --out runs.jsonl
+"""
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import time
+import config
+from ui.settings import Settings
+from .bots import POLICIES, make_policy
+from .controls import ScriptedInput
+
+# Метрики одной игры и ширина корзины гистограммы для квантилей
+METRICS = {
+    "survival_s": 5.0,
+    "score": 100,
+    "level": 1,
+    "peak_enemies": 1,
+    "peak_projectiles": 10,
+    "peak_particles": 50,
+}
+# До стольких игр в группе квантили считаются по точным значениям, дальше - по гистограмме
+EXACT_SAMPLES = 1000
+
+class RunningStats:
+    """Потоковая статистика одной метрики: Welford для среднего/отклонения, точные значения или гистограмма для квантилей"""
+
+    def __init__(self, bin_width, exact_samples=EXACT_SAMPLES):
+        self.bin_width = bin_width
+        self.exact_samples = exact_samples
+        self.samples = []
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.bins = {}
+
+    def add(self, x):
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (x - self.mean)
+        self.min = min(self.min, x)
+        self.max = max(self.max, x)
+        if self.samples is not None:
+            self.samples.append(x)
+            if len(self.samples) > self.exact_samples:
+                self.samples = None
+        b = int(x // self.bin_width)
+        self.bins[b] = self.bins.get(b, 0) + 1
+
+    @property
+    def std(self):
+        return math.sqrt(self._m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+    def quantile(self, q):
+        """Квантиль с линейной интерполяцией между соседними значениями.
+
+        Пока значений не больше exact_samples, он точный; дальше - по гистограмме
+        с интерполяцией внутри корзины, зажатый в [min, max].
+        """
+        if not self.count:
+            return 0.0
+        rank = q * (self.count - 1)
+        if self.samples is not None:
+            ordered = sorted(self.samples)
+            lo = int(rank)
+            hi = min(lo + 1, len(ordered) - 1)
+            return ordered[lo] + (ordered[hi] - ordered[lo]) * (rank - lo)
+        seen = 0
+        for b in sorted(self.bins):
+            n = self.bins[b]
+            seen += n
+            if seen > rank:
+                # Значения корзины считаем равномерно распределёнными по её ширине
+                inside = (rank - (seen - n) + 0.5) / n
+                return min(self.max, max(self.min, (b + inside) * self.bin_width))
+        return self.max
+
+    def summary(self):
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "std": self.std,
+            "min": self.min,
+            "p10": self.quantile(0.1),
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "max": self.max,
+        }
+
+class BatchAggregate:
+    """Распределения метрик по парам (сложность, политика)"""
+
+    def __init__(self):
+        self.groups = {}
+        self.games = 0
+        self.game_overs = {}
+
+    def add(self, result):
+        key = (result["difficulty"], result["policy"])
+        group = self.groups.get(key)
+        if group is None:
+            group = self.groups[key] = {name: RunningStats(width) for name, width in METRICS.items()}
+        for name, stats in group.items():
+            stats.add(result[name])
+        self.game_overs[key] = self.game_overs.get(key, 0) + result["game_over"]
+        self.games += 1
+
+    def summary(self):
+        return {
+            f"{difficulty}/{policy}": {
+                "game_over_rate": self.game_overs[(difficulty, policy)] / group["score"].count,
+                **{name: stats.summary() for name, stats in group.items()},
+            }
+            for (difficulty, policy), group in self.groups.items()
+        }
+
+# Игра создаётся один раз на процесс и переиспользуется: инициализация pygame дороже партии
+_game = None
+
+def simulate(job):
+    """Одна headless-игра: job = (сложность, политика, seed, предел тиков)"""
+    from game import Game
+    from .headless import run_headless
+    global _game
+    difficulty, policy, seed, max_ticks = job
+    if _game is None:
+        _game = Game(headless=True)
+    _game.controls = ScriptedInput(make_policy(policy))
+
+    peaks = {"peak_enemies": 0, "peak_projectiles": 0, "peak_particles": 0}
+
+    def observe(game):
+        peaks["peak_enemies"] = max(peaks["peak_enemies"], len(game.enemies))
+        peaks["peak_projectiles"] = max(peaks["peak_projectiles"], len(game.projectiles) + len(game.bullets))
+        peaks["peak_particles"] = max(peaks["peak_particles"], len(game.state["explosions"]))
+
+    stats = run_headless(max_ticks, difficulty, game=_game, seed=seed, observe=observe)
+    return {
+        "difficulty": difficulty,
+        "policy": policy,
+        "seed": seed,
+        "ticks": stats["ticks"],
+        "survival_s": stats["ticks"] / config.SIM_HZ,
+        "score": stats["score"],
+        "level": stats["level"],
+        "wave": stats["wave"],
+        "game_over": stats["game_over"],
+        **peaks,
+    }
+
+def iter_jobs(games, difficulties, policies, max_ticks, base_seed=0):
+    """games партий на каждую пару (сложность, политика); seed у каждой партии свой"""
+    seed = base_seed
+    for _ in range(games):
+        for difficulty in difficulties:
+            for policy in policies:
+                yield difficulty, policy, seed, max_ticks
+                seed += 1
+
+def run_batch(games, difficulties=None, policies=("dodge",), max_ticks=10 * 60 * config.SIM_HZ,
+              workers=None, base_seed=0, out=None, progress=None):
+    """Раздаёт партии по процессам и сворачивает результаты по мере поступления.
+
+    out - открытый текстовый файл для JSON lines по каждой партии, progress(done) -
+    колбэк после каждой партии. workers=1 считает всё в текущем процессе.
+    """
+    difficulties = list(difficulties or Settings.DIFFICULTIES)
+    for policy in policies:
+        make_policy(policy)
+    jobs = iter_jobs(games, difficulties, policies, max_ticks, base_seed)
+    workers = workers or os.cpu_count() or 1
+    aggregate = BatchAggregate()
+
+    def consume(results):
+        for result in results:
+            aggregate.add(result)
+            if out is not None:
+                out.write(json.dumps(result) + "\n")
+            if progress is not None:
+                progress(aggregate.games)
+
+    if workers == 1:
+        consume(map(simulate, jobs))
+    else:
+        total = games * len(difficulties) * len(policies)
+        chunksize = max(1, min(16, total // (workers * 8)))
+        pool = multiprocessing.Pool(workers)
+        try:
+            consume(pool.imap_unordered(simulate, jobs, chunksize=chunksize))
+            pool.close()
+        except BaseException:
+            pool.terminate()
+            raise
+        finally:
+            pool.join()
+    return aggregate
+
+def print_summary(aggregate):
+    row = "{:<20} {:>6} {:>7} {:>22} {:>22} {:>10} {:>8}"
+    print(row.format("сложность/политика", "игр", "смертей", "выживание, с p10/50/90",
+                     "счёт p10/50/90", "уровень", "пик врагов"))
+    for name, s in sorted(aggregate.summary().items()):
+        surv, score = s["survival_s"], s["score"]
+        print(row.format(
+            name, surv["count"], f"{s['game_over_rate']:.0%}",
+            f"{surv['p10']:.0f}/{surv['p50']:.0f}/{surv['p90']:.0f}",
+            f"{score['p10']:.0f}/{score['p50']:.0f}/{score['p90']:.0f}",
+            f"{s['level']['mean']:.1f}", f"{s['peak_enemies']['max']:.0f}",
+        ))
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=100, help="партий на пару сложность/политика")
+    parser.add_argument("--difficulties", default=",".join(Settings.DIFFICULTIES))
+    parser.add_argument("--policies", default="dodge", help=f"через запятую из: {', '.join(POLICIES)}")
+    parser.add_argument("--max-seconds", type=float, default=600, help="предел длины партии в секундах игры")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", help="писать результат каждой партии в JSON lines")
+    parser.add_argument("--json", action="store_true", help="вывести сводку в JSON")
+    args = parser.parse_args()
+
+    out = open(args.out, "w") if args.out else None
+    start = time.perf_counter()
+    try:
+        aggregate = run_batch(
+            args.games, args.difficulties.split(","), args.policies.split(","),
+            int(args.max_seconds * config.SIM_HZ), args.workers, args.seed, out,
+        )
+    finally:
+        if out is not None:
+            out.close()
+    wall = time.perf_counter() - start
+
+    if args.json:
+        print(json.dumps(aggregate.summary(), indent=2))
+    else:
+        print_summary(aggregate)
+    print(f"{aggregate.games} партий за {wall:.1f} с ({aggregate.games / wall:.1f} партий/с)")
+
+if __name__ == "__main__":
+    main()
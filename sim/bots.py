@@ -0,0 +1,71 @@
+import pygame
+from .rng import streams
+
+MOVES = (
+    (), (pygame.K_LEFT,), (pygame.K_RIGHT,), (pygame.K_UP,), (pygame.K_DOWN,),
+    (pygame.K_LEFT, pygame.K_UP), (pygame.K_RIGHT, pygame.K_UP),
+    (pygame.K_LEFT, pygame.K_DOWN), (pygame.K_RIGHT, pygame.K_DOWN),
+)
+
+def idle(tick, game):
+    """Ничего не делает: нижняя граница выживаемости"""
+    return ()
+
+def strafe_and_shoot(tick, game):
+    """Стрелять без остановки и ходить влево-вправо"""
+    keys = [pygame.K_SPACE]
+    keys.append(pygame.K_LEFT if (tick // 90) % 2 else pygame.K_RIGHT)
+    return keys
+
+class RandomWalk:
+    """Стрельба и случайное направление, которое держится hold тиков (поток "bot")"""
+
+    def __init__(self, hold=15):
+        self.hold = hold
+        self.keys = ()
+
+    def __call__(self, tick, game):
+        if tick % self.hold == 1 or not self.keys:
+            self.keys = (pygame.K_SPACE, *streams.get("bot").choice(MOVES))
+        return self.keys
+
+def dodge(tick, game, lookahead=160):
+    """Уходит вбок от ближайшего врага, падающего на игрока, иначе встаёт под ближайшего врага"""
+    player = game.player.rect
+    threat = target = None
+    for enemy in game.enemies:
+        r = enemy.rect
+        if r.top > player.bottom:
+            continue
+        if r.bottom > player.top - lookahead and abs(r.centerx - player.centerx) < (r.w + player.w) // 2 + 10:
+            if threat is None or r.bottom > threat.bottom:
+                threat = r
+        elif target is None or abs(r.centerx - player.centerx) < abs(target.centerx - player.centerx):
+            target = r
+
+    keys = [pygame.K_SPACE]
+    if threat is not None:
+        go_left = threat.centerx >= player.centerx
+        # У стены уходить некуда - в другую сторону
+        if go_left and player.left < threat.w:
+            go_left = False
+        elif not go_left and player.right > game.screen.get_width() - threat.w:
+            go_left = True
+        keys.append(pygame.K_LEFT if go_left else pygame.K_RIGHT)
+    elif target is not None and abs(target.centerx - player.centerx) > 8:
+        keys.append(pygame.K_LEFT if target.centerx < player.centerx else pygame.K_RIGHT)
+    return keys
+
+# Фабрики политик: у политики может быть состояние, поэтому на каждую игру создаётся новая
+POLICIES = {
+    "idle": lambda: idle,
+    "strafe": lambda: strafe_and_shoot,
+    "random": RandomWalk,
+    "dodge": lambda: dodge,
+}
+
+def make_policy(name):
+    try:
+        return POLICIES[name]()
+    except KeyError:
+        raise ValueError(f"unknown bot policy {name!r}, expected one of {', '.join(POLICIES)}") from None
@@ -0,0 +1,33 @@
+import pygame
+import config
+
+class RealClock:
+    """Обычное время: pygame.time.Clock"""
+
+    def __init__(self):
+        self._clock = pygame.time.Clock()
+
+    def tick(self, fps=0):
+        return self._clock.tick(fps)
+
+    def get_fps(self):
+        return self._clock.get_fps()
+
+class VirtualClock:
+    """Виртуальное время для headless-режима: tick() не спит, а сразу сдвигает время на шаг кадра"""
+
+    def __init__(self, frame_ms=1000.0 / config.SIM_HZ):
+        self.frame_ms = frame_ms
+        self.ms = 0.0
+        self.frames = 0
+
+    def tick(self, fps=0):
+        self.ms += self.frame_ms
+        self.frames += 1
+        return self.frame_ms
+
+    def get_fps(self):
+        return 1000.0 / self.frame_ms
+
+    def get_ticks(self):
+        return int(self.ms)
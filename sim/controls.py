@@ -0,0 +1,37 @@
+import pygame
+
+class KeyState:
+    """Набор нажатых клавиш с тем же доступом keys[pygame.K_x], что у pygame.key.get_pressed()"""
+    __slots__ = ("pressed",)
+
+    def __init__(self, pressed=()):
+        self.pressed = frozenset(pressed)
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+class KeyboardInput:
+    """Живая клавиатура"""
+
+    def poll(self, tick, game=None):
+        return pygame.key.get_pressed()
+
+class ScriptedInput:
+    """Ввод по сценарию вместо клавиатуры.
+
+    script - либо функция (tick, game) -> клавиши, либо список наборов клавиш по
+    тикам (последний набор удерживается до конца).
+    """
+
+    def __init__(self, script):
+        self.script = script
+
+    def poll(self, tick, game=None):
+        script = self.script
+        if callable(script):
+            keys = script(tick, game)
+        elif script:
+            keys = script[min(tick, len(script) - 1)]
+        else:
+            keys = ()
+        return keys if isinstance(keys, KeyState) else KeyState(keys)
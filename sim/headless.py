@@ -0,0 +1,108 @@
+"""Headless-прогон игры: без окна, на виртуальном времени и со сценарием ввода.
+
+Запуск из корня проекта:
+    python -m sim.headless --ticks 20000 --difficulty Hard
+    python -m sim.headless --ticks 5000 --render
+    python -m sim.headless --seed 42 --record run.rpl
+    python -m sim.headless --replay run.rpl
+    python -m sim.headless --ticks 5000 --render --trace frame_trace.json
+    python -m sim.headless --ticks 5000 --render --backend texture
+"""
+import argparse
+import time
+import config
+from game import Game
+from profiling import profiler
+from .bots import strafe_and_shoot
+from .controls import ScriptedInput
+from .replay import Recording, ReplayInput, state_hash
+
+def run_headless(ticks, difficulty="Normal", script=strafe_and_shoot, render=False, game=None,
+                 seed=None, record_path=None, observe=None):
+    """Крутит симуляцию до ticks тиков или до game over так быстро, как позволяет CPU.
+
+    Возвращает статистику прогона; sim_fps - тиков симуляции в секунду реального времени.
+    С record_path ввод сессии пишется в файл реплея; observe(game) вызывается после каждого кадра.
+    """
+    game = game or Game(headless=True, controls=ScriptedInput(script), record_path=record_path)
+    game.menu.settings.difficulty = difficulty
+    game.start_game(seed)
+
+    start = time.perf_counter()
+    while game.sim_ticks < ticks and not game.state["game_over"]:
+        dt = game.clock.tick()
+        profiler.begin_frame()
+        with profiler.span("handle_events"):
+            game.handle_events()
+        game.advance(dt)
+        if observe is not None:
+            observe(game)
+        if render:
+            game.draw()
+        profiler.end_frame()
+    wall = time.perf_counter() - start
+    game.save_recording()
+
+    return {
+        "seed": game.seed,
+        "hash": state_hash(game),
+        "ticks": game.sim_ticks,
+        "sim_ms": game.now(),
+        "wall_s": wall,
+        "sim_fps": game.sim_ticks / wall if wall else 0.0,
+        "realtime_x": game.now() / 1000.0 / wall if wall else 0.0,
+        "score": game.state["score"],
+        "level": game.state["level"],
+        "wave": game.state["wave"],
+        "game_over": game.state["game_over"],
+    }
+
+def replay(recording, render=False):
+    """Проигрывает запись на максимальной скорости; ok - совпал ли итоговый хэш состояния"""
+    if not isinstance(recording, Recording):
+        recording = Recording.load(recording)
+    if recording.sim_hz != config.SIM_HZ:
+        raise ValueError(f"replay was recorded at {recording.sim_hz} Hz, SIM_HZ is {config.SIM_HZ}")
+    game = Game(headless=True, controls=ReplayInput(recording), record_path=None)
+    stats = run_headless(len(recording), recording.difficulty, render=render, game=game, seed=recording.seed)
+    stats["expected_hash"] = recording.final_hash
+    stats["ok"] = recording.final_hash is None or stats["hash"] == recording.final_hash
+    return stats
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ticks", type=int, default=10000)
+    parser.add_argument("--difficulty", default="Normal")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--render", action="store_true", help="рисовать кадры (в dummy-окно)")
+    parser.add_argument("--record", metavar="FILE", help="записать ввод сессии в файл реплея")
+    parser.add_argument("--replay", metavar="FILE", help="проиграть файл реплея и сверить хэш")
+    parser.add_argument("--trace", metavar="FILE", help="включить профайлер кадра и записать trace")
+    parser.add_argument("--backend", choices=("blit", "texture"), help="бэкенд отрисовки для --render")
+    args = parser.parse_args()
+    if args.backend:
+        config.RENDER_BACKEND = args.backend
+    if args.trace:
+        profiler.enabled = True
+
+    if args.replay:
+        stats = replay(args.replay, render=args.render)
+    else:
+        stats = run_headless(args.ticks, args.difficulty, render=args.render, seed=args.seed,
+                             record_path=args.record)
+    print(f"{stats['ticks']} тиков ({stats['sim_ms'] / 1000:.1f} с игры) за {stats['wall_s']:.2f} с: "
+          f"{stats['sim_fps']:.0f} тиков/с, x{stats['realtime_x']:.1f} к реальному времени")
+    print(f"счёт {stats['score']}, уровень {stats['level']}, волна {stats['wave']}"
+          f"{', game over' if stats['game_over'] else ''}")
+    print(f"seed {stats['seed']}, хэш {stats['hash'][:16]}")
+    if args.replay:
+        print("реплей совпал" if stats["ok"] else f"реплей РАЗОШЁЛСЯ: ожидался {stats['expected_hash'][:16]}")
+        raise SystemExit(0 if stats["ok"] else 1)
+    if args.trace:
+        p = profiler.percentiles()
+        print(f"кадр p50 {p[50]:.2f} мс, p95 {p[95]:.2f} мс, p99 {p[99]:.2f} мс; trace в {profiler.export_chrome_trace(args.trace)}")
+        for name, ms in sorted(profiler.phase_ms().items(), key=lambda kv: kv[1], reverse=True):
+            print(f"  {name:<18} {ms:7.3f} мс/кадр")
+
+if __name__ == "__main__":
+    main()
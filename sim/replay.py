@@ -0,0 +1,121 @@
+import functools
+import hashlib
+import struct
+import sys
+import zlib
+from array import array
+import pygame
+import config
+from .controls import KeyState
+
+# Клавиши, влияющие на симуляцию; бит i маски тика - KEY_BITS[i]
+KEY_BITS = (
+    pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN,
+    pygame.K_a, pygame.K_d, pygame.K_w, pygame.K_s,
+    pygame.K_SPACE,
+)
+
+def encode_keys(keys):
+    mask = 0
+    for bit, key in enumerate(KEY_BITS):
+        if keys[key]:
+            mask |= 1 << bit
+    return mask
+
+@functools.lru_cache(maxsize=None)
+def decode_keys(mask):
+    return KeyState(key for bit, key in enumerate(KEY_BITS) if mask >> bit & 1)
+
+class Recording:
+    """Запись сессии: seed, сложность и маска клавиш на каждый тик (uint16).
+
+    Формат файла: заголовок <4sBHQI32sB> (magic, версия, SIM_HZ, seed, число тиков,
+    итоговый хэш, длина имени сложности), имя сложности в utf-8 и сжатый zlib массив масок.
+    """
+    MAGIC = b"PLRP"
+    VERSION = 4
+    HEADER = struct.Struct("<4sBHQI32sB")
+
+    def __init__(self, seed, difficulty, masks=None, final_hash=None, sim_hz=config.SIM_HZ):
+        self.seed = seed
+        self.difficulty = difficulty
+        self.masks = masks if masks is not None else array("H")
+        self.final_hash = final_hash
+        self.sim_hz = sim_hz
+
+    def __len__(self):
+        return len(self.masks)
+
+    def to_bytes(self):
+        name = self.difficulty.encode()
+        digest = bytes.fromhex(self.final_hash) if self.final_hash else bytes(32)
+        masks = array("H", self.masks)
+        if masks.itemsize != 2:
+            raise ValueError("array('H') is not 16-bit on this platform")
+        if sys.byteorder == "big":
+            masks.byteswap()
+        header = self.HEADER.pack(self.MAGIC, self.VERSION, self.sim_hz, self.seed, len(masks), digest, len(name))
+        return header + name + zlib.compress(masks.tobytes(), 9)
+
+    @classmethod
+    def from_bytes(cls, data):
+        magic, version, sim_hz, seed, ticks, digest, name_len = cls.HEADER.unpack_from(data)
+        if magic != cls.MAGIC or version != cls.VERSION:
+            raise ValueError("not a replay file or unsupported version")
+        offset = cls.HEADER.size
+        difficulty = data[offset:offset + name_len].decode()
+        masks = array("H", zlib.decompress(data[offset + name_len:]))
+        if sys.byteorder == "big":
+            masks.byteswap()
+        if len(masks) != ticks:
+            raise ValueError("replay file is truncated")
+        final_hash = digest.hex() if any(digest) else None
+        return cls(seed, difficulty, masks, final_hash, sim_hz)
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+class InputRecorder:
+    """Пишет ввод каждого тика в Recording и отдаёт игре ровно то, что записано"""
+
+    def __init__(self, seed, difficulty):
+        self.recording = Recording(seed, difficulty)
+
+    def record(self, keys):
+        mask = encode_keys(keys)
+        self.recording.masks.append(mask)
+        return decode_keys(mask)
+
+class ReplayInput:
+    """Ввод из записи: маска тика tick (тики считаются с 1)"""
+
+    def __init__(self, recording):
+        self.recording = recording
+
+    def poll(self, tick, game=None):
+        masks = self.recording.masks
+        return decode_keys(masks[tick - 1] if 0 < tick <= len(masks) else 0)
+
+def state_hash(game):
+    """sha256 игрового состояния: счёт, игрок, враги, бонусы, снаряды; для сверки реплея.
+
+    Частицы взрывов не входят: их число зависит от уровня качества, а не от игры.
+    """
+    h = hashlib.sha256()
+    state = game.state
+    h.update(struct.pack("<qqqq", game.sim_ticks, state["score"], state["level"], state["wave"]))
+    player = game.player
+    h.update(struct.pack("<4iq", *player.rect, player.hp))
+    for enemy in game.enemies:
+        h.update(struct.pack("<4iq", *enemy.rect, enemy.hp))
+    for sprite in (*game.powerups, *game.bullets):
+        h.update(struct.pack("<4i", *sprite.rect))
+    n = game.projectiles.count
+    h.update(game.projectiles.pos[:n].tobytes())
+    return h.hexdigest()
@@ -0,0 +1,41 @@
+import random
+import zlib
+import numpy as np
+
+class RngStreams:
+    """Именованные потоки случайных чисел (враги, бонусы, эффекты...), выводимые из одного seed.
+
+    У каждой подсистемы свой поток, поэтому лишний вызов в одной из них (например, в
+    эффектах) не сдвигает последовательность другой. reseed() пересевает существующие
+    random.Random на месте, так что ссылки, взятые при импорте модуля, остаются рабочими.
+    """
+
+    def __init__(self, seed=None):
+        self._streams = {}
+        self.seed = None
+        self.reseed(seed)
+
+    def reseed(self, seed=None):
+        if seed is None:
+            seed = random.SystemRandom().randrange(1 << 63)
+        self.seed = seed
+        for name, stream in self._streams.items():
+            stream.seed(self._derive(name))
+        return seed
+
+    def _derive(self, name):
+        # Строковый seed хэшируется (sha512) и одинаков между запусками, в отличие от hash()
+        return f"{self.seed}/{name}"
+
+    def get(self, name):
+        """Поток random.Random подсистемы name"""
+        stream = self._streams.get(name)
+        if stream is None:
+            stream = self._streams[name] = random.Random(self._derive(name))
+        return stream
+
+    def numpy(self, name):
+        """Новый numpy Generator подсистемы name от текущего seed"""
+        return np.random.default_rng([self.seed, zlib.crc32(name.encode())])
+
+streams = RngStreams()
@@ -0,0 +1,145 @@
+import heapq
+from functools import lru_cache
+import config
+from ui.settings import Settings
+from .rng import streams
+
+rng = streams.get("waves")
+
+class WaveTable:
+    """Расписание появления врагов по тикам, рассчитанное из настроек сложности.
+
+    Строка k - k-й враг волны: тик появления, уровень (сила врага) и строй, который
+    приходит вместе с ним. Интервал сокращается на spawn_decrease (не ниже
+    WAVE_MIN_SPAWN_MS) каждые WAVES_PER_LEVEL врагов, как раньше в Game.spawn_enemy.
+    Таблица зависит только от сложности, поэтому считается кусками по мере чтения
+    и общая для всех сессий (см. wave_table).
+    """
+
+    def __init__(self, spawn_ms, spawn_decrease, step_ms, formation_levels=config.FORMATION_LEVELS):
+        self.spawn_ms = spawn_ms
+        self.spawn_decrease = spawn_decrease
+        self.step_ms = step_ms
+        self.formation_levels = formation_levels
+        self.ticks = []
+        self.levels = []
+        self.formations = []
+        self._ms = spawn_ms
+        self._tick = 0
+
+    def __len__(self):
+        return len(self.ticks)
+
+    def row(self, k):
+        while k >= len(self.ticks):
+            self._extend(config.WAVE_TABLE_CHUNK)
+        return self.ticks[k], self.levels[k], self.formations[k]
+
+    def _extend(self, count):
+        names = list(config.FORMATIONS)
+        for k in range(len(self.ticks), len(self.ticks) + count):
+            self._tick += max(1, round(self._ms / self.step_ms))
+            level = 1 + k // config.WAVES_PER_LEVEL
+            # Первый враг каждого formation_levels-го уровня (кроме первого) приходит строем
+            formation = None
+            if (self.formation_levels and k % config.WAVES_PER_LEVEL == 0 and level > 1
+                    and (level - 1) % self.formation_levels == 0):
+                formation = names[(level - 1) // self.formation_levels % len(names)]
+            self.ticks.append(self._tick)
+            self.levels.append(level)
+            self.formations.append(formation)
+            if (k + 1) % config.WAVES_PER_LEVEL == 0:
+                self._ms = max(config.WAVE_MIN_SPAWN_MS, self._ms - self.spawn_decrease)
+
+@lru_cache(maxsize=None)
+def wave_table(difficulty, step_ms):
+    diff = Settings.DIFFICULTIES[difficulty]
+    return WaveTable(diff["spawn_ms"], diff["spawn_decrease"], step_ms)
+
+class SpawnBatch:
+    """Заранее созданные враги, которые появляются на одном тике"""
+    __slots__ = ("tick", "wave", "enemies")
+
+    def __init__(self, tick, wave, enemies):
+        self.tick = tick
+        self.wave = wave
+        self.enemies = enemies
+
+class WaveScheduler:
+    """Очередь ближайших появлений врагов (heapq по тику).
+
+    Строки таблицы волн превращаются в готовые пачки за lookahead тиков до появления:
+    враги берутся из пула и настраиваются заранее, а на своём тике пачка только
+    снимается с очереди и добавляется в группы. schedule() ставит в ту же очередь
+    произвольные пачки (например, строй по событию) вне таблицы.
+    """
+
+    def __init__(self, table, pool, lookahead=config.WAVE_LOOKAHEAD):
+        self.table = table
+        self.pool = pool
+        self.lookahead = lookahead
+        self.cursor = 0
+        self.queue = []
+        self._seq = 0
+
+    def __len__(self):
+        return sum(len(batch.enemies) for _, _, batch in self.queue)
+
+    def schedule(self, batch):
+        heapq.heappush(self.queue, (batch.tick, self._seq, batch))
+        self._seq += 1
+
+    def prepare(self, tick):
+        """Создаёт пачки для строк таблицы, чьё время наступит в ближайшие lookahead тиков"""
+        table = self.table
+        if table is None:
+            return
+        horizon = tick + self.lookahead
+        while True:
+            spawn_tick, level, formation = table.row(self.cursor)
+            if spawn_tick > horizon:
+                break
+            self.cursor += 1
+            self.schedule(SpawnBatch(spawn_tick, self.cursor, self._build(level, formation)))
+
+    def _build(self, level, formation):
+        difficulty = 1.0 + (level - 1) * 0.25
+        leader = self.pool.acquire(difficulty)
+        if formation is None:
+            return [leader]
+        offsets = config.FORMATIONS[formation]
+        xs = [dx for dx, _ in offsets]
+        # Центр строя выбирается так, чтобы все враги поместились по ширине экрана
+        half = leader.rect.w // 2 + 5
+        cx = rng.randint(half - min(xs), config.SCREEN_W - half - max(xs))
+        enemies = []
+        for i, (dx, dy) in enumerate(offsets):
+            enemy = leader if i == 0 else self.pool.acquire(difficulty)
+            enemy.rect.centerx = cx + dx
+            enemy.rect.y += dy
+            enemies.append(enemy)
+        # Ведомые повторяют движение ведущего со своим смещением (Enemy.follow)
+        for enemy in enemies[1:]:
+            enemy.follow(leader)
+        return enemies
+
+    def due(self, tick):
+        """Снимает с очереди все пачки, чей тик наступил"""
+        self.prepare(tick)
+        batches = []
+        queue = self.queue
+        while queue and queue[0][0] <= tick:
+            batches.append(heapq.heappop(queue)[2])
+        return batches
+
+    def clear(self):
+        """Возвращает заранее созданных врагов в пул"""
+        for _, _, batch in self.queue:
+            for enemy in batch.enemies:
+                enemy.kill()
+        self.queue.clear()
+
+    def stop(self):
+        """Отключает таблицу волн; остаются только пачки из schedule()"""
+        self.clear()
+        self.table = None
@@ -1,6 +1,9 @@
+from .assets import SpriteAssets, assets
+from .pool import PooledSprite, SpritePool, SpritePools
 from .player import Player
 from .enemy import Enemy
 from .bullet import Bullet
 from .powerup import PowerUp
+from .projectiles import ProjectileField
 
-__all__ = ["Player", "Enemy", "Bullet", "PowerUp"]
+__all__ = ["SpriteAssets", "assets", "PooledSprite", "SpritePool", "SpritePools", "Player", "Enemy", "Bullet", "PowerUp", "ProjectileField"]
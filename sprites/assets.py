@@ -0,0 +1,106 @@
+import pygame
+
+class SpriteAssets:
+    """Реестр общих изображений спрайтов: каждая модель рисуется один раз и раздаётся по ссылке"""
+
+    def __init__(self):
+        self._builders = {}
+        self._images = {}
+        self._masks = {}
+        self._pack = None
+        self._pack_masks = None
+        # Пакет на диске отсутствует или не совпал отпечатком - стоит пересобрать
+        self.pack_stale = True
+        self.pack_hits = 0
+
+    def register(self, key, builder):
+        """Регистрирует функцию, которая рисует и возвращает поверхность модели"""
+        self._builders[key] = builder
+        self._images.pop(key, None)
+        self._masks.pop(key, None)
+
+    def keys(self):
+        return list(self._builders)
+
+    def get(self, key):
+        image = self._images.get(key)
+        if image is None:
+            pack = self._pack
+            if pack is not None and key in pack:
+                image = self._images[key] = self._from_pack(pack.surface(key))
+                self.pack_hits += 1
+            else:
+                image = self._images[key] = self._prepare(self._builders[key]())
+        return image
+
+    def mask(self, key):
+        """Битовая маска модели для точных столкновений; считается один раз на изображение"""
+        mask = self._masks.get(key)
+        if mask is None:
+            mask = self._masks[key] = pygame.mask.from_surface(self.get(key))
+        return mask
+
+    def _prepare(self, surf):
+        # convert_alpha() возможен только после pygame.display.set_mode()
+        if pygame.display.get_init() and pygame.display.get_surface() is not None:
+            return surf.convert_alpha()
+        return surf
+
+    def _from_pack(self, surf):
+        # Пиксели пакета уже в формате дисплея: convert_alpha() лишь скопировал бы их из mmap
+        if surf.get_masks() == self._pack_masks:
+            return surf
+        return self._prepare(surf)
+
+    def load_pack(self, path):
+        """Подключает пакет запечённых моделей, если он есть и совпадает отпечатком"""
+        # Импорт здесь, а не в начале модуля: иначе python -m sprites.pack загружает pack дважды
+        from .pack import AssetPack, fingerprint
+        pack = AssetPack.open(path) if path else None
+        if pack is not None and pack.fingerprint != fingerprint(self):
+            pack = None
+        self._pack = pack
+        self.pack_stale = pack is None
+        if pack is not None:
+            self._images.clear()
+            self._masks.clear()
+            if pygame.display.get_init() and pygame.display.get_surface() is not None:
+                self._pack_masks = pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha().get_masks()
+        return pack is not None
+
+    def save_pack(self, path):
+        """Запекает все модели и пишет их пакетом; возвращает размер пикселей в байтах"""
+        from .pack import AssetPack, fingerprint
+        size = AssetPack.write(path, {key: self.get(key) for key in self._builders}, fingerprint(self))
+        self.pack_stale = False
+        return size
+
+    def clear(self):
+        """Сбрасывает запечённое; модели перерисуются при следующем get()"""
+        self._images.clear()
+        self._masks.clear()
+
+    def bake_iter(self):
+        """Запекает ещё не готовые модели по одной за шаг (фоновый прогрев)"""
+        for key in list(self._builders):
+            if key not in self._images:
+                self.get(key)
+                yield key
+
+    def bake_all(self):
+        """Запекает все модели в формат дисплея; вызывается после создания окна"""
+        self._images.clear()
+        self._masks.clear()
+        for key in self._builders:
+            self.get(key)
+
+    def memory_bytes(self):
+        return sum(img.get_bytesize() * img.get_width() * img.get_height() for img in self._images.values())
+
+def faded(surf, alpha):
+    """Копия изображения с умноженной альфой (для мигающих вариантов)"""
+    out = surf.copy()
+    out.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+    return out
+
+assets = SpriteAssets()
@@ -1,39 +1,68 @@
 import pygame
-import random
 import math
 import config
+from sim.rng import streams
+from .assets import assets
+from .pool import PooledSprite
 
-try:
-    BaseSprite = pygame.sprite.Sprite
-except:
-    BaseSprite = object
+rng = streams.get("enemy")
 
 def clamp(val, lo, hi):
     return max(lo, min(hi, val))
 
-class Enemy(BaseSprite):
+class Enemy(PooledSprite):
     def __init__(self, difficulty=1.0):
         super().__init__()
-        w, h = 45, 32
-        self.image = pygame.Surface((w, h), pygame.SRCALPHA)
-        self._draw_enemy_model(self.image, w, h)
+        self.reset(difficulty)
+
+    def reset(self, difficulty=1.0):
+        self.image = assets.get("enemy")
+        self.mask = assets.mask("enemy")
         self.rect = self.image.get_rect()
-        self.rect.centerx = random.randint(30, config.SCREEN_W - 30)
+        h = self.rect.height
+        self.rect.centerx = rng.randint(30, config.SCREEN_W - 30)
         self.rect.y = -h - 10
-        self.vy = random.uniform(config.ENEMY_SPEED_MIN, config.ENEMY_SPEED_MAX) * difficulty
-        self.vx = random.uniform(-1.5, 1.5) * difficulty
-        self.amp = random.uniform(0.2, 0.5) * difficulty
-        self.freq = random.uniform(0.005, 0.015)
-        self.phase = random.uniform(0, config.TAU)
+        self.vy = rng.uniform(config.ENEMY_SPEED_MIN, config.ENEMY_SPEED_MAX) * difficulty
+        self.vx = rng.uniform(-1.5, 1.5) * difficulty
+        self.amp = rng.uniform(0.2, 0.5) * difficulty
+        self.freq = rng.uniform(0.005, 0.015)
+        self.phase = rng.uniform(0, config.TAU)
         self.t = 0
         self.hp = max(1, int(difficulty * 1.2))
         self.max_hp = self.hp
         self.wall_bounce_cooldown = 0
         self.target_vx = self.vx
-        self.direction = random.choice([-1, 1])
+        self.direction = rng.choice([-1, 1])
         self.animation_pulse = 0
+        # Строй: ведомый держится на offset от ведущего, пока тот жив (см. follow)
+        self.leader = None
+        self.offset = (0, 0)
+        self.wingmen = []
+
+    def follow(self, leader):
+        """Ставит врага в строй ведущего на текущем смещении от него"""
+        self.leader = leader
+        self.offset = (self.rect.x - leader.rect.x, self.rect.y - leader.rect.y)
+        leader.wingmen.append(self)
+
+    def kill(self):
+        # Ведомые погибшего ведущего дальше летят сами; ведомый выходит из строя
+        for enemy in self.wingmen:
+            enemy.leader = None
+        self.wingmen.clear()
+        if self.leader is not None:
+            self.leader.wingmen.remove(self)
+            self.leader = None
+        super().kill()
 
-    def _draw_enemy_model(self, surf, w, h):
+    @staticmethod
+    def build_image(w=45, h=32):
+        surf = pygame.Surface((w, h), pygame.SRCALPHA)
+        Enemy._draw_enemy_model(surf, w, h)
+        return surf
+
+    @staticmethod
+    def _draw_enemy_model(surf, w, h):
         # Основной корпус с градиентом
         pygame.draw.rect(surf, config.ENEMY_COLOR, (5, 10, w - 10, h - 16), border_radius=7)
         pygame.draw.rect(surf, (255, 100, 100), (7, 8, w - 14, 8), border_radius=4)
@@ -61,6 +90,14 @@ class Enemy(BaseSprite):
     def update(self):
         self.t += 1
         self.animation_pulse += 1
+        if self.leader is not None:
+            # Позиция ведомого считается от ведущего, а не накапливается: строй не расползается
+            leader = self.leader.rect
+            self.rect.topleft = (leader.x + self.offset[0], leader.y + self.offset[1])
+            self.rect.clamp_ip((5, self.rect.y, config.SCREEN_W - 10, self.rect.h))
+            if self.rect.top > config.SCREEN_H + 50:
+                self.kill()
+            return
         self.rect.y += self.vy
         
         # Улучшенное волнообразное движение
@@ -71,7 +108,7 @@ class Enemy(BaseSprite):
             self.wall_bounce_cooldown -= 1
         else:
             # Интеллектуальное движение - случайная смена направления
-            if random.random() < 0.01:
+            if rng.random() < 0.01:
                 self.direction *= -1
             self.target_vx = 2 * self.direction
         
@@ -106,3 +143,5 @@ class Enemy(BaseSprite):
             fill = (self.hp / self.max_hp) * bar_width
             pygame.draw.rect(surf, (100, 100, 100), (x - bar_width // 2, y - 10, bar_width, bar_height))
             pygame.draw.rect(surf, (255, 100, 100), (x - bar_width // 2, y - 10, int(fill), bar_height))
+
+assets.register("enemy", Enemy.build_image)
@@ -0,0 +1,137 @@
+"""Пакет запечённых моделей спрайтов: все изображения реестра assets в одном файле с индексом.
+
+Файл: заголовок <4sB32sII> (magic, версия, отпечаток, длина индекса, начало пикселей),
+индекс в JSON ({"format", "entries": {ключ: [смещение, ширина, высота]}}) и пиксели
+всех моделей подряд. При загрузке файл отображается в память (mmap), а поверхности
+создаются через pygame.image.frombuffer прямо поверх отображения, без копирования.
+
+Отпечаток считается по исходникам функций рисования, цветам из config, набору ключей
+и версии pygame; пакет с другим отпечатком считается устаревшим и не используется.
+
+Сборка из корня проекта:
+    python -m sprites.pack              # запечь и записать config.ASSET_PACK_PATH
+    python -m sprites.pack --check      # только проверить, актуален ли пакет
+"""
+import hashlib
+import inspect
+import json
+import mmap
+import os
+import struct
+import pygame
+import config
+
+MAGIC = b"PLAP"
+VERSION = 1
+HEADER = struct.Struct("<4sB32sII")
+# Порядок байт пикселя как у convert_alpha() на обычных дисплеях: такие поверхности не нужно конвертировать
+PIXEL_FORMAT = "BGRA"
+ALIGN = 64
+
+def fingerprint(assets):
+    """sha256 всего, от чего зависят пиксели моделей"""
+    h = hashlib.sha256()
+    h.update(f"{VERSION}/{pygame.version.ver}/{pygame.version.SDL}/{PIXEL_FORMAT}".encode())
+    files = {inspect.getsourcefile(fingerprint), inspect.getsourcefile(type(assets))}
+    for key in sorted(assets.keys()):
+        h.update(key.encode())
+        files.add(inspect.getsourcefile(assets._builders[key]))
+    for path in sorted(files):
+        with open(path, "rb") as f:
+            h.update(f.read())
+    colors = {name: getattr(config, name) for name in dir(config) if name.isupper() and "COLOR" in name}
+    h.update(repr(sorted(colors.items())).encode())
+    return h.digest()
+
+class AssetPack:
+    """Открытый пакет: индекс и отображённые в память пиксели"""
+
+    def __init__(self, path, digest, entries, pixel_format, file, view):
+        self.path = path
+        self.fingerprint = digest
+        self.entries = entries
+        self.pixel_format = pixel_format
+        self._file = file
+        self._view = view
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    @classmethod
+    def open(cls, path):
+        """Отображает пакет в память; None, если файла нет или он не читается"""
+        try:
+            f = open(path, "rb")
+        except OSError:
+            return None
+        try:
+            # ACCESS_COPY: страницы общие с файлом, пока в поверхность никто не пишет
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+            magic, version, digest, index_len, data_start = HEADER.unpack_from(mapped)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError("not an asset pack or unsupported version")
+            index = json.loads(bytes(mapped[HEADER.size:HEADER.size + index_len]))
+        except (OSError, ValueError, struct.error):
+            f.close()
+            return None
+        view = memoryview(mapped)[data_start:]
+        entries = {key: tuple(entry) for key, entry in index["entries"].items()}
+        return cls(path, digest, entries, index["format"], f, view)
+
+    def surface(self, key):
+        offset, w, h = self.entries[key]
+        return pygame.image.frombuffer(self._view[offset:offset + w * h * 4], (w, h), self.pixel_format)
+
+    @staticmethod
+    def write(path, images, digest):
+        """Пишет пакет из {ключ: поверхность}; файл заменяется атомарно"""
+        entries = {}
+        blobs = []
+        offset = 0
+        for key, surf in images.items():
+            raw = pygame.image.tobytes(surf, PIXEL_FORMAT)
+            entries[key] = [offset, surf.get_width(), surf.get_height()]
+            pad = -len(raw) % ALIGN
+            blobs.append(raw + bytes(pad))
+            offset += len(raw) + pad
+        index = json.dumps({"format": PIXEL_FORMAT, "entries": entries}, sort_keys=True).encode()
+        data_start = HEADER.size + len(index)
+        data_start += -data_start % ALIGN
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, digest, len(index), data_start))
+            f.write(index)
+            f.write(bytes(data_start - HEADER.size - len(index)))
+            for blob in blobs:
+                f.write(blob)
+        os.replace(tmp, path)
+        return offset
+
+def main():
+    import argparse
+    import time
+    from . import assets
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out", default=config.ASSET_PACK_PATH)
+    parser.add_argument("--check", action="store_true", help="только проверить актуальность пакета")
+    args = parser.parse_args()
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    if args.check:
+        ok = assets.load_pack(args.out)
+        print(f"{args.out}: {'актуален' if ok else 'устарел или отсутствует'}")
+        raise SystemExit(0 if ok else 1)
+
+    start = time.perf_counter()
+    assets.bake_all()
+    size = assets.save_pack(args.out)
+    print(f"{len(assets.keys())} моделей, {size / 1024:.0f} КБ пикселей -> {args.out} за {time.perf_counter() - start:.2f} с")
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@ import pygame
 import math
 import config
 from .bullet import Bullet
+from .assets import assets
 
 try:
     BaseSprite = pygame.sprite.Sprite
@@ -12,11 +13,22 @@ def clamp(val, lo, hi):
     return max(lo, min(hi, val))
 
 class Player(BaseSprite):
+    # Смещения пульсации щита и пламени ускорения: int(3 * sin(...)) даёт -3..3, None - эффект выключен
+    FRAME_PHASES = (None, -3, -2, -1, 0, 1, 2, 3)
+
     def __init__(self, x, y):
         super().__init__()
-        self.base_images = self._create_player_models()
+        self.base_images = [assets.get(f"player/hp{i}") for i in range(3)]
+        # Маска столкновений зависит только от модели по здоровью, а не от кадра анимации
+        self.hp_masks = [assets.mask(f"player/hp{i}") for i in range(3)]
+        self.frames = [[[assets.get(self._frame_key(hp_index, shield, boost)) for boost in self.FRAME_PHASES]
+                        for shield in self.FRAME_PHASES] for hp_index in range(3)]
+        self.flash_frames = [[assets.get(f"player/flash/{int(wings)}{int(stabs)}") for stabs in (False, True)]
+                             for wings in (False, True)]
+        self.blink_frame = assets.get("player/blink")
         self.current_hp_visual = config.PLAYER_HP
         self.image = self.base_images[config.PLAYER_HP - 1]
+        self.mask = self.hp_masks[config.PLAYER_HP - 1]
         self.rect = self.image.get_rect(center=(x, y))
         self.speed = config.PLAYER_SPEED
         self.shoot_delay = config.PLAYER_SHOOT_DELAY
@@ -35,118 +47,173 @@ class Player(BaseSprite):
         self.animation_time = 0
         self.damage_flash = 0
 
-    def _create_player_models(self):
-        """Создаёт детализированные модели корабля для разных уровней здоровья"""
-        models = []
-        
-        # Модель с 3 HP (целый корабль)
-        surf_3 = pygame.Surface((50, 60), pygame.SRCALPHA)
-        
-        # Основной корпус
-        pygame.draw.polygon(surf_3, (100, 150, 255), [(25, 5), (15, 25), (35, 25)])
-        pygame.draw.polygon(surf_3, config.PLAYER_COLOR, [(25, 5), (12, 28), (38, 28)])
-        pygame.draw.rect(surf_3, config.PLAYER_COLOR, (14, 26, 22, 24), border_radius=5)
-        
-        # Кабина (окно)
-        pygame.draw.circle(surf_3, (150, 200, 255), (25, 12), 4)
-        pygame.draw.circle(surf_3, (200, 230, 255), (25, 12), 2)
-        
-        # Левое крыло
-        pygame.draw.polygon(surf_3, (80, 140, 255), [(12, 28), (4, 35), (14, 32)])
-        pygame.draw.polygon(surf_3, (100, 160, 255), [(12, 28), (8, 32), (14, 30)])
-        
-        # Правое крыло
-        pygame.draw.polygon(surf_3, (80, 140, 255), [(38, 28), (46, 35), (36, 32)])
-        pygame.draw.polygon(surf_3, (100, 160, 255), [(38, 28), (42, 32), (36, 30)])
-        
-        # Левый стабилизатор
-        pygame.draw.polygon(surf_3, (120, 180, 255), [(16, 42), (10, 52), (16, 48)])
-        pygame.draw.polygon(surf_3, (150, 200, 255), [(16, 42), (12, 48), (16, 46)])
-        
-        # Правый стабилизатор
-        pygame.draw.polygon(surf_3, (120, 180, 255), [(34, 42), (40, 52), (34, 48)])
-        pygame.draw.polygon(surf_3, (150, 200, 255), [(34, 42), (38, 48), (34, 46)])
-        
-        # Двигатели (основной)
-        pygame.draw.rect(surf_3, (200, 100, 50), (22, 48, 6, 10), border_radius=2)
-        pygame.draw.rect(surf_3, (255, 150, 80), (22, 48, 6, 4))
-        
-        # Боковые двигатели
-        pygame.draw.rect(surf_3, (180, 80, 40), (12, 50, 4, 8), border_radius=1)
-        pygame.draw.rect(surf_3, (180, 80, 40), (34, 50, 4, 8), border_radius=1)
-        
-        # Полоски на корпусе
-        pygame.draw.line(surf_3, (120, 170, 255), (20, 32), (20, 38), 1)
-        pygame.draw.line(surf_3, (120, 170, 255), (30, 32), (30, 38), 1)
-        
-        models.append(surf_3)
-        
-        # Модель с 2 HP (повреждена левая сторона)
-        surf_2 = pygame.Surface((50, 60), pygame.SRCALPHA)
-        
-        # Основной корпус
-        pygame.draw.polygon(surf_2, (100, 150, 255), [(25, 5), (15, 25), (35, 25)])
-        pygame.draw.polygon(surf_2, config.PLAYER_COLOR, [(25, 5), (12, 28), (38, 28)])
-        pygame.draw.rect(surf_2, config.PLAYER_COLOR, (14, 26, 22, 24), border_radius=5)
-        
-        # Кабина
-        pygame.draw.circle(surf_2, (150, 200, 255), (25, 12), 4)
-        pygame.draw.circle(surf_2, (200, 230, 255), (25, 12), 2)
-        
-        # Только правое крыло (левое повреждено)
-        pygame.draw.polygon(surf_2, (80, 140, 255), [(38, 28), (46, 35), (36, 32)])
-        pygame.draw.polygon(surf_2, (100, 160, 255), [(38, 28), (42, 32), (36, 30)])
-        pygame.draw.polygon(surf_2, (255, 100, 100), [(12, 28), (8, 35), (14, 32)])  # Обломок левого крыла
-        
-        # Только правый стабилизатор
-        pygame.draw.polygon(surf_2, (120, 180, 255), [(34, 42), (40, 52), (34, 48)])
-        pygame.draw.polygon(surf_2, (150, 200, 255), [(34, 42), (38, 48), (34, 46)])
-        pygame.draw.polygon(surf_2, (255, 100, 100), [(16, 42), (10, 52), (16, 48)])  # Обломок левого стабилизатора
-        
-        # Двигатели
-        pygame.draw.rect(surf_2, (200, 100, 50), (22, 48, 6, 10), border_radius=2)
-        pygame.draw.rect(surf_2, (255, 150, 80), (22, 48, 6, 4))
-        pygame.draw.rect(surf_2, (180, 80, 40), (34, 50, 4, 8), border_radius=1)
-        
-        # Повреждённые полоски
-        pygame.draw.line(surf_2, (200, 100, 100), (20, 32), (20, 38), 1)
-        pygame.draw.line(surf_2, (120, 170, 255), (30, 32), (30, 38), 1)
-        pygame.draw.rect(surf_2, (255, 100, 100), (10, 28, 3, 12))  # Трещина
-        
-        models.append(surf_2)
-        
-        # Модель с 1 HP (серьёзно повреждена)
-        surf_1 = pygame.Surface((50, 60), pygame.SRCALPHA)
+    @staticmethod
+    def _frame_key(hp_index, shield, boost):
+        return f"player/{hp_index}/{shield}/{boost}"
+
+    @staticmethod
+    def build_frame(hp_index, shield, boost):
+        """Рисует кадр корабля со щитом и пламенем ускорения в заданной фазе"""
+        image = assets.get(f"player/hp{hp_index}").copy()
+        
+        # Щит с анимацией
+        if shield is not None:
+            radius = 30 + shield
+            pygame.draw.circle(image, config.POWERUP_COLOR, (25, 30), radius, 2)
+            pygame.draw.circle(image, config.POWERUP_COLOR, (25, 30), radius - 2, 1)
+        
+        # Эффект ускорения
+        if boost is not None:
+            pygame.draw.polygon(image, (255, 150, 50), [(18, 48 + boost), (16, 56), (20, 50)])
+            pygame.draw.polygon(image, (255, 150, 50), [(32, 48 + boost), (34, 56), (30, 50)])
+        return image
+
+    @staticmethod
+    def build_blink_frame():
+        image = pygame.Surface((50, 60), pygame.SRCALPHA)
+        pygame.draw.polygon(image, (255, 255, 255), [(25, 5), (15, 25), (35, 25)])
+        return image
+
+    @staticmethod
+    def build_flash_frame(wings, stabs):
+        """Вспышка при получении урона - повреждённый корабль"""
+        image = pygame.Surface((50, 60), pygame.SRCALPHA)
         
-        # Повреждённый корпус
-        pygame.draw.polygon(surf_1, (150, 100, 100), [(25, 5), (15, 25), (35, 25)])
-        pygame.draw.polygon(surf_1, (200, 100, 100), [(25, 5), (12, 28), (38, 28)])
-        pygame.draw.rect(surf_1, (180, 80, 80), (14, 26, 22, 24), border_radius=5)
+        # Повреждённый корпус (серый цвет)
+        pygame.draw.polygon(image, (120, 120, 140), [(25, 5), (15, 25), (35, 25)])
+        pygame.draw.polygon(image, (100, 100, 120), [(25, 5), (12, 28), (38, 28)])
+        pygame.draw.rect(image, (100, 100, 120), (14, 26, 22, 24), border_radius=5)
         
         # Повреждённая кабина
-        pygame.draw.circle(surf_1, (150, 100, 100), (25, 12), 4)
-        pygame.draw.circle(surf_1, (200, 120, 120), (25, 12), 2)
-        
-        # Обломки крыльев
-        pygame.draw.polygon(surf_1, (255, 100, 100), [(12, 28), (8, 35), (14, 32)])
-        pygame.draw.polygon(surf_1, (255, 100, 100), [(38, 28), (46, 35), (36, 32)])
+        pygame.draw.circle(image, (80, 80, 100), (25, 12), 4)
+        pygame.draw.circle(image, (120, 120, 140), (25, 12), 2)
+        
+        # Сломанные крылья (показываем только части)
+        if wings:
+            pygame.draw.polygon(image, (150, 80, 80), [(12, 28), (8, 32), (14, 30)])
+            pygame.draw.polygon(image, (150, 80, 80), [(38, 28), (42, 32), (36, 30)])
+        
+        # Сломанные стабилизаторы
+        if stabs:
+            pygame.draw.polygon(image, (150, 80, 80), [(16, 42), (12, 48), (16, 46)])
+            pygame.draw.polygon(image, (150, 80, 80), [(34, 42), (38, 48), (34, 46)])
+        
+        # Повреждённый двигатель
+        pygame.draw.rect(image, (140, 80, 80), (22, 48, 6, 10), border_radius=2)
+        pygame.draw.rect(image, (180, 100, 100), (22, 48, 6, 2))
+        
+        # Трещины и искры
+        pygame.draw.line(image, (200, 100, 100), (15, 30), (35, 35), 1)
+        pygame.draw.line(image, (200, 120, 120), (20, 28), (30, 42), 1)
+        return image
+
+    @staticmethod
+    def build_model(hp_index):
+        """Рисует модель корабля для уровня здоровья hp_index (0 - целый корабль)"""
+        surf = pygame.Surface((50, 60), pygame.SRCALPHA)
+        Player._draw_model(surf, hp_index)
+        return surf
+
+    @staticmethod
+    def _draw_model(surf, hp_index):
+        if hp_index == 0:
+            # Модель с 3 HP (целый корабль)
+        
+            # Основной корпус
+            pygame.draw.polygon(surf, (100, 150, 255), [(25, 5), (15, 25), (35, 25)])
+            pygame.draw.polygon(surf, config.PLAYER_COLOR, [(25, 5), (12, 28), (38, 28)])
+            pygame.draw.rect(surf, config.PLAYER_COLOR, (14, 26, 22, 24), border_radius=5)
+        
+            # Кабина (окно)
+            pygame.draw.circle(surf, (150, 200, 255), (25, 12), 4)
+            pygame.draw.circle(surf, (200, 230, 255), (25, 12), 2)
+        
+            # Левое крыло
+            pygame.draw.polygon(surf, (80, 140, 255), [(12, 28), (4, 35), (14, 32)])
+            pygame.draw.polygon(surf, (100, 160, 255), [(12, 28), (8, 32), (14, 30)])
+        
+            # Правое крыло
+            pygame.draw.polygon(surf, (80, 140, 255), [(38, 28), (46, 35), (36, 32)])
+            pygame.draw.polygon(surf, (100, 160, 255), [(38, 28), (42, 32), (36, 30)])
+        
+            # Левый стабилизатор
+            pygame.draw.polygon(surf, (120, 180, 255), [(16, 42), (10, 52), (16, 48)])
+            pygame.draw.polygon(surf, (150, 200, 255), [(16, 42), (12, 48), (16, 46)])
+        
+            # Правый стабилизатор
+            pygame.draw.polygon(surf, (120, 180, 255), [(34, 42), (40, 52), (34, 48)])
+            pygame.draw.polygon(surf, (150, 200, 255), [(34, 42), (38, 48), (34, 46)])
+        
+            # Двигатели (основной)
+            pygame.draw.rect(surf, (200, 100, 50), (22, 48, 6, 10), border_radius=2)
+            pygame.draw.rect(surf, (255, 150, 80), (22, 48, 6, 4))
+        
+            # Боковые двигатели
+            pygame.draw.rect(surf, (180, 80, 40), (12, 50, 4, 8), border_radius=1)
+            pygame.draw.rect(surf, (180, 80, 40), (34, 50, 4, 8), border_radius=1)
+        
+            # Полоски на корпусе
+            pygame.draw.line(surf, (120, 170, 255), (20, 32), (20, 38), 1)
+            pygame.draw.line(surf, (120, 170, 255), (30, 32), (30, 38), 1)
+        elif hp_index == 1:
+            # Модель с 2 HP (повреждена левая сторона)
+        
+            # Основной корпус
+            pygame.draw.polygon(surf, (100, 150, 255), [(25, 5), (15, 25), (35, 25)])
+            pygame.draw.polygon(surf, config.PLAYER_COLOR, [(25, 5), (12, 28), (38, 28)])
+            pygame.draw.rect(surf, config.PLAYER_COLOR, (14, 26, 22, 24), border_radius=5)
+        
+            # Кабина
+            pygame.draw.circle(surf, (150, 200, 255), (25, 12), 4)
+            pygame.draw.circle(surf, (200, 230, 255), (25, 12), 2)
+        
+            # Только правое крыло (левое повреждено)
+            pygame.draw.polygon(surf, (80, 140, 255), [(38, 28), (46, 35), (36, 32)])
+            pygame.draw.polygon(surf, (100, 160, 255), [(38, 28), (42, 32), (36, 30)])
+            pygame.draw.polygon(surf, (255, 100, 100), [(12, 28), (8, 35), (14, 32)])  # Обломок левого крыла
+        
+            # Только правый стабилизатор
+            pygame.draw.polygon(surf, (120, 180, 255), [(34, 42), (40, 52), (34, 48)])
+            pygame.draw.polygon(surf, (150, 200, 255), [(34, 42), (38, 48), (34, 46)])
+            pygame.draw.polygon(surf, (255, 100, 100), [(16, 42), (10, 52), (16, 48)])  # Обломок левого стабилизатора
+        
+            # Двигатели
+            pygame.draw.rect(surf, (200, 100, 50), (22, 48, 6, 10), border_radius=2)
+            pygame.draw.rect(surf, (255, 150, 80), (22, 48, 6, 4))
+            pygame.draw.rect(surf, (180, 80, 40), (34, 50, 4, 8), border_radius=1)
+        
+            # Повреждённые полоски
+            pygame.draw.line(surf, (200, 100, 100), (20, 32), (20, 38), 1)
+            pygame.draw.line(surf, (120, 170, 255), (30, 32), (30, 38), 1)
+            pygame.draw.rect(surf, (255, 100, 100), (10, 28, 3, 12))  # Трещина
+        elif hp_index == 2:
+            # Модель с 1 HP (серьёзно повреждена)
+        
+            # Повреждённый корпус
+            pygame.draw.polygon(surf, (150, 100, 100), [(25, 5), (15, 25), (35, 25)])
+            pygame.draw.polygon(surf, (200, 100, 100), [(25, 5), (12, 28), (38, 28)])
+            pygame.draw.rect(surf, (180, 80, 80), (14, 26, 22, 24), border_radius=5)
         
-        # Обломки стабилизаторов
-        pygame.draw.polygon(surf_1, (255, 100, 100), [(16, 42), (10, 52), (16, 48)])
-        pygame.draw.polygon(surf_1, (255, 100, 100), [(34, 42), (40, 52), (34, 48)])
+            # Повреждённая кабина
+            pygame.draw.circle(surf, (150, 100, 100), (25, 12), 4)
+            pygame.draw.circle(surf, (200, 120, 120), (25, 12), 2)
         
-        # Слабый двигатель
-        pygame.draw.rect(surf_1, (150, 50, 50), (22, 48, 6, 10), border_radius=2)
-        pygame.draw.rect(surf_1, (200, 80, 80), (22, 48, 6, 4))
+            # Обломки крыльев
+            pygame.draw.polygon(surf, (255, 100, 100), [(12, 28), (8, 35), (14, 32)])
+            pygame.draw.polygon(surf, (255, 100, 100), [(38, 28), (46, 35), (36, 32)])
         
-        # Большие трещины
-        pygame.draw.line(surf_1, (255, 100, 100), (15, 30), (35, 35), 2)
-        pygame.draw.line(surf_1, (255, 80, 80), (20, 28), (30, 42), 1)
-        pygame.draw.rect(surf_1, (255, 100, 100), (10, 28, 30, 2))
+            # Обломки стабилизаторов
+            pygame.draw.polygon(surf, (255, 100, 100), [(16, 42), (10, 52), (16, 48)])
+            pygame.draw.polygon(surf, (255, 100, 100), [(34, 42), (40, 52), (34, 48)])
         
-        models.append(surf_1)
+            # Слабый двигатель
+            pygame.draw.rect(surf, (150, 50, 50), (22, 48, 6, 10), border_radius=2)
+            pygame.draw.rect(surf, (200, 80, 80), (22, 48, 6, 4))
         
-        return models
+            # Большие трещины
+            pygame.draw.line(surf, (255, 100, 100), (15, 30), (35, 35), 2)
+            pygame.draw.line(surf, (255, 80, 80), (20, 28), (30, 42), 1)
+            pygame.draw.rect(surf, (255, 100, 100), (10, 28, 30, 2))
 
     def update(self, keys, now):
         """Обновляет состояние игрока"""
@@ -167,68 +234,52 @@ class Player(BaseSprite):
         self.rect.left = clamp(self.rect.left, 0, config.SCREEN_W - self.rect.width)
         self.rect.top = clamp(self.rect.top, 0, config.SCREEN_H - self.rect.height)
 
-        # Выбираем модель в зависимости от здоровья
+        # Выбираем готовый кадр: модель по здоровью + фазы щита и ускорения
         hp_index = max(0, min(self.hp - 1, 2))
-        base_img = self.base_images[hp_index]
+        self.mask = self.hp_masks[hp_index]
         
         # Визуальный эффект неуязвимости
         if now < self.inv_until and (now // 100) % 2 == 0:
-            self.image = pygame.Surface((50, 60), pygame.SRCALPHA)
-            pygame.draw.polygon(self.image, (255, 255, 255), [(25, 5), (15, 25), (35, 25)])
+            self.image = self.blink_frame
         elif self.damage_flash > 0:
-            # Вспышка при получении урона - показываем повреждённый корабль
-            self.image = pygame.Surface((50, 60), pygame.SRCALPHA)
-            
-            # Повреждённый корпус (серый цвет)
-            pygame.draw.polygon(self.image, (120, 120, 140), [(25, 5), (15, 25), (35, 25)])
-            pygame.draw.polygon(self.image, (100, 100, 120), [(25, 5), (12, 28), (38, 28)])
-            pygame.draw.rect(self.image, (100, 100, 120), (14, 26, 22, 24), border_radius=5)
-            
-            # Повреждённая кабина
-            pygame.draw.circle(self.image, (80, 80, 100), (25, 12), 4)
-            pygame.draw.circle(self.image, (120, 120, 140), (25, 12), 2)
-            
-            # Сломанные крылья (показываем только части)
-            if self.damage_flash % 3 != 0:  # Мигание сломанных частей
-                pygame.draw.polygon(self.image, (150, 80, 80), [(12, 28), (8, 32), (14, 30)])
-                pygame.draw.polygon(self.image, (150, 80, 80), [(38, 28), (42, 32), (36, 30)])
-            
-            # Сломанные стабилизаторы
-            if self.damage_flash % 4 != 0:
-                pygame.draw.polygon(self.image, (150, 80, 80), [(16, 42), (12, 48), (16, 46)])
-                pygame.draw.polygon(self.image, (150, 80, 80), [(34, 42), (38, 48), (34, 46)])
-            
-            # Повреждённый двигатель
-            pygame.draw.rect(self.image, (140, 80, 80), (22, 48, 6, 10), border_radius=2)
-            pygame.draw.rect(self.image, (180, 100, 100), (22, 48, 6, 2))
-            
-            # Трещины и искры
-            pygame.draw.line(self.image, (200, 100, 100), (15, 30), (35, 35), 1)
-            pygame.draw.line(self.image, (200, 120, 120), (20, 28), (30, 42), 1)
+            # Мигание сломанных частей
+            self.image = self.flash_frames[self.damage_flash % 3 != 0][self.damage_flash % 4 != 0]
         else:
-            self.image = base_img.copy()
-            
-            # Щит с анимацией
-            if now < self.shield_until:
-                radius = 30 + int(3 * math.sin(self.animation_time * 0.1))
-                pygame.draw.circle(self.image, config.POWERUP_COLOR, (25, 30), radius, 2)
-                pygame.draw.circle(self.image, config.POWERUP_COLOR, (25, 30), radius - 2, 1)
-            
-            # Эффект ускорения
-            if now < self.speed_boost_until:
-                offset = int(3 * math.sin(self.animation_time * 0.15))
-                pygame.draw.polygon(self.image, (255, 150, 50), [(18, 48 + offset), (16, 56), (20, 50)])
-                pygame.draw.polygon(self.image, (255, 150, 50), [(32, 48 + offset), (34, 56), (30, 50)])
+            shield = int(3 * math.sin(self.animation_time * 0.1)) + 4 if now < self.shield_until else 0
+            boost = int(3 * math.sin(self.animation_time * 0.15)) + 4 if now < self.speed_boost_until else 0
+            self.image = self.frames[hp_index][shield][boost]
+
+    def _next_shots(self, now):
+        """Возвращает выстрелы (x, y, тип) с учётом задержки и бонусов"""
+        delay = self.shoot_delay // 2 if now < self.rapidfire_until else self.shoot_delay
+        if now - self.last_shot < delay:
+            return []
+        self.last_shot = now
+        
+        # Двойной выстрел
+        if now < self.dual_shot_until:
+            return [
+                (self.rect.centerx - 10, self.rect.top + 10, "dual"),
+                (self.rect.centerx + 10, self.rect.top + 10, "dual"),
+            ]
+        
+        # Одиночная пуля
+        return [(self.rect.centerx, self.rect.top, "normal")]
 
-    def shoot(self, now):
-        """Стреляет с учётом задержки"""
-        if now - self.last_shot >= self.shoot_delay:
-            self.last_shot = now
-            
-            # Одиночная пуля
-            bullet = Bullet(self.rect.centerx, self.rect.top, -math.pi / 2)
-            bullet.speed *= 1.5  # Увеличиваем скорость пули
-            return [bullet]
+    def shoot(self, now, pool=None):
+        """Стреляет с учётом задержки; пули берутся из пула, если он передан"""
+        make = pool.acquire if pool is not None else Bullet
+        return [make(x, y, bullet_type) for x, y, bullet_type in self._next_shots(now)]
+
+    def fire(self, now, projectiles):
+        """Стреляет в поле снарядов вместо создания спрайтов"""
+        for x, y, bullet_type in self._next_shots(now):
+            projectiles.spawn(x, y, bullet_type)
+
+    def try_shoot(self, now, bullets, all_sprites, pool=None):
+        """Стреляет и добавляет новые пули в группы"""
+        for bullet in self.shoot(now, pool):
+            bullet.add(bullets, all_sprites)
         
     def damage(self, now, amount=1):
         """Получает урон"""
@@ -256,4 +307,19 @@ class Player(BaseSprite):
             self.speed_boost_until = now + 5000
             self.boost_speed = int(self.speed * 1.5)
         elif ptype == "dual_shot":
-            self.dual_shot_until = now + 7000
\ No newline at end of file
+            self.dual_shot_until = now + 7000
+
+def _register_player_frames():
+    for i in range(3):
+        assets.register(f"player/hp{i}", lambda i=i: Player.build_model(i))
+        for shield in Player.FRAME_PHASES:
+            for boost in Player.FRAME_PHASES:
+                assets.register(Player._frame_key(i, shield, boost),
+                                lambda i=i, shield=shield, boost=boost: Player.build_frame(i, shield, boost))
+    for wings in (False, True):
+        for stabs in (False, True):
+            assets.register(f"player/flash/{int(wings)}{int(stabs)}",
+                            lambda wings=wings, stabs=stabs: Player.build_flash_frame(wings, stabs))
+    assets.register("player/blink", Player.build_blink_frame)
+
+_register_player_frames()
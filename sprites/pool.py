@@ -0,0 +1,91 @@
+import pygame
+import config
+
+try:
+    BaseSprite = pygame.sprite.Sprite
+except:
+    BaseSprite = object
+
+class PooledSprite(BaseSprite):
+    """Спрайт, который после kill() возвращается в свой пул вместо сборщика мусора.
+
+    Подкласс определяет reset(*args) с теми же аргументами, что и конструктор: пул вызывает его при повторной выдаче.
+    """
+    pool = None
+    in_pool = False
+
+    def kill(self):
+        super().kill()
+        if self.pool is not None and not self.in_pool:
+            self.pool.release(self)
+
+class SpritePool:
+    """Пул переиспользуемых спрайтов одного класса с ограничением размера"""
+
+    def __init__(self, cls, max_size):
+        self.cls = cls
+        self.max_size = max_size
+        self.free = []
+        self.hits = 0
+        self.misses = 0
+        self.dropped = 0
+
+    def acquire(self, *args, groups=()):
+        """Выдаёт спрайт из пула (или создаёт новый) и добавляет его в группы"""
+        if self.free:
+            sprite = self.free.pop()
+            sprite.reset(*args)
+            self.hits += 1
+        else:
+            sprite = self.cls(*args)
+            sprite.pool = self
+            self.misses += 1
+        sprite.in_pool = False
+        if groups:
+            sprite.add(*groups)
+        return sprite
+
+    def release(self, sprite):
+        # Спрайт уже убран из всех групп через kill()
+        sprite.in_pool = True
+        if len(self.free) < self.max_size:
+            self.free.append(sprite)
+        else:
+            self.dropped += 1
+
+    def prefill(self, count, *args):
+        for _ in range(min(count, self.max_size - len(self.free))):
+            sprite = self.cls(*args)
+            sprite.pool = self
+            self.release(sprite)
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "free": len(self.free),
+            "dropped": self.dropped,
+            "max_size": self.max_size,
+        }
+
+class SpritePools:
+    """Пулы пуль, врагов и бонусов одной игровой сессии"""
+
+    def __init__(self, sizes=None):
+        from .bullet import Bullet
+        from .enemy import Enemy
+        from .powerup import PowerUp
+
+        sizes = {**config.POOL_SIZES, **(sizes or {})}
+        self.bullet = SpritePool(Bullet, sizes["bullet"])
+        self.enemy = SpritePool(Enemy, sizes["enemy"])
+        self.powerup = SpritePool(PowerUp, sizes["powerup"])
+
+    def stats(self):
+        return {
+            "bullet": self.bullet.stats(),
+            "enemy": self.enemy.stats(),
+            "powerup": self.powerup.stats(),
+        }
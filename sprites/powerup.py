@@ -2,13 +2,10 @@ import pygame
 import random
 import math
 import config
+from .assets import assets, faded
+from .pool import PooledSprite
 
-try:
-    BaseSprite = pygame.sprite.Sprite
-except:
-    BaseSprite = object
-
-class PowerUp(BaseSprite):
+class PowerUp(PooledSprite):
     POWERUP_MODELS = {
         "shield": (config.POWERUP_COLOR, "shield"),
         "rapidfire": ((255, 200, 50), "fire"),
@@ -19,10 +16,15 @@ class PowerUp(BaseSprite):
 
     def __init__(self, x, y, ptype):
         super().__init__()
+        self.reset(x, y, ptype)
+
+    def reset(self, x, y, ptype):
         self.ptype = ptype
-        self.image = pygame.Surface((48, 48), pygame.SRCALPHA)
-        color, model_type = self.POWERUP_MODELS.get(ptype, (config.POWERUP_COLOR, "shield"))
-        self._draw_powerup_model(self.image, color, model_type)
+        key = ptype if ptype in self.POWERUP_MODELS else "shield"
+        self.image_normal = assets.get(f"powerup/{key}")
+        self.image_faded = assets.get(f"powerup/{key}/faded")
+        self.image = self.image_normal
+        self.mask = assets.mask(f"powerup/{key}")
         self.rect = self.image.get_rect(center=(x, y))
         self.vy = 1.5
         self.life = 300
@@ -30,7 +32,15 @@ class PowerUp(BaseSprite):
         self.bob_offset = 0
         self.base_y = y
 
-    def _draw_powerup_model(self, surf, color, model_type):
+    @classmethod
+    def build_image(cls, ptype):
+        surf = pygame.Surface((48, 48), pygame.SRCALPHA)
+        color, model_type = cls.POWERUP_MODELS[ptype]
+        cls._draw_powerup_model(surf, color, model_type)
+        return surf
+
+    @staticmethod
+    def _draw_powerup_model(surf, color, model_type):
         center = 24
         
         if model_type == "shield":
@@ -82,10 +92,11 @@ class PowerUp(BaseSprite):
             self.kill()
         
         # Пульсирующий эффект при скором исчезновении
-        if self.life < 60:
-            if (self.life // 10) % 2 == 0:
-                self.image.set_alpha(180)
-            else:
-                self.image.set_alpha(255)
+        if self.life < 60 and (self.life // 10) % 2 == 0:
+            self.image = self.image_faded
         else:
-            self.image.set_alpha(255)
+            self.image = self.image_normal
+
+for _ptype in PowerUp.POWERUP_MODELS:
+    assets.register(f"powerup/{_ptype}", lambda t=_ptype: PowerUp.build_image(t))
+    assets.register(f"powerup/{_ptype}/faded", lambda t=_ptype: faded(assets.get(f"powerup/{t}"), 180))
@@ -0,0 +1,198 @@
+import pygame
+import numpy as np
+import config
+from physics import PointGrid
+from .assets import assets
+
+class ProjectileField:
+    """Снаряды в массивах NumPy: движение, отсечение и столкновения считаются пакетно"""
+    TYPES = ("normal", "dual")
+    OWNER_PLAYER, OWNER_ENEMY = 0, 1
+
+    def __init__(self, capacity=config.PROJECTILE_CAPACITY, size=(6, 12)):
+        self.capacity = capacity
+        self.half_w, self.half_h = size[0] / 2, size[1] / 2
+        self.count = 0
+
+        # Центры снарядов; живые лежат в [0, count)
+        self.pos = np.zeros((capacity, 2), dtype=np.float32)
+        self.vel = np.zeros((capacity, 2), dtype=np.float32)
+        self.kind = np.zeros(capacity, dtype=np.uint8)
+        self.owner = np.zeros(capacity, dtype=np.uint8)
+        self.blit_count = 0
+        self.grid = PointGrid(config.PROJECTILE_GRID_CELL)
+        self.grid_pairs = config.PROJECTILE_GRID_PAIRS
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        self.count = 0
+
+    def spawn(self, x, y, bullet_type="normal", vx=0.0, vy=-config.BULLET_SPEED, owner=OWNER_PLAYER):
+        if self.count >= self.capacity:
+            return False
+        i = self.count
+        self.pos[i] = x, y
+        self.vel[i] = vx, vy
+        self.kind[i] = self.TYPES.index(bullet_type)
+        self.owner[i] = owner
+        self.count += 1
+        return True
+
+    def spawn_many(self, xs, ys, bullet_type="normal", vx=0.0, vy=-config.BULLET_SPEED, owner=OWNER_PLAYER):
+        """Добавляет пачку снарядов; лишние при переполнении отбрасываются"""
+        xs = np.asarray(xs, dtype=np.float32)
+        n = min(len(xs), self.capacity - self.count)
+        if n <= 0:
+            return 0
+        s = slice(self.count, self.count + n)
+        self.pos[s, 0] = xs[:n]
+        self.pos[s, 1] = np.broadcast_to(np.asarray(ys, dtype=np.float32), xs.shape)[:n]
+        self.vel[s, 0] = np.broadcast_to(np.asarray(vx, dtype=np.float32), xs.shape)[:n]
+        self.vel[s, 1] = np.broadcast_to(np.asarray(vy, dtype=np.float32), xs.shape)[:n]
+        self.kind[s] = self.TYPES.index(bullet_type)
+        self.owner[s] = owner
+        self.count += n
+        return n
+
+    def update(self):
+        """Сдвигает снаряды и удаляет улетевшие за экран"""
+        n = self.count
+        if n == 0:
+            return
+        pos = self.pos[:n]
+        pos += self.vel[:n]
+        x, y = pos[:, 0], pos[:, 1]
+        alive = ((y + self.half_h > 0) & (y - self.half_h < config.SCREEN_H)
+                 & (x + self.half_w > 0) & (x - self.half_w < config.SCREEN_W))
+        self._keep(alive)
+
+    def _keep(self, alive):
+        # Swap-remove: дыры в голове заполняются живыми снарядами из хвоста
+        n = self.count
+        n_alive = int(np.count_nonzero(alive))
+        if n_alive == n:
+            return
+        holes = np.flatnonzero(~alive[:n_alive])
+        movers = n_alive + np.flatnonzero(alive[n_alive:])
+        if holes.size:
+            self.pos[holes] = self.pos[movers]
+            self.vel[holes] = self.vel[movers]
+            self.kind[holes] = self.kind[movers]
+            self.owner[holes] = self.owner[movers]
+        self.count = n_alive
+
+    def collide(self, sprites, owner=OWNER_PLAYER, dokill=True, precise=False):
+        """Проверяет снаряды владельца против rect'ов спрайтов.
+
+        Возвращает {sprite: число попаданий}, как ключи groupcollide(); каждый снаряд
+        засчитывается только первому спрайту, в который попал. При precise=True пары,
+        прошедшие проверку rect, дополнительно сверяются по маскам. Больше grid_pairs пар
+        (снаряды x спрайты) кандидаты берутся из сетки PointGrid.
+        """
+        n = self.count
+        hits = {}
+        if n == 0 or not sprites:
+            return hits
+        x, y = self.pos[:n, 0], self.pos[:n, 1]
+        left, right = x - self.half_w, x + self.half_w
+        top, bottom = y - self.half_h, y + self.half_h
+        free = self.owner[:n] == owner
+        if n * len(sprites) > self.grid_pairs:
+            self._collide_grid(sprites, hits, free, left, top, right, bottom, precise)
+        else:
+            self._collide_all(sprites, hits, free, left, top, right, bottom, precise)
+        if hits and dokill:
+            self._keep((self.owner[:n] != owner) | free)
+        return hits
+
+    def _collide_all(self, sprites, hits, free, left, top, right, bottom, precise):
+        # Каждый спрайт против всех снарядов сразу
+        for sprite in sprites:
+            r = sprite.rect
+            mask = free & (left < r.right) & (right > r.left) & (top < r.bottom) & (bottom > r.top)
+            if precise and mask.any():
+                mask = self._mask_filter(sprite, mask, left, top)
+            count = int(np.count_nonzero(mask))
+            if count:
+                hits[sprite] = count
+                free &= ~mask
+
+    def _collide_grid(self, sprites, hits, free, left, top, right, bottom, precise):
+        # Все пары спрайт-снаряд из соседних ячеек проверяются разом; снаряд достаётся
+        # спрайту с наименьшим номером, как при последовательной проверке в _collide_all
+        n = self.count
+        grid = self.grid
+        grid.build(self.pos[:n, 0], self.pos[:n, 1])
+        rects = np.array([tuple(sprite.rect) for sprite in sprites], dtype=np.int32)
+        rl, rt = rects[:, 0], rects[:, 1]
+        rr, rb = rl + rects[:, 2], rt + rects[:, 3]
+        si, pi = grid.pairs(rl - self.half_w, rt - self.half_h, rr + self.half_w, rb + self.half_h)
+        # Сначала по x, затем по y на уже отобранных: каждая выборка короче предыдущей
+        x = self.pos[pi, 0]
+        ok = (x - self.half_w < rr[si]) & (x + self.half_w > rl[si]) & free[pi]
+        si, pi = si[ok], pi[ok]
+        y = self.pos[pi, 1]
+        ok = (y - self.half_h < rb[si]) & (y + self.half_h > rt[si])
+        si, pi = si[ok], pi[ok]
+        if precise and si.size:
+            masks = [assets.mask(f"bullet/{t}") for t in self.TYPES]
+            keep = [sprites[s].mask.overlap(masks[self.kind[p]], (int(left[p]) - int(rl[s]), int(top[p]) - int(rt[s]))) is not None
+                    for s, p in zip(si.tolist(), pi.tolist())]
+            si, pi = si[keep], pi[keep]
+        if not si.size:
+            return
+        # Пары упорядочены по спрайту; при записи в обратном порядке у повторяющегося
+        # снаряда остаётся последняя запись - спрайт с наименьшим номером
+        winner = np.full(n, len(sprites), dtype=np.intp)
+        winner[pi[::-1]] = si[::-1]
+        won = winner < len(sprites)
+        counts = np.bincount(winner[won], minlength=len(sprites))
+        for i in np.flatnonzero(counts).tolist():
+            hits[sprites[i]] = int(counts[i])
+        free[won] = False
+
+    def _mask_filter(self, sprite, mask, left, top):
+        masks = [assets.mask(f"bullet/{t}") for t in self.TYPES]
+        r = sprite.rect
+        for i in np.flatnonzero(mask).tolist():
+            offset = (int(left[i]) - r.left, int(top[i]) - r.top)
+            if sprite.mask.overlap(masks[self.kind[i]], offset) is None:
+                mask[i] = False
+        return mask
+
+    def render_pos(self, alpha=1.0):
+        """Центры для отрисовки между прошлым (alpha=0) и текущим (alpha=1) шагом"""
+        pos = self.pos[:self.count]
+        if alpha >= 1.0:
+            return pos
+        return pos + self.vel[:self.count] * (alpha - 1.0)
+
+    def bounds(self, alpha=1.0):
+        """Ограничивающий прямоугольник живых снарядов или None"""
+        n = self.count
+        if n == 0:
+            return None
+        pos = self.render_pos(alpha)
+        lo = pos.min(axis=0)
+        hi = pos.max(axis=0)
+        x, y = int(lo[0] - self.half_w), int(lo[1] - self.half_h)
+        return pygame.Rect(x, y, int(hi[0] + self.half_w) - x + 1, int(hi[1] + self.half_h) - y + 1)
+
+    def items(self, alpha=1.0):
+        """Пары (изображение, левый верхний угол) для отрисовки"""
+        n = self.count
+        if n == 0:
+            return []
+        images = [assets.get(f"bullet/{t}") for t in self.TYPES]
+        pos = self.render_pos(alpha)
+        x = (pos[:, 0] - self.half_w).astype(np.int32)
+        y = (pos[:, 1] - self.half_h).astype(np.int32)
+        sprites = [images[k] for k in self.kind[:n].tolist()]
+        return list(zip(sprites, zip(x.tolist(), y.tolist())))
+
+    def draw(self, screen, alpha=1.0):
+        self.blit_count = self.count
+        if self.count:
+            screen.blits(self.items(alpha), doreturn=False)
@@ -0,0 +1,25 @@
+import random
+import pytest
+from sim.batch import RunningStats
+
+def test_small_batch_quantiles_are_exact():
+    stats = RunningStats(100)
+    for x in (120, 130, 150, 160, 190):
+        stats.add(x)
+    # Все значения в одной корзине, но квантили всё равно различаются
+    assert stats.quantile(0.1) == pytest.approx(124.0)
+    assert stats.quantile(0.5) == 150
+    assert stats.quantile(0.9) == pytest.approx(178.0)
+
+def test_large_batch_falls_back_to_histogram():
+    rng = random.Random(1)
+    xs = [rng.gauss(1000, 300) for _ in range(3000)]
+    stats = RunningStats(100, exact_samples=500)
+    for x in xs:
+        stats.add(x)
+    assert stats.samples is None
+    ordered = sorted(xs)
+    for q in (0.1, 0.5, 0.9):
+        exact = ordered[int(q * (len(xs) - 1))]
+        assert abs(stats.quantile(q) - exact) < 20
+    assert stats.min <= stats.quantile(0.0) and stats.quantile(1.0) <= stats.max
@@ -0,0 +1,49 @@
+import pygame
+from sprites.bullet import Bullet
+from sprites.pool import SpritePool
+
+def test_kill_returns_sprite_to_pool():
+    pool = SpritePool(Bullet, 4)
+    group = pygame.sprite.Group()
+    bullet = pool.acquire(100, 200, groups=(group,))
+    bullet.kill()
+    assert bullet.in_pool
+    assert pool.free == [bullet]
+    assert not bullet.alive()
+
+def test_acquire_reuses_sprite_with_reset_state():
+    pool = SpritePool(Bullet, 4)
+    bullet = pool.acquire(100, 200)
+    bullet.trail_points.append((1, 2))
+    bullet.vy = 0
+    bullet.kill()
+
+    again = pool.acquire(50, 60, "dual")
+    assert again is bullet
+    assert not again.in_pool
+    assert again.rect.center == (50, 60)
+    assert again.bullet_type == "dual"
+    assert again.trail_points == []
+    assert again.vy != 0
+    assert pool.stats()["hits"] == 1 and pool.stats()["misses"] == 1
+
+def test_reused_sprite_is_only_in_new_groups():
+    pool = SpritePool(Bullet, 4)
+    old_group, new_group = pygame.sprite.Group(), pygame.sprite.Group()
+    bullet = pool.acquire(10, 10, groups=(old_group,))
+    bullet.kill()
+    again = pool.acquire(20, 20, groups=(new_group,))
+    assert again.groups() == [new_group]
+    assert len(old_group) == 0
+    # Повторный kill не кладёт спрайт в пул дважды
+    again.kill()
+    again.kill()
+    assert pool.free == [again]
+
+def test_full_pool_drops_extra_sprites():
+    pool = SpritePool(Bullet, 1)
+    first, second = pool.acquire(0, 0), pool.acquire(0, 0)
+    first.kill()
+    second.kill()
+    assert pool.free == [first]
+    assert pool.stats()["dropped"] == 1
@@ -0,0 +1,50 @@
+import pytest
+from sim.headless import replay, run_headless
+from sim.replay import Recording
+
+TICKS = 600
+
+@pytest.fixture
+def recorded(tmp_path):
+    path = tmp_path / "session.rpl"
+    stats = run_headless(TICKS, "Normal", seed=7, record_path=str(path))
+    return path, stats
+
+def test_replay_matches_recorded_hash(recorded):
+    path, stats = recorded
+    recording = Recording.load(path)
+    assert len(recording) == stats["ticks"]
+    assert recording.seed == 7
+    assert recording.final_hash == stats["hash"]
+
+    result = replay(str(path))
+    assert result["ok"]
+    assert result["hash"] == stats["hash"]
+    assert result["ticks"] == stats["ticks"]
+
+def test_round_trip_through_bytes(recorded):
+    path, _ = recorded
+    recording = Recording.load(path)
+    copy = Recording.from_bytes(recording.to_bytes())
+    assert (copy.seed, copy.difficulty, copy.final_hash, copy.sim_hz) == \
+        (recording.seed, recording.difficulty, recording.final_hash, recording.sim_hz)
+    assert list(copy.masks) == list(recording.masks)
+
+def test_wrong_version_is_rejected(recorded):
+    path, _ = recorded
+    data = bytearray(path.read_bytes())
+    # Байт версии идёт сразу за magic
+    data[len(Recording.MAGIC)] = Recording.VERSION - 1
+    with pytest.raises(ValueError, match="unsupported version"):
+        Recording.from_bytes(bytes(data))
+
+def test_truncated_masks_are_rejected(recorded):
+    path, _ = recorded
+    recording = Recording.load(path)
+    recording.masks = recording.masks[:-1]
+    data = bytearray(recording.to_bytes())
+    # Заголовок по-прежнему обещает исходное число тиков
+    Recording.HEADER.pack_into(data, 0, Recording.MAGIC, Recording.VERSION, recording.sim_hz, recording.seed,
+                               len(recording) + 1, bytes.fromhex(recording.final_hash), len(recording.difficulty.encode()))
+    with pytest.raises(ValueError, match="truncated"):
+        Recording.from_bytes(bytes(data))
@@ -1,4 +1,5 @@
 from .menu import Menu
 from .settings import Settings
+from .text import FontRegistry, TextCache, fonts, text_cache
 
-__all__ = ["Menu", "Settings"]
+__all__ = ["Menu", "Settings", "FontRegistry", "TextCache", "fonts", "text_cache"]
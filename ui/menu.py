@@ -1,19 +1,54 @@
 import pygame
 import math
 import config
+from effects.stars import Starfield, StarLayer
+from effects.quality import quality
+from render import DirtyRegions
 from .settings import Settings
+from .text import text_cache
+from .menu_renderer import MenuRenderer
+
+# Кадры пульсации по animation_counter (0..359): размеры шрифта заголовка и выбранного пункта
+TITLE_SIZES = [int(72 * (1.0 + 0.15 * math.sin(c * 0.02))) for c in range(360)]
+ITEM_SIZES = [int(36 * (1.0 + 0.1 * math.sin(c * 0.1))) for c in range(360)]
+
+# Заголовок каждого состояния меню: текст, цвет и кадры размеров
+TITLES = {
+    "main": ("ARCADE", config.PLAYER_COLOR, TITLE_SIZES),
+    "difficulty": ("SELECT DIFFICULTY", config.ENEMY_COLOR, (int(60 * 0.7),)),
+    "settings": ("SETTINGS", config.POWERUP_COLOR, TITLE_SIZES),
+}
+
+DIFFICULTY_DESCRIPTIONS = {
+    "Easy": "Perfect for beginners",
+    "Normal": "Well balanced gameplay",
+    "Hard": "For experienced players",
+    "Nightmare": "Ultimate challenge",
+}
+
+DIFFICULTY_COLORS = {
+    "Easy": (100, 255, 150),
+    "Normal": (100, 200, 255),
+    "Hard": (255, 180, 80),
+    "Nightmare": (255, 100, 100),
+}
 
 class Menu:
-    def __init__(self, screen, font, big_font):
+    def __init__(self, screen):
         self.screen = screen
-        self.font = font
-        self.big_font = big_font
         self.settings = Settings()
         self.state = "main"
         self.selected = 0
         self.difficulties = list(Settings.DIFFICULTIES.keys())
         self.animation_counter = 0
         self.start_game_triggered = False
+        self.background = Starfield([
+            StarLayer(40, 1, 0.5, (80, 80, 200), twinkle=0.4),
+            StarLayer(40, 2, 0.5, (90, 90, 200), twinkle=0.4),
+        ])
+        self.dirty = DirtyRegions()
+        self._last_view = None
+        self.renderer = MenuRenderer()
 
     def handle_events(self):
         for event in pygame.event.get():
@@ -40,7 +75,7 @@ class Menu:
         elif self.state == "difficulty":
             return len(self.difficulties)
         elif self.state == "settings":
-            return 4
+            return 5
         return 0
 
     def _handle_selection(self):
@@ -65,9 +100,13 @@ class Menu:
             elif self.selected == 1:
                 self.settings.show_fps = not self.settings.show_fps
             elif self.selected == 2:
+                qualities = Settings.QUALITIES
+                self.settings.quality = qualities[(qualities.index(self.settings.quality) + 1) % len(qualities)]
+                quality.select(self.settings.quality)
+            elif self.selected == 3:
                 self.state = "main"
                 self.selected = 1
-            elif self.selected == 3:
+            elif self.selected == 4:
                 self.start_game_triggered = True
                 return "start"
         return None
@@ -75,174 +114,124 @@ class Menu:
     def update(self):
         self.animation_counter = (self.animation_counter + 1) % 360
 
+    def _track_dirty(self):
+        """Грязные области меню: звёзды, пульсирующий заголовок и выбранный пункт"""
+        dirty = self.dirty
+        dirty.begin()
+        view = (self.state, self.selected, self.settings.to_dict())
+        if view != self._last_view:
+            self._last_view = view
+            dirty.invalidate()
+        for rect in self.background.dirty_rects():
+            dirty.add(rect)
+        dirty.add((0, 0, config.SCREEN_W, 115))
+        y_start = 220 if self.state == "difficulty" else 240
+        dirty.add((35, y_start + self.selected * 75 - 28, 410, 72))
+        return dirty.end()
+
     def draw(self):
-        self.screen.fill(config.BG_COLOR)
-        self._draw_animated_bg()
-        
-        if self.state == "main":
-            self._draw_main_menu()
-        elif self.state == "difficulty":
-            self._draw_difficulty_menu()
-        elif self.state == "settings":
-            self._draw_settings_menu()
-        
-        pygame.display.flip()
+        self.background.update()
+        # Густота фона по текущему уровню качества; при смене перерисовывается весь кадр
+        if self.background.set_density(quality.menu_stars):
+            self.dirty.invalidate()
+        full = self._track_dirty()
+        if full:
+            self.screen.fill(config.BG_COLOR)
+            self._draw_animated_bg()
+        else:
+            self.background.restore(self.screen, self.dirty.rects)
+        
+        # Статический слой текущего состояния: целиком или только в грязных областях
+        panel = self.renderer.panel(self._panel_key(), self._build_panel)
+        if full:
+            self.screen.blit(panel, (0, 0))
+        else:
+            self.screen.blits([(panel, r, r) for r in self.dirty.rects], doreturn=False)
+        
+        # Анимированные части - готовые кадры
+        shadow, title, (x, y) = self._title_frame()
+        self.screen.blits([(shadow, (x + 3, y + 3)), (title, (x, y))], doreturn=False)
+        y_start, items, text_dy = self._layout()
+        text, _ = items[self.selected]
+        txt = text_cache.render(text, (10, 10, 20), ITEM_SIZES[self.animation_counter], bold=True)
+        self.screen.blit(txt, txt.get_rect(center=(config.SCREEN_W // 2, y_start + self.selected * 75 + text_dy)))
+        
+        self.dirty.present()
 
     def _draw_animated_bg(self):
-        for i in range(80):
-            x = (i * 59) % config.SCREEN_W
-            y = (i * 73 + self.animation_counter // 2) % config.SCREEN_H
-            size = 1 + (i % 2)
-            shade = 60 + int(40 * math.sin(self.animation_counter * 0.01 + i))
-            pygame.draw.circle(self.screen, (shade, shade, 200), (x, y), size)
-
-    def _draw_main_menu(self):
-        pulse = 1.0 + 0.15 * math.sin(self.animation_counter * 0.02)
-        title_size = int(72 * pulse)
-        title_font = pygame.font.SysFont("arial", title_size, bold=True)
-        title = title_font.render("ARCADE", True, config.PLAYER_COLOR)
-        title_rect = title.get_rect(center=(config.SCREEN_W // 2, 60))
-        
-        shadow = title_font.render("ARCADE", True, (20, 20, 50))
-        self.screen.blit(shadow, (title_rect.x + 3, title_rect.y + 3))
-        self.screen.blit(title, title_rect)
-        
-        subtitle = pygame.font.SysFont("arial", 32, bold=True).render("TOP-DOWN SHOOTER", True, (100, 200, 255))
-        self.screen.blit(subtitle, subtitle.get_rect(center=(config.SCREEN_W // 2, 125)))
-        
-        menu_items = [
-            ("PLAY", (100, 200, 255)),
-            ("SETTINGS", (100, 255, 200)),
-            ("EXIT", (255, 150, 150)),
-        ]
-        
-        y_start = 240
-        item_height = 75
-        
-        for i, (text, color) in enumerate(menu_items):
-            is_selected = i == self.selected
-            y_pos = y_start + i * item_height
-            
-            if is_selected:
-                scale = 1.0 + 0.1 * math.sin(self.animation_counter * 0.1)
-                pygame.draw.rect(self.screen, color, (50, y_pos - 20, 380, 55), border_radius=10)
-                pygame.draw.rect(self.screen, (255, 255, 255), (50, y_pos - 20, 380, 55), 3, border_radius=10)
-                text_color = (10, 10, 20)
-                font_size = int(36 * scale)
-            else:
-                pygame.draw.rect(self.screen, color, (50, y_pos - 20, 380, 55), 2, border_radius=10)
-                text_color = color
-                font_size = 32
-            
-            txt_font = pygame.font.SysFont("arial", font_size, bold=True)
-            txt = txt_font.render(text, True, text_color)
-            self.screen.blit(txt, txt.get_rect(center=(config.SCREEN_W // 2, y_pos)))
-
-    def _draw_difficulty_menu(self):
-        pulse = 0.7 #1.0 + 0.08 * math.sin(self.animation_counter * 0.02)
-        title_size = int(60 * pulse)
-        title_font = pygame.font.SysFont("arial", title_size, bold=True)
-        
-        # Main title with enhanced styling
-        title = title_font.render("SELECT DIFFICULTY", True, config.ENEMY_COLOR)
-        title_rect = title.get_rect(center=(config.SCREEN_W // 2, 60))
-        
-        # Shadow effect
-        shadow = title_font.render("SELECT DIFFICULTY", True, (20, 20, 50))
-        self.screen.blit(shadow, (title_rect.x + 3, title_rect.y + 3))
-        self.screen.blit(title, title_rect)
-        
-        # Subtitle with glow effect
-        subtitle_font = pygame.font.SysFont("arial", 28, bold=True)
-        subtitle = subtitle_font.render("Choose Your Challenge", True, (150, 150, 200))
-        self.screen.blit(subtitle, subtitle.get_rect(center=(config.SCREEN_W // 2, 120)))
-        
-        # Decorative line
-        pygame.draw.line(self.screen, (100, 150, 200), (80, 155), (config.SCREEN_W - 80, 155), 2)
-        pygame.draw.line(self.screen, (150, 200, 255), (80, 157), (config.SCREEN_W - 80, 157), 1)
-        
-        descriptions = {
-            "Easy": "Perfect for beginners",
-            "Normal": "Well balanced gameplay",
-            "Hard": "For experienced players",
-            "Nightmare": "Ultimate challenge",
-        }
-        
-        colors_difficulty = {
-            "Easy": (100, 255, 150),
-            "Normal": (100, 200, 255),
-            "Hard": (255, 180, 80),
-            "Nightmare": (255, 100, 100),
-        }
-        
-        y_start = 220
-        item_height = 75
-        
-        for i, difficulty in enumerate(self.difficulties):
-            is_selected = i == self.selected
-            y_pos = y_start + i * item_height
-            color = colors_difficulty[difficulty]
-            
-            if is_selected:
-                scale = 1.0 + 0.1 * math.sin(self.animation_counter * 0.1)
-                
-                # Glow effect for selected item
-                glow_color = tuple(min(255, c + 50) for c in color)
-                pygame.draw.rect(self.screen, glow_color, (40, y_pos - 25, 400, 65), border_radius=12)
-                pygame.draw.rect(self.screen, color, (45, y_pos - 22, 390, 59), border_radius=10)
-                pygame.draw.rect(self.screen, (255, 255, 255), (45, y_pos - 22, 390, 59), 3, border_radius=10)
-                
-                text_color = (10, 10, 20)
-                font_size = int(36 * scale)
-            else:
-                pygame.draw.rect(self.screen, color, (50, y_pos - 20, 380, 55), 2, border_radius=10)
-                text_color = color
-                font_size = 32
-            
-            txt_font = pygame.font.SysFont("arial", font_size, bold=True)
-            txt = txt_font.render(difficulty.upper(), True, text_color)
-            self.screen.blit(txt, txt.get_rect(center=(config.SCREEN_W // 2, y_pos - 5)))
-            
-            desc_font = pygame.font.SysFont("arial", 18)
-            desc = desc_font.render(descriptions[difficulty], True, (180, 180, 200))
-            self.screen.blit(desc, desc.get_rect(center=(config.SCREEN_W // 2, y_pos + 18)))
-
-    def _draw_settings_menu(self):
-        pulse = 1.0 + 0.15 * math.sin(self.animation_counter * 0.02)
-        title_size = int(72 * pulse)
-        title_font = pygame.font.SysFont("arial", title_size, bold=True)
-        title = title_font.render("SETTINGS", True, config.POWERUP_COLOR)
-        title_rect = title.get_rect(center=(config.SCREEN_W // 2, 60))
-        
-        shadow = title_font.render("SETTINGS", True, (20, 20, 50))
-        self.screen.blit(shadow, (title_rect.x + 3, title_rect.y + 3))
-        self.screen.blit(title, title_rect)
-        
-        settings_items = [
+        for layer in self.background.layers:
+            self.screen.blit(layer.image, (0, 0), layer.area)
+
+    def _layout(self):
+        """Возвращает (y первого пункта, [(текст, цвет)], сдвиг текста по y) для текущего состояния"""
+        if self.state == "main":
+            return 240, [
+                ("PLAY", (100, 200, 255)),
+                ("SETTINGS", (100, 255, 200)),
+                ("EXIT", (255, 150, 150)),
+            ], 0
+        elif self.state == "difficulty":
+            return 220, [(d.upper(), DIFFICULTY_COLORS[d]) for d in self.difficulties], -5
+        return 240, [
             (f"SOUND: {'ON' if self.settings.sfx_enabled else 'OFF'}", (100, 255, 200)),
             (f"FPS COUNTER: {'ON' if self.settings.show_fps else 'OFF'}", (100, 200, 255)),
+            (f"QUALITY: {self.settings.quality.upper()}", (200, 150, 255)),
             (f"DIFFICULTY: {self.settings.difficulty.upper()}", (255, 200, 100)),
             ("START GAME", (100, 255, 150)),
-        ]
+        ], 0
+
+    def _title_frame(self):
+        text, color, sizes = TITLES.get(self.state, TITLES["main"])
+        size = sizes[self.animation_counter % len(sizes)]
         
-        y_start = 240
-        item_height = 75
+        shadow, title = self.renderer.title(text, color, size)
+        return shadow, title, title.get_rect(center=(config.SCREEN_W // 2, 60)).topleft
+
+    def bake_iter(self):
+        """Запекает кадры заголовков по одному за шаг; для фонового прогрева, пока меню простаивает"""
+        for text, color, sizes in TITLES.values():
+            for size in sorted(set(sizes)):
+                self.renderer.title(text, color, size)
+                yield
+
+    def _panel_key(self):
+        return (self.state, self.selected, tuple(self.settings.to_dict().items()))
+
+    def _build_panel(self, surf):
+        """Рисует всё неподвижное: подзаголовок, линии, рамки пунктов, невыбранные надписи"""
+        center_x = config.SCREEN_W // 2
+        if self.state == "main":
+            subtitle = text_cache.render("TOP-DOWN SHOOTER", (100, 200, 255), 32, bold=True)
+            surf.blit(subtitle, subtitle.get_rect(center=(center_x, 125)))
+        elif self.state == "difficulty":
+            # Subtitle with glow effect
+            subtitle = text_cache.render("Choose Your Challenge", (150, 150, 200), 28, bold=True)
+            surf.blit(subtitle, subtitle.get_rect(center=(center_x, 120)))
+            
+            # Decorative line
+            pygame.draw.line(surf, (100, 150, 200), (80, 155), (config.SCREEN_W - 80, 155), 2)
+            pygame.draw.line(surf, (150, 200, 255), (80, 157), (config.SCREEN_W - 80, 157), 1)
         
-        for i, (text, color) in enumerate(settings_items):
-            is_selected = i == self.selected
+        y_start, items, text_dy = self._layout()
+        item_height = 75
+        for i, (text, color) in enumerate(items):
             y_pos = y_start + i * item_height
             
-            if is_selected:
-                scale = 1.0 + 0.1 * math.sin(self.animation_counter * 0.1)
-                pygame.draw.rect(self.screen, color, (50, y_pos - 20, 380, 55), border_radius=10)
-                pygame.draw.rect(self.screen, (255, 255, 255), (50, y_pos - 20, 380, 55), 3, border_radius=10)
-                text_color = (10, 10, 20)
-                font_size = int(36 * scale)
+            if i == self.selected:
+                if self.state == "difficulty":
+                    # Glow effect for selected item
+                    glow_color = tuple(min(255, c + 50) for c in color)
+                    pygame.draw.rect(surf, glow_color, (40, y_pos - 25, 400, 65), border_radius=12)
+                    pygame.draw.rect(surf, color, (45, y_pos - 22, 390, 59), border_radius=10)
+                    pygame.draw.rect(surf, (255, 255, 255), (45, y_pos - 22, 390, 59), 3, border_radius=10)
+                else:
+                    pygame.draw.rect(surf, color, (50, y_pos - 20, 380, 55), border_radius=10)
+                    pygame.draw.rect(surf, (255, 255, 255), (50, y_pos - 20, 380, 55), 3, border_radius=10)
             else:
-                pygame.draw.rect(self.screen, color, (50, y_pos - 20, 380, 55), 2, border_radius=10)
-                text_color = color
-                font_size = 32
+                pygame.draw.rect(surf, color, (50, y_pos - 20, 380, 55), 2, border_radius=10)
+                txt = text_cache.render(text, color, 32, bold=True)
+                surf.blit(txt, txt.get_rect(center=(center_x, y_pos + text_dy)))
             
-            txt_font = pygame.font.SysFont("arial", font_size, bold=True)
-            txt = txt_font.render(text, True, text_color)
-            self.screen.blit(txt, txt.get_rect(center=(config.SCREEN_W // 2, y_pos)))
+            if self.state == "difficulty":
+                desc = text_cache.render(DIFFICULTY_DESCRIPTIONS[self.difficulties[i]], (180, 180, 200), 18)
+                surf.blit(desc, desc.get_rect(center=(center_x, y_pos + 18)))
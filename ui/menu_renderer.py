@@ -0,0 +1,47 @@
+from collections import OrderedDict
+import pygame
+import config
+from .text import fonts
+
+class MenuRenderer:
+    """Кэш кадров меню: запечённые кадры пульсирующих заголовков и статические панели состояний"""
+
+    def __init__(self, max_panels=config.MENU_PANEL_CACHE):
+        self.max_panels = max_panels
+        self._titles = {}
+        self._panels = OrderedDict()
+        self.title_bakes = 0
+        self.panel_builds = 0
+
+    def title(self, text, color, size, shadow=(20, 20, 50)):
+        """Кадр заголовка: пара (тень, текст) одного размера.
+
+        Тень и текст не сводятся в одну поверхность: наложение двух поверхностей с
+        альфой друг на друга даёт на краях букв другие пиксели, чем два blit на экран.
+        """
+        key = (text, color, size)
+        frame = self._titles.get(key)
+        if frame is None:
+            font = fonts.get(size, bold=True)
+            frame = self._titles[key] = (font.render(text, True, shadow), font.render(text, True, color))
+            self.title_bakes += 1
+        return frame
+
+    def bake_titles(self, text, color, sizes):
+        """Заранее запекает все кадры пульсации заголовка"""
+        for size in sizes:
+            self.title(text, color, size)
+
+    def panel(self, key, build):
+        """Статический слой состояния меню (рамки, подписи, линии) на прозрачной поверхности"""
+        surf = self._panels.get(key)
+        if surf is not None:
+            self._panels.move_to_end(key)
+            return surf
+        surf = pygame.Surface((config.SCREEN_W, config.SCREEN_H), pygame.SRCALPHA)
+        build(surf)
+        self._panels[key] = surf
+        self.panel_builds += 1
+        while len(self._panels) > self.max_panels:
+            self._panels.popitem(last=False)
+        return surf
@@ -1,3 +1,5 @@
+import config
+
 class Settings:
     DIFFICULTIES = {
         "Easy": {
@@ -33,12 +35,14 @@ class Settings:
             "multiplier": 2.5,
         },
     }
+    QUALITIES = ["Auto", *config.QUALITY_TIERS]
     
     def __init__(self):
         self.difficulty = "Normal"
         self.sfx_enabled = True
         self.fullscreen = False
         self.show_fps = True
+        self.quality = "Auto"
 
     def get_difficulty_config(self):
         return self.DIFFICULTIES[self.difficulty].copy()
@@ -49,4 +53,5 @@ class Settings:
             "sfx_enabled": self.sfx_enabled,
             "fullscreen": self.fullscreen,
             "show_fps": self.show_fps,
+            "quality": self.quality,
         }
@@ -0,0 +1,131 @@
+import json
+import os
+from collections import OrderedDict
+import pygame
+from pygame.sysfont import font_constructor
+import config
+
+class FontRegistry:
+    """Создаёт каждый шрифт (face, size, bold) один раз.
+
+    Поиск системного шрифта (SysFont, первый вызов которого опрашивает fc-list или
+    реестр) делается один раз на (face, bold); найденный путь и признак искусственного
+    жирного сохраняются в cache_path и на следующих запусках берутся оттуда.
+    """
+
+    def __init__(self, cache_path=config.FONT_CACHE_PATH):
+        self.cache_path = cache_path
+        self._fonts = {}
+        self._paths = self._load_paths()
+        self._paths_dirty = False
+        self.hits = 0
+        self.misses = 0
+        self.lookups = 0
+
+    def _load_paths(self):
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return {}
+        try:
+            with open(self.cache_path) as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        # Пропавший с диска файл шрифта ищется заново
+        return {key: tuple(value) for key, value in entries.items() if value[0] is None or os.path.exists(value[0])}
+
+    def save_paths(self):
+        if not self.cache_path or not self._paths_dirty:
+            return
+        try:
+            with open(self.cache_path, "w") as f:
+                json.dump(self._paths, f, indent=1, sort_keys=True)
+            self._paths_dirty = False
+        except OSError:
+            pass
+
+    def resolve(self, face, bold=False):
+        """(путь к файлу шрифта или None, дорисовывать ли жирный) - как выбрал бы SysFont"""
+        key = f"{face}|{int(bold)}"
+        entry = self._paths.get(key)
+        if entry is None:
+            # SysFont с подменённым конструктором только возвращает свой выбор
+            path, set_bold = pygame.font.SysFont(face, 0, bold=bold,
+                                                 constructor=lambda path, size, set_bold, set_italic: (path, set_bold))
+            entry = self._paths[key] = (path, set_bold)
+            self._paths_dirty = True
+            self.lookups += 1
+            self.save_paths()
+        return entry
+
+    def get(self, size, bold=False, face=config.FONT_FACE):
+        key = (face, size, bold)
+        font = self._fonts.get(key)
+        if font is None:
+            path, set_bold = self.resolve(face, bold)
+            font = self._fonts[key] = font_constructor(path, size, set_bold, False)
+            self.misses += 1
+        else:
+            self.hits += 1
+        return font
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "fonts": len(self._fonts),
+            "lookups": self.lookups,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+class TextCache:
+    """LRU-кэш отрисованных надписей по (шрифт, строка, цвет) с ограничением по памяти"""
+
+    def __init__(self, fonts, max_bytes=config.TEXT_CACHE_BYTES):
+        self.fonts = fonts
+        self.max_bytes = max_bytes
+        self._surfaces = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, text, color, size, bold=False, face=config.FONT_FACE, antialias=True):
+        key = (face, size, bold, text, tuple(color), antialias)
+        surf = self._surfaces.get(key)
+        if surf is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surf
+
+        self.misses += 1
+        surf = self.fonts.get(size, bold, face).render(text, antialias, color)
+        self._surfaces[key] = surf
+        self.bytes += self._size_of(surf)
+        while self.bytes > self.max_bytes and len(self._surfaces) > 1:
+            _, old = self._surfaces.popitem(last=False)
+            self.bytes -= self._size_of(old)
+            self.evictions += 1
+        return surf
+
+    @staticmethod
+    def _size_of(surf):
+        return surf.get_bytesize() * surf.get_width() * surf.get_height()
+
+    def clear(self):
+        self._surfaces.clear()
+        self.bytes = 0
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._surfaces),
+            "bytes": self.bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "evictions": self.evictions,
+        }
+
+fonts = FontRegistry()
+text_cache = TextCache(fonts)